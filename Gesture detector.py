@@ -106,8 +106,8 @@ class GestureDetector:
         annotated_frame = frame.copy()
         current_frame_gesture = GestureType.IDLE
 
-        if results.landmarks:
-            landmarks = results.landmarks
+        if results.pose_landmarks:
+            landmarks = results.pose_landmarks.landmark
 
             # Detect gestures
             if self.detect_jump(landmarks):
@@ -124,8 +124,8 @@ class GestureDetector:
             # Draw pose landmarks on frame
             self.mp_drawing.draw_landmarks(
                 annotated_frame,
-                results.landmarks,
-                self.mp_pose.CONNECTIONS,
+                results.pose_landmarks,
+                self.mp_pose.POSE_CONNECTIONS,
                 self.mp_drawing.DrawingSpec(color=(200, 180, 255), thickness=2, circle_radius=2),
                 self.mp_drawing.DrawingSpec(color=(200, 180, 255), thickness=2)
             )
@@ -0,0 +1,170 @@
+"""
+Autopilot — drives Dino.jump() / set_duck() from the obstacle state.
+
+The jump is modelled by reachability.ARC (GRAVITY and JUMP_VEL with the
+same discrete integration as Dino.update), and every upcoming obstacle is projected forward
+at the current speed.  Each frame the bot checks the run and duck plans
+against that; when only a jump helps, it times the jump from the course's
+own plan — ObstacleSchedule laid every obstacle out against the REACH
+windows, and the bot replays that layout over the next LOOKAHEAD
+obstacles (jump_lo / jump_hi / land per speed bucket) and takes off on the
+frame the plan says.  With no latency it runs the seeded courses without
+dying, past SPEED_MAX (checked to 60000 frames); latency leaves it a frame
+or more off plan on the tight stretches.
+
+    python autopilot.py --episodes 20 --latency 0 4 8
+"""
+import math
+from collections import deque
+
+from config import GROUND_Y
+from dino import Dino
+from obstacles import REACH
+from reachability import ARC as JUMP_ARC, MARGIN as REACH_MARGIN
+
+
+class Autopilot:
+    HORIZON   = 72      # frames of lookahead for the run / duck plans
+    MARGIN    = 3       # px of safety around obstacle boxes
+    DUCK_LEAD = 18      # start ducking this many frames before a hit
+    LOOKAHEAD = 4       # obstacles considered per decision
+    SLACK     = 1.0     # px; the course packs obstacles exactly onto the plan
+
+    ARC = JUMP_ARC
+
+    def __init__(self, latency=0):
+        self.latency = latency      # frames between decision and action
+        self.reset()
+
+    def reset(self):
+        self._queue = deque([(False, False)] * self.latency)
+
+    # ── public ───────────────────────────────────────────────
+    def act(self, dino, obstacles, speed):
+        """Return (jump, duck) for this frame."""
+        decision = self._decide(dino, obstacles, speed)
+        if not self.latency:
+            return decision
+        self._queue.append(decision)
+        return self._queue.popleft()
+
+    # ── prediction ───────────────────────────────────────────
+    def _boxes(self, obstacles):
+        m = self.MARGIN
+        return [(l - m, r + m, t - m, b + m)
+                for l, r, t, b in obstacles.boxes(self.LOOKAHEAD)]
+
+    def _first_hit(self, dino, boxes, speed, jump_at=None, duck=False):
+        """
+        (frame, box index) of the first predicted collision, or None.
+        jump_at=None keeps running (or ducking) for the whole horizon;
+        jump_at=d waits d frames, jumps, then runs on after landing.
+        """
+        arc   = self.ARC
+        left  = dino.x + 6
+        for k in range(1, self.HORIZON + 1):
+            lift = 0.0
+            if jump_at is not None and k > jump_at and k - jump_at - 1 < len(arc):
+                lift = arc[k - jump_at - 1]
+            if duck and lift == 0.0:
+                w, h = Dino.DUCK_W, Dino.DUCK_H
+            else:
+                w, h = Dino.STAND_W, Dino.STAND_H
+            right  = left + w - 12
+            top    = GROUND_Y - lift - h + 6
+            bottom = top + h - 12
+            shift  = k * speed
+            for i, (bl, br, bt, bb) in enumerate(boxes):
+                if (left < br - shift and right > bl - shift and
+                        top < bb and bottom > bt):
+                    return k, i
+        return None
+
+    def _decide(self, dino, obstacles, speed):
+        if dino.jumping or dino.dead:
+            return False, False
+
+        boxes = self._boxes(obstacles)
+        hit   = self._first_hit(dino, boxes, speed)
+        if hit is None:
+            return False, False
+        k, threat = hit
+
+        # duck if that gets under the threat (low bird)
+        duck_hit = self._first_hit(dino, boxes, speed, duck=True)
+        if duck_hit is None or duck_hit[1] > threat:
+            return False, k <= self.DUCK_LEAD
+
+        # otherwise jump when the course's own plan says so; off-plan
+        # (late already), jump once nothing better is left
+        take_off = self._take_off(dino, obstacles, speed)
+        if take_off is not None:
+            return take_off <= self.latency * speed, False
+        if self._first_hit(dino, boxes[:threat + 1], speed, jump_at=0) is None:
+            return True, False
+        return k <= len(self.ARC) // 2, False
+
+    def _take_off(self, dino, obstacles, speed):
+        """
+        Px until the next jump should start, or None if no plan fits.
+        Replays ObstacleSchedule._generate over the upcoming obstacles with
+        the dino free to jump now, so it takes the jumps the course was laid
+        out for (one jump often clears two cacti, and jumping at the first
+        one's earliest frame can land too late for the third).
+        """
+        right    = dino.x + REACH_MARGIN + Dino.STAND_W - 2 * REACH_MARGIN
+        jump     = None             # (lo, hi) start window of the open jump
+        first    = None             # take-off of the first jump
+        jumps    = 0
+        free_air = 0.0              # earliest next jump start
+        free_gnd = -math.inf        # dino back on the ground
+        for c, sid, v in obstacles.layout(self.LOOKAHEAD):
+            c, b = c - right, REACH.bucket(v)   # px to contact
+            if REACH.clear[sid] is None:                 # run under / duck
+                if c + REACH.ground_from[b, sid] + self.SLACK < free_gnd:
+                    return None
+                free_air = max(free_air, c + REACH.ground_end[b, sid])
+                jump     = None
+                continue
+            lo, hi = REACH.jump_lo[b, sid], REACH.jump_hi[b, sid]
+            if jump and jump[0] - hi <= c <= jump[1] - lo:
+                take_off = max(jump[0], c + lo)
+                jump     = (take_off, min(jump[1], c + hi))
+            else:
+                take_off = max(c + lo, free_air)
+                if take_off > c + hi + self.SLACK:
+                    return None
+                jump   = (take_off, c + hi)
+                jumps += 1
+            if jumps == 1:
+                first = take_off
+            free_air = free_gnd = take_off + REACH.land[b]
+        return first
+
+
+# ─────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+    from simulation import Simulation
+
+    ap = argparse.ArgumentParser(description="Headless autopilot runs")
+    ap.add_argument("--episodes",   type=int, default=10)
+    ap.add_argument("--max-frames", type=int, default=20000)
+    ap.add_argument("--latency",    type=int, nargs="+", default=[0],
+                    help="decision-to-action delay(s) in frames")
+    ap.add_argument("--seed",       type=int, default=0)
+    args = ap.parse_args()
+
+    sim = Simulation()
+    for latency in args.latency:
+        bot    = Autopilot(latency)
+        scores = []
+        for ep in range(args.episodes):
+            sim.reset(args.seed + ep)
+            bot.reset()
+            while not sim.game_over and sim.frame < args.max_frames:
+                sim.step(*bot.act(sim.dino, sim.obstacles, sim.speed))
+            scores.append(sim.score)
+        mean = sum(scores) / len(scores)
+        print(f"latency {latency:2d} frames  mean {mean:8.1f}  "
+              f"min {min(scores):8.1f}  max {max(scores):8.1f}")
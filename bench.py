@@ -0,0 +1,338 @@
+"""
+Benchmark harness — render stages, simulation and gesture classification,
+each measured separately on a seeded workload.
+
+    python bench.py --out bench.json
+    python bench.py --baseline bench.json          # exit 1 on regressions
+
+Rendering runs on SDL's offscreen "dummy" video driver with the autopilot
+playing, so every _draw stage sees obstacles, particles and both themes.
+Times are in microseconds; allocations come from a separate tracemalloc pass
+so they do not skew the timings.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pygame
+
+from autopilot import Autopilot
+from simulation import Simulation
+
+
+# ─────────────────────────────────────────────────────────────
+#  Stats helpers
+# ─────────────────────────────────────────────────────────────
+def summarize(samples_ns):
+    a = np.asarray(samples_ns, dtype=np.float64) / 1e3
+    return {
+        "n":    int(a.size),
+        "mean": round(float(a.mean()), 3),
+        "p50":  round(float(np.percentile(a, 50)), 3),
+        "p90":  round(float(np.percentile(a, 90)), 3),
+        "p99":  round(float(np.percentile(a, 99)), 3),
+        "max":  round(float(a.max()), 3),
+    }
+
+
+def measure_alloc(fn, n):
+    """Peak and net traced KiB over `n` calls of fn."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(n):
+        fn()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_kib": round((peak - before) / 1024, 2),
+            "net_kib":  round((after - before) / 1024, 2)}
+
+
+# ─────────────────────────────────────────────────────────────
+#  Render
+# ─────────────────────────────────────────────────────────────
+def bench_render(frames, seed):
+    from main import Game
+
+    random.seed(seed)
+    game = Game(autopilot=True, camera=False, stats=False, quality="full",
+                render_scale=1.0)
+    game.obstacles.reset(seed)
+
+    names   = [name for name, _ in game.draw_stages]
+    samples = {name: [] for name in names}
+    samples["flip"]  = []
+    samples["frame"] = []
+
+    def step():
+        game._handle_input()
+        game._update()
+
+    # warm up: get obstacles on screen, then half the run in each theme
+    for _ in range(120):
+        step()
+    for f in range(frames):
+        if f == frames // 2:
+            game._toggle_theme()
+        step()
+        t_frame = time.perf_counter_ns()
+        for name, stage in game.draw_stages:
+            t0 = time.perf_counter_ns()
+            stage()
+            samples[name].append(time.perf_counter_ns() - t0)
+        t0 = time.perf_counter_ns()
+        pygame.display.flip()
+        t1 = time.perf_counter_ns()
+        samples["flip"].append(t1 - t0)
+        samples["frame"].append(t1 - t_frame)
+
+    allocs = {name: measure_alloc(stage, 60) for name, stage in game.draw_stages}
+    pygame.quit()
+    return {name: {**summarize(s), "alloc": allocs.get(name)}
+            for name, s in samples.items()}
+
+
+# ─────────────────────────────────────────────────────────────
+#  Simulation
+# ─────────────────────────────────────────────────────────────
+def bench_sim(steps, seed):
+    out = {}
+
+    sim = Simulation(seed)
+    rng = random.Random(seed)
+    t0  = time.perf_counter_ns()
+    for _ in range(steps):
+        if sim.game_over:
+            sim.reset()
+        sim.step(rng.random() < 0.05, rng.random() < 0.1)
+    dt = time.perf_counter_ns() - t0
+    out["random_policy"] = {"steps_per_s": round(steps / (dt / 1e9)),
+                            "us_per_step": round(dt / steps / 1e3, 3)}
+
+    sim.reset(seed)
+    bot = Autopilot()
+    t0  = time.perf_counter_ns()
+    for _ in range(steps):
+        if sim.game_over:
+            sim.reset()
+        sim.step(*bot.act(sim.dino, sim.obstacles, sim.speed))
+    dt = time.perf_counter_ns() - t0
+    out["autopilot"] = {"steps_per_s": round(steps / (dt / 1e9)),
+                        "us_per_step": round(dt / steps / 1e3, 3)}
+
+    sim.reset(seed)
+
+    def one():
+        if sim.game_over:
+            sim.reset()
+        sim.step(*bot.act(sim.dino, sim.obstacles, sim.speed))
+    out["autopilot"]["alloc"] = measure_alloc(one, 2000)
+    return out
+
+
+# ─────────────────────────────────────────────────────────────
+#  Gesture classification
+# ─────────────────────────────────────────────────────────────
+def reference_poses():
+    """L-shape, fist, pinch and open hand in MediaPipe's normalized image
+    coordinates, shape (4, 21, 3)."""
+    base = np.zeros((21, 3))
+    base[0]  = (0.50, 0.80, 0)                       # wrist
+    for f, x in zip(range(5), (0.38, 0.45, 0.50, 0.55, 0.60)):
+        for j in range(4):
+            base[1 + f * 4 + j] = (x, 0.70 - 0.08 * (j + 1), 0)
+    poses = []
+    lshape = base.copy()
+    lshape[1:5, 0]  = (0.40, 0.44, 0.50, 0.56)      # thumb out
+    lshape[1:5, 1]  = 0.66
+    lshape[9:21, 1] = 0.66 + np.tile([0.0, 0.02, 0.04, 0.06], 3)
+    poses.append(lshape)
+    fist = base.copy()
+    fist[5:21, 1] = 0.66 + np.tile([0.0, 0.02, 0.04, 0.06], 4)
+    poses.append(fist)
+    pinch = base.copy()
+    pinch[4] = pinch[8] + (0.02, 0.01, 0)
+    poses.append(pinch)
+    poses.append(base)
+    return np.stack(poses)
+
+
+def synthetic_landmarks(n, seed):
+    """Seeded stand-in for a recording: jittered reference poses (n, 21, 3)."""
+    rng   = np.random.default_rng(seed)
+    poses = reference_poses()
+    idx   = rng.integers(0, len(poses), n)
+    return poses[idx] + rng.normal(0, 0.01, (n, 21, 3))
+
+
+def synthetic_sequence(n, seed, jitter=0.004):
+    """
+    A continuous 30 Hz stream: hold a pose for 10-40 frames, then morph
+    into another over 3-8 frames, with per-frame jitter.  (n, 21, 3).
+    """
+    rng   = np.random.default_rng(seed)
+    poses = reference_poses()
+    out   = np.empty((n, 21, 3))
+    cur   = rng.integers(len(poses))
+    i     = 0
+    while i < n:
+        hold = rng.integers(10, 41)
+        out[i:i + hold] = poses[cur]
+        i  += hold
+        nxt = (cur + rng.integers(1, len(poses))) % len(poses)
+        k   = rng.integers(3, 9)
+        for j in range(k):
+            if i + j < n:
+                out[i + j] = poses[cur] + (poses[nxt] - poses[cur]) * (j + 1) / k
+        i  += k
+        cur = nxt
+    return out + rng.normal(0, jitter, out.shape)
+
+
+def bench_classify(n, seed, path=None):
+    from gesture_backends import HandBackend
+
+    arr   = np.load(path) if path else synthetic_landmarks(n, seed)
+    hands = list(arr)
+    gc    = HandBackend()     # classification needs no camera or model
+
+    counts = {}
+    t0 = time.perf_counter_ns()
+    for lm in hands:
+        g = gc.classify(lm)
+        counts[g] = counts.get(g, 0) + 1
+    dt = time.perf_counter_ns() - t0
+
+    it = iter(hands * 2)
+    return {"hands":         len(hands),
+            "source":        path or "synthetic",
+            "calls_per_s":   round(len(hands) / (dt / 1e9)),
+            "us_per_call":   round(dt / len(hands) / 1e3, 3),
+            "gestures":      counts,
+            "alloc":         measure_alloc(lambda: gc.classify(next(it)),
+                                           min(len(hands), 2000))}
+
+
+def bench_predict(n, seed, fps=30.0):
+    """
+    Predictive jump on a synthetic pose stream: how many frames earlier
+    than the classifier it fires, and how often it has to roll back.
+    """
+    from gesture_backends import HandBackend, JumpPredictor
+
+    seq  = synthetic_sequence(n, seed)
+    gc   = HandBackend()
+    pred = JumpPredictor()
+
+    classified = [gc.classify(lm) for lm in seq]
+    t0 = time.perf_counter_ns()
+    for i, lm in enumerate(seq):
+        pred.update(i / fps, lm, classified[i])
+    dt = time.perf_counter_ns() - t0
+
+    jumps = sum(1 for a, b in zip(["none"] + classified, classified)
+                if b == "jump" and a != "jump")
+    s = pred.stats()
+    return {"frames":       n,
+            "jumps":        jumps,
+            "fired":        s["pred_fired"],
+            "confirmed":    s["pred_hit"],
+            "rolled_back":  s["pred_rollbk"],
+            "lead_frames":  round(s["pred_lead"] / 1000.0 * fps, 2),
+            "us_per_frame": round(dt / n / 1e3, 3)}
+
+
+# ─────────────────────────────────────────────────────────────
+#  Regression check
+# ─────────────────────────────────────────────────────────────
+def compare(result, baseline, tolerance):
+    """List render stages / throughputs that got worse than `tolerance`."""
+    worse = []
+    for name, cur in result["render"].items():
+        old = baseline.get("render", {}).get(name)
+        if old and old["mean"] > 0 and cur["mean"] > old["mean"] * (1 + tolerance):
+            worse.append(f"render.{name}: {old['mean']:.1f} -> {cur['mean']:.1f} us")
+    for name, cur in result["sim"].items():
+        old = baseline.get("sim", {}).get(name)
+        if old and cur["steps_per_s"] < old["steps_per_s"] * (1 - tolerance):
+            worse.append(f"sim.{name}: {old['steps_per_s']} -> {cur['steps_per_s']} steps/s")
+    old = baseline.get("classify")
+    cur = result.get("classify")
+    if old and cur and cur["calls_per_s"] < old["calls_per_s"] * (1 - tolerance):
+        worse.append(f"classify: {old['calls_per_s']} -> {cur['calls_per_s']} calls/s")
+    return worse
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))
+                              ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+# ─────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Gesture Dino benchmarks")
+    ap.add_argument("--seed",      type=int, default=0)
+    ap.add_argument("--frames",    type=int, default=600,
+                    help="rendered frames")
+    ap.add_argument("--sim-steps", type=int, default=50000)
+    ap.add_argument("--hands",     type=int, default=20000,
+                    help="synthetic landmark sets for classify")
+    ap.add_argument("--landmarks", help="recorded landmarks .npy (N, 21, 3)")
+    ap.add_argument("--only",      nargs="+",
+                    choices=("render", "sim", "classify", "predict"))
+    ap.add_argument("--out",       help="write JSON here instead of stdout")
+    ap.add_argument("--baseline",  help="JSON from an earlier run to compare")
+    ap.add_argument("--tolerance", type=float, default=0.15)
+    args = ap.parse_args()
+
+    only   = set(args.only or ("render", "sim", "classify", "predict"))
+    result = {
+        "meta": {
+            "commit":   git_commit(),
+            "python":   platform.python_version(),
+            "pygame":   pygame.version.ver,
+            "numpy":    np.__version__,
+            "platform": platform.platform(),
+            "seed":     args.seed,
+            "units":    "us",
+        },
+    }
+    if "render" in only:
+        result["render"] = bench_render(args.frames, args.seed)
+    if "sim" in only:
+        result["sim"] = bench_sim(args.sim_steps, args.seed)
+    if "classify" in only:
+        result["classify"] = bench_classify(args.hands, args.seed, args.landmarks)
+    if "predict" in only:
+        result["predict"] = bench_predict(args.hands, args.seed)
+
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        result.setdefault("render", {})
+        result.setdefault("sim", {})
+        worse = compare(result, baseline, args.tolerance)
+        for line in worse:
+            print("REGRESSION", line, file=sys.stderr)
+        sys.exit(1 if worse else 0)
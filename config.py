@@ -13,6 +13,17 @@ JUMP_VEL    = -20
 SPEED_START = 8.0
 SPEED_MAX   = 22.0
 SPEED_INC   = 0.004
+SCORE_INC   = 0.14           # score gained per frame
+
+STATS_DB    = "dino_stats.sqlite3"   # persistent scores / run history
+GHOST_FILE  = "dino_ghost.bin"       # best run replayed by --ghost
+GESTURE_BACKEND = "hands"           # "hands" | "pose"
+GESTURE_SERVICE = "127.0.0.1:47800" # gesture_service.py: host:port or socket path
+LANDMARK_FILTER = "one_euro"        # "one_euro" | "kalman" | "none"
+QUALITY     = "auto"                 # "auto" | "full" | "medium" | "low" | "minimal"
+DAY_NIGHT   = 0                      # s per day/night cycle; 0: theme button only
+RENDER_SCALE = 1.0                   # scene resolution vs the window (0.25..1)
+SHOW_CAMERA = True                   # camera picture-in-picture (C toggles)
 
 CAM_W = 210
 CAM_H = 158
@@ -43,6 +54,7 @@ THEMES = {
         "cactus_dark":  ( 30, 100,  60),
         "bird":         ( 80,  80, 180),
         "bird_wing":    (100, 100, 200),
+        "bird_eye":     (255, 255, 255),
         "score_text":   ( 55,  55,  55),
         "hi_text":      (180,  60,  60),
         "btn_bg":       ( 55,  55,  55),
@@ -72,6 +84,7 @@ THEMES = {
         "cactus_dark":  ( 30, 110,  60),
         "bird":         (140, 140, 255),
         "bird_wing":    (160, 160, 255),
+        "bird_eye":     (255, 255, 255),
         "score_text":   (200, 220, 255),
         "hi_text":      (255, 140, 140),
         "btn_bg":       (200, 220, 255),
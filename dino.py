@@ -1,15 +1,22 @@
 """
 Dino sprite — drawn with pygame primitives, pixel-art style.
-Matches the real Chrome Dino proportions.
+Matches the real Chrome Dino proportions.  Each pose is rendered once into a
+palette sprite (see palette.py) and blitted from then on.
 """
 import pygame
 from config import GROUND_Y, GRAVITY, JUMP_VEL
+from palette import PALETTE, INDEX
 
 
 class Dino:
     # ── pixel sizes ──────────────────────────────────────────
     STAND_W, STAND_H = 44, 58
     DUCK_W,  DUCK_H  = 62, 32
+    SPRITE_W, SPRITE_H = 80, 64
+    PAD_X, PAD_Y       = 14, 62     # feet inside a sprite
+    PHASE_JUMP         = 2          # pose phase: 0/1 running legs, 2 jumping
+
+    _sprites = {}                   # (ducking, phase, blink) -> surface
 
     def __init__(self):
         self._step = 0
@@ -70,16 +77,46 @@ class Dino:
             self.vel_y  = 0.0
             self.jumping = False
 
+    # ── sprites ──────────────────────────────────────────────
+    def pose(self):
+        phase = (self._step // 7) % 2
+        if self.jumping and not self.ducking:
+            phase = self.PHASE_JUMP
+        return self.ducking, phase, self._blink > 82
+
+    @classmethod
+    def bake(cls, ducking, phase, blink=False):
+        """A new palette sprite of one pose, feet at (PAD_X, PAD_Y)."""
+        d = cls()
+        d.x, d.y   = cls.PAD_X, cls.PAD_Y
+        d.ducking  = ducking
+        d.jumping  = phase == cls.PHASE_JUMP
+        d._step    = 7 * (phase == 1)
+        d._blink   = 89 if blink else 0
+        return PALETTE.bake(lambda s: d.render(s, INDEX),
+                            (0, 0, cls.SPRITE_W, cls.SPRITE_H))
+
     # ── master draw dispatcher ───────────────────────────────
-    def draw(self, screen, t):
+    def draw(self, screen, t, k=1):
+        """k: render scale of `screen` relative to the window."""
+        key    = self.pose()
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self.bake(*key)
+        screen.blit(PALETTE.scaled(sprite, k),
+                    (int((int(self.x) - self.PAD_X) * k),
+                     int((int(self.y) - self.PAD_Y) * k)))
+
+        if self.dead:
+            self._draw_dead_x(screen, t, k)
+
+    def render(self, screen, t):
+        """Draw the current pose with primitives."""
         if self.ducking:
             self._draw_duck(screen, t)
         else:
             self._draw_stand(screen, t)
 
-        if self.dead:
-            self._draw_dead_x(screen, t)
-
     # ── STAND / RUN / JUMP ───────────────────────────────────
     def _draw_stand(self, screen, t):
         c       = t["dino"]
@@ -187,13 +224,14 @@ class Dino:
             R(26, -8, 10, 8, 3)
 
     # ── DEAD X eyes ──────────────────────────────────────────
-    def _draw_dead_x(self, screen, t):
+    def _draw_dead_x(self, screen, t, k=1):
         c = t["dino"]
         x = self.x
         fy = self.y
-        ex, ey = x + 36, fy - 53
-        size = 6
+        ex, ey = (x + 36) * k, (fy - 53) * k
+        size = 6 * k
+        w    = max(1, round(4 * k))
         pygame.draw.line(screen, (220, 60, 60),
-                         (ex-size, ey-size), (ex+size, ey+size), 4)
+                         (ex-size, ey-size), (ex+size, ey+size), w)
         pygame.draw.line(screen, (220, 60, 60),
-                         (ex+size, ey-size), (ex-size, ey+size), 4)
\ No newline at end of file
+                         (ex+size, ey-size), (ex-size, ey+size), w)
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Gym-style environment around the headless Simulation.
+
+    env = DinoEnv(seed=0)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(JUMP)
+
+Actions match GestureController's three gestures: RUN, JUMP, DUCK.
+Observations are float32 arrays:
+
+    [0:5]   dino height above ground, vel_y, jumping, ducking, speed
+    [5:]    next K obstacles × (rel_x, width, height, elevation, kind)
+
+rel_x is measured from the dino's x; empty slots are (WIDTH, 0, 0, 0, -1).
+Nothing here opens a pygame display, so it runs on a headless CPU box.
+VectorDinoEnv steps many instances in one call and auto-resets them.
+"""
+import numpy as np
+
+from config import GROUND_Y, WIDTH
+from simulation import Simulation
+
+ACTIONS         = ("run", "jump", "duck")
+RUN, JUMP, DUCK = range(3)
+
+DINO_FEATURES   = 5
+OBST_FEATURES   = 5
+
+
+def obs_size(k):
+    return DINO_FEATURES + k * OBST_FEATURES
+
+
+def write_obs(sim, out, k):
+    """Fill `out` (1-D float32, obs_size(k)) from the simulation state."""
+    d = sim.dino
+    out[0] = GROUND_Y - d.y
+    out[1] = d.vel_y
+    out[2] = d.jumping
+    out[3] = d.ducking
+    out[4] = sim.speed
+
+    obs  = sim.obstacles
+    a, b = obs.window(k)
+    m    = b - a
+    rows = out[DINO_FEATURES:].reshape(k, OBST_FEATURES)
+    rows[:m, 0] = obs.x[a:b] - d.x
+    rows[:m, 1] = obs.w[a:b]
+    rows[:m, 2] = obs.h[a:b]
+    rows[:m, 3] = GROUND_Y - (obs.y[a:b] + obs.h[a:b])
+    rows[:m, 4] = obs.kind[a:b]
+    rows[m:]    = (WIDTH, 0, 0, 0, -1)
+    return out
+
+
+def apply_action(sim, action):
+    sim.step(jump=action == JUMP, duck=action == DUCK)
+
+
+# ─────────────────────────────────────────────────────────────
+#  SINGLE ENV
+# ─────────────────────────────────────────────────────────────
+class DinoEnv:
+    """
+    reward     +1 per frame survived
+    terminated on collision
+    truncated  after `max_steps` agent steps
+    """
+    n_actions = len(ACTIONS)
+
+    def __init__(self, k=3, frame_skip=1, max_steps=20000, seed=None):
+        self.k          = k
+        self.frame_skip = frame_skip
+        self.max_steps  = max_steps
+        self.obs_shape  = (obs_size(k),)
+        self.sim        = Simulation(seed)
+        self._obs       = np.zeros(self.obs_shape, dtype=np.float32)
+        self._steps     = 0
+
+    def reset(self, seed=None):
+        self.sim.reset(seed)
+        self._steps = 0
+        return self._observe(), {"score": 0.0}
+
+    def step(self, action):
+        sim    = self.sim
+        reward = 0.0
+        for _ in range(self.frame_skip):
+            apply_action(sim, action)
+            if sim.game_over:
+                break
+            reward += 1.0
+        self._steps += 1
+        terminated = sim.game_over
+        truncated  = not terminated and self._steps >= self.max_steps
+        return (self._observe(), reward, terminated, truncated,
+                {"score": sim.score})
+
+    def _observe(self):
+        return write_obs(self.sim, self._obs, self.k).copy()
+
+
+# ─────────────────────────────────────────────────────────────
+#  VECTOR ENV
+# ─────────────────────────────────────────────────────────────
+class VectorDinoEnv:
+    """
+    `n` independent simulations stepped together.  step() takes an int array
+    of n actions and returns stacked (obs, reward, terminated, truncated,
+    info).  Finished instances are reset in place; the returned obs row is
+    then the first observation of the new run and info["final_score"] holds
+    the score of the run that just ended (NaN elsewhere).
+    """
+    n_actions = len(ACTIONS)
+
+    def __init__(self, n, k=3, frame_skip=1, max_steps=20000, seed=None):
+        self.n          = n
+        self.k          = k
+        self.frame_skip = frame_skip
+        self.max_steps  = max_steps
+        self.obs_shape  = (n, obs_size(k))
+        base            = 0 if seed is None else seed
+        self.sims       = [Simulation(None if seed is None else base + i)
+                           for i in range(n)]
+        self._obs       = np.zeros(self.obs_shape, dtype=np.float32)
+        self._reward    = np.zeros(n, dtype=np.float32)
+        self._term      = np.zeros(n, dtype=bool)
+        self._trunc     = np.zeros(n, dtype=bool)
+        self._final     = np.full(n, np.nan, dtype=np.float32)
+        self._steps     = np.zeros(n, dtype=np.int64)
+
+    def reset(self, seed=None):
+        for i, sim in enumerate(self.sims):
+            sim.reset(None if seed is None else seed + i)
+            write_obs(sim, self._obs[i], self.k)
+        self._steps[:] = 0
+        return self._obs.copy(), {}
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        self._final[:] = np.nan
+        for i, sim in enumerate(self.sims):
+            a = int(actions[i])
+            r = 0.0
+            for _ in range(self.frame_skip):
+                apply_action(sim, a)
+                if sim.game_over:
+                    break
+                r += 1.0
+            self._steps[i] += 1
+            term  = sim.game_over
+            trunc = not term and self._steps[i] >= self.max_steps
+            self._reward[i] = r
+            self._term[i]   = term
+            self._trunc[i]  = trunc
+            if term or trunc:
+                self._final[i] = sim.score
+                sim.reset()
+                self._steps[i] = 0
+            write_obs(sim, self._obs[i], self.k)
+        return (self._obs.copy(), self._reward.copy(), self._term.copy(),
+                self._trunc.copy(), {"final_score": self._final.copy()})
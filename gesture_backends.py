@@ -0,0 +1,357 @@
+"""
+Gesture backends — a landmark model plus the rules that turn its landmarks
+into "jump" / "duck" / "run" / "none".
+
+hands  (MediaPipe Hands, one hand)
+    L-shape  (thumb out + index up, rest curled) → JUMP
+    Fist     (all 5 fingers curled)               → DUCK
+    Pinch    (thumb tip near index tip)           → RUN (neutral)
+
+pose   (MediaPipe Pose, whole body)
+    Both wrists raised above the shoulders        → JUMP
+    Shoulders dropped below standing height       → DUCK
+
+GestureController owns everything else (capture thread, inference governor,
+smoothing, player tracking, instrumentation); a backend only loads its model,
+turns a frame into (N, 3) landmark arrays, classifies them and draws on the
+preview.
+Nothing here imports mediapipe until load() is called.
+"""
+import math
+
+import numpy as np
+
+FINGER_TIPS = slice(8, 21, 4)      # index, middle, ring, pinky: 8 12 16 20
+FINGER_PIPS = slice(6, 19, 4)      #                             6 10 14 18
+OTHER_TIPS  = slice(12, 21, 4)     # middle, ring, pinky
+OTHER_PIPS  = slice(10, 19, 4)
+UP_MARGIN   = 0.02      # tip this far above pip = extended
+PINCH_DIST  = 0.07
+
+COLOR_MAP = {           # RGB, drawn onto the preview buffer
+    "jump": (80,  200, 80),
+    "duck": (255, 80,  80),
+    "run":  (0,   180, 255),
+    "none": (180, 180, 180),
+}
+
+
+def landmarks_to_array(landmarks, out=None):
+    """MediaPipe landmark list -> (N, 3) float array of x, y, z."""
+    if out is None:
+        out = np.empty((len(landmarks), 3))
+    for i, p in enumerate(landmarks):
+        out[i] = p.x, p.y, p.z
+    return out
+
+
+# ─────────────────────────────────────────────────────────────
+#  BASE
+# ─────────────────────────────────────────────────────────────
+class GestureBackend:
+    NAME        = None
+    LABELS      = {}
+    SMOOTHING   = (1, 1)    # report a gesture seen in `need` of `window` frames
+    MAX_PLAYERS = 1
+
+    def __init__(self, players=1):
+        if players > self.MAX_PLAYERS:
+            raise ValueError(f"{self.NAME} backend supports "
+                             f"{self.MAX_PLAYERS} player(s), not {players}")
+        self.players = players
+
+    def load(self, complexity):
+        """Build the model (slow; called off the game thread)."""
+        raise NotImplementedError
+
+    def detect(self, model, rgb):
+        """[(landmark array, handedness or None)] found in one RGB frame."""
+        raise NotImplementedError
+
+    def classify(self, lm):
+        raise NotImplementedError
+
+    def annotate(self, frame, lm, gesture, player=None):
+        """Draw landmarks and the gesture label onto the RGB preview."""
+        import cv2
+
+        col   = COLOR_MAP[gesture]
+        label = self.LABELS.get(gesture, "...")
+        row   = 0
+        if player is not None:
+            label = f"P{player + 1} {label}"
+            row   = player
+        self._draw(frame, lm, col)
+        cv2.putText(frame, label,
+                    (6, 22 + 22 * row), cv2.FONT_HERSHEY_SIMPLEX,
+                    0.55, col, 2, cv2.LINE_AA)
+
+    def _draw(self, frame, lm, col):
+        pass
+
+    def make_predictor(self):
+        """Early-jump predictor for this backend, if it has one."""
+        return None
+
+
+# ─────────────────────────────────────────────────────────────
+#  HANDS
+# ─────────────────────────────────────────────────────────────
+class HandBackend(GestureBackend):
+    NAME   = "hands"
+    LABELS = {
+        "jump": "L-SHAPE -> JUMP",
+        "duck": "FIST    -> DUCK",
+        "run":  "PINCH   -> RUN",
+    }
+    MAX_PLAYERS = 2
+
+    def __init__(self, players=1):
+        super().__init__(players)
+        self._lm = np.empty((players, 21, 3))
+
+    def load(self, complexity):
+        import mediapipe as mp
+
+        # one inference finds every player's hand
+        return mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.players,
+            model_complexity=complexity,
+            min_detection_confidence=0.75,
+            min_tracking_confidence=0.6,
+        )
+
+    def detect(self, model, rgb):
+        res = model.process(rgb)
+        if not res.multi_hand_landmarks:
+            return []
+        return [(landmarks_to_array(hand.landmark, self._lm[i]),
+                 side.classification[0].label)
+                for i, (hand, side) in enumerate(zip(res.multi_hand_landmarks,
+                                                     res.multi_handedness))]
+
+    # ── low-level helpers (lm is a (21, 3) array) ────────────
+    # One vector op per test, then plain floats: numpy scalars are slow
+    # to index and compare one by one.
+    @staticmethod
+    def _dist(lm, a, b):
+        return math.hypot(*(lm[a, :2] - lm[b, :2]).tolist())
+
+    @staticmethod
+    def _fingers_up(lm):
+        """Index..pinky extended = tip above pip (lower y value)."""
+        y = lm[:, 1]
+        return (y[FINGER_PIPS] - y[FINGER_TIPS] > UP_MARGIN).tolist()
+
+    @staticmethod
+    def _thumb_up(lm):
+        """Thumb extended = tip left of ip (for right hand, mirrored feed)."""
+        return float(lm[4, 0] - lm[3, 0]) > UP_MARGIN
+
+    # ── gesture logic ────────────────────────────────────────
+    def classify(self, lm):
+        index, middle, ring, pinky = self._fingers_up(lm)
+        thumb  = self._thumb_up(lm)
+        pinch_dist = self._dist(lm, 4, 8)
+
+        # ── PINCH: thumb tip near index tip ──────────────────
+        if pinch_dist < PINCH_DIST:
+            return "run"
+
+        # ── FIST: all 4 fingers curled (thumb position free) ─
+        if not index and not middle and not ring and not pinky:
+            return "duck"
+
+        # ── L-SHAPE: thumb out + index up, rest curled ───────
+        if thumb and index and not middle and not ring and not pinky:
+            return "jump"
+
+        return "none"
+
+    def _draw(self, frame, lm, col):
+        import cv2
+
+        h, w = frame.shape[:2]
+        # Draw dots for key landmarks
+        for idx in (4, 8, 12, 16, 20, 0):
+            px = (int(lm[idx, 0] * w), int(lm[idx, 1] * h))
+            cv2.circle(frame, px, 7, col, -1)
+
+        # Thumb–index line
+        t = (int(lm[4, 0] * w), int(lm[4, 1] * h))
+        i = (int(lm[8, 0] * w), int(lm[8, 1] * h))
+        cv2.line(frame, t, i, col, 2)
+
+    def make_predictor(self):
+        return JumpPredictor()
+
+
+# ─────────────────────────────────────────────────────────────
+#  JUMP PREDICTOR
+# ─────────────────────────────────────────────────────────────
+class JumpPredictor:
+    """
+    Fires "jump" a few frames before the L-shape is fully formed.
+
+    Each hand frame adds four features: index extension (pip.y - tip.y),
+    thumb abduction (tip.x - ip.x), the extension of the most-raised other
+    finger, and the thumb-index distance.  A least-squares slope over the
+    last HISTORY frames extrapolates them LEAD seconds ahead.  If index and
+    thumb are rising and the extrapolated hand passes the classifier's
+    L-shape test (index and thumb with MARGIN to spare, others curled, no
+    pinch), the jump fires early.
+
+    A prediction the classifier confirms within CONFIRM seconds is a hit;
+    otherwise it is rolled back (the reported gesture falls back to the
+    classifier's) and counted as a false positive.
+    """
+    HISTORY = 4
+    LEAD    = 0.07      # s, about two inference frames at 30 Hz
+    MARGIN  = 1.5       # x UP_MARGIN the extrapolated features must reach
+    CONFIRM = 0.25      # s
+
+    def __init__(self):
+        self._t       = np.zeros(self.HISTORY)
+        self._f       = np.zeros((self.HISTORY, 4))
+        self._n       = 0
+        self._pending = None      # time of an unconfirmed prediction
+        self.fired       = 0
+        self.confirmed   = 0
+        self.rolled_back = 0
+        self._lead_sum   = 0.0
+
+    def reset(self):
+        self._n = 0
+        if self._pending is not None:
+            self._rollback()
+
+    def update(self, t, lm, gesture):
+        """Feed one classified hand frame; returns the gesture to report."""
+        i = self._n % self.HISTORY
+        f = self._f[i]
+        self._t[i] = t
+        f[0] = lm[6, 1] - lm[8, 1]
+        f[1] = lm[4, 0] - lm[3, 0]
+        f[2] = (lm[OTHER_PIPS, 1] - lm[OTHER_TIPS, 1]).max()
+        f[3] = np.hypot(lm[4, 0] - lm[8, 0], lm[4, 1] - lm[8, 1])
+        self._n += 1
+
+        if self._pending is not None:
+            if gesture == "jump":
+                self.confirmed += 1
+                self._lead_sum += t - self._pending
+                self._pending   = None
+            elif t - self._pending > self.CONFIRM:
+                self._rollback()
+            else:
+                return "jump"
+        elif gesture != "jump" and self._predict(t):
+            self.fired   += 1
+            self._pending = t
+            return "jump"
+        return gesture
+
+    def _predict(self, t):
+        if self._n < self.HISTORY:
+            return False
+        dt    = self._t - self._t.mean()
+        var   = (dt * dt).sum()
+        if var <= 0.0:
+            return False
+        slope = dt @ (self._f - self._f.mean(axis=0)) / var
+        i     = (self._n - 1) % self.HISTORY
+        ahead = self._f[i] + slope * (t - self._t[i] + self.LEAD)
+        return bool(slope[0] > 0 and slope[1] > 0 and
+                    ahead[0] > UP_MARGIN * self.MARGIN and
+                    ahead[1] > UP_MARGIN * self.MARGIN and
+                    ahead[2] < UP_MARGIN and
+                    ahead[3] > PINCH_DIST)
+
+    def _rollback(self):
+        self.rolled_back += 1
+        self._pending     = None
+
+    def stats(self):
+        return {
+            "pred_fired":  self.fired,
+            "pred_hit":    self.confirmed,
+            "pred_rollbk": self.rolled_back,
+            "pred_lead":   (1000.0 * self._lead_sum / self.confirmed
+                            if self.confirmed else 0.0),
+        }
+
+
+# ─────────────────────────────────────────────────────────────
+#  POSE
+# ─────────────────────────────────────────────────────────────
+class PoseBackend(GestureBackend):
+    """
+    Whole-body control: lighter on the hands, readable from across a room.
+    Pose landmarks jitter more than hand landmarks, so a gesture has to hold
+    for 3 of the last 5 frames.  Ducking is measured against a standing
+    shoulder height that adapts while the player is neither jumping nor
+    ducking, so it works at any distance from the camera.
+    """
+    NAME      = "pose"
+    LABELS    = {
+        "jump": "ARMS UP -> JUMP",
+        "duck": "CROUCH  -> DUCK",
+    }
+    SMOOTHING = (5, 3)
+
+    L_SHOULDER, R_SHOULDER = 11, 12
+    L_WRIST,    R_WRIST    = 15, 16
+    RAISE     = 0.10    # wrists this far above the shoulders = jump
+    DROP      = 0.12    # shoulders this far below standing height = duck
+    ADAPT     = 0.05    # EMA rate of the standing height
+
+    def __init__(self, players=1):
+        super().__init__(players)
+        self._lm    = np.empty((33, 3))
+        self._stand = None
+        self._edges = ()
+
+    def load(self, complexity):
+        import mediapipe as mp
+
+        self._edges = tuple(mp.solutions.pose.POSE_CONNECTIONS)
+        return mp.solutions.pose.Pose(
+            static_image_mode=False,
+            model_complexity=complexity,
+            smooth_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+
+    def detect(self, model, rgb):
+        res = model.process(rgb)
+        if not res.pose_landmarks:
+            return []
+        return [(landmarks_to_array(res.pose_landmarks.landmark, self._lm),
+                 None)]
+
+    def classify(self, lm):
+        y        = lm[:, 1].tolist()
+        shoulder = (y[self.L_SHOULDER] + y[self.R_SHOULDER]) / 2
+        wrist    = (y[self.L_WRIST]    + y[self.R_WRIST])    / 2
+
+        if wrist < shoulder - self.RAISE:
+            return "jump"
+        if self._stand is None:
+            self._stand = shoulder
+        if shoulder > self._stand + self.DROP:
+            return "duck"
+        self._stand += (shoulder - self._stand) * self.ADAPT
+        return "none"
+
+    def _draw(self, frame, lm, col):
+        import cv2
+
+        h, w = frame.shape[:2]
+        pts  = [(int(x * w), int(y * h)) for x, y in lm[:, :2].tolist()]
+        for a, b in self._edges:
+            cv2.line(frame, pts[a], pts[b], col, 2)
+
+
+BACKENDS = {b.NAME: b for b in (HandBackend, PoseBackend)}
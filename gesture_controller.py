@@ -1,127 +1,691 @@
 """
 Gesture Detection
 ─────────────────
-L-shape  (thumb out + index up, rest curled) → JUMP
-Fist     (all 5 fingers curled)               → DUCK
-Pinch    (thumb tip near index tip)           → RUN (neutral)
+Camera capture, inference scheduling, smoothing and instrumentation shared
+by every gesture backend (see gesture_backends.py for the hand and pose
+rules).  Pick one with GestureController(backend="hands" | "pose").
+
+cv2 and mediapipe are imported on first use, so importing this module is
+cheap; GestureLoader builds the controller off the main thread.
 """
-import cv2
-import mediapipe as mp
+import itertools
+import math
+import queue
+import threading
+import time
+from collections import Counter, deque
+
 import numpy as np
 
+from gesture_backends import BACKENDS
+from landmark_filter import FILTERS
+from perf import FRAME_BUDGET_MS, RateMeter
+from tracing import TRACER
+
+
+# ─────────────────────────────────────────────────────────────
+#  CAMERA STREAM  (capture thread)
+# ─────────────────────────────────────────────────────────────
+class CameraStream:
+    """
+    Reads the webcam on a background thread so the game loop never blocks
+    on cap.read().  Only the newest frame is kept; a frame replaced before
+    anyone read it counts as dropped.
+    """
+
+    def __init__(self, index=0, width=320, height=240, fps=30):
+        import cv2
+
+        self.cap = cv2.VideoCapture(index)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH,  width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+
+        self.size     = (width, height)
+        self.rate     = RateMeter()
+        self.frames   = 0
+        self.dropped  = 0
+        self._want    = None          # size requested by request_size()
+        self._lock    = threading.Lock()
+        self._frame   = None
+        self._fresh   = False
+        self._running = self.cap.isOpened()
+        self._thread  = threading.Thread(target=self._loop, name="camera",
+                                         daemon=True)
+        self._thread.start()
+
+    def request_size(self, width, height):
+        """Change the capture size; applied by the capture thread."""
+        if (width, height) != self.size:
+            self._want = (width, height)
+
+    def _loop(self):
+        import cv2
+
+        while self._running:
+            want, self._want = self._want, None
+            if want:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH,  want[0])
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, want[1])
+                self.size = want
+            with TRACER.span("capture"):
+                ok, frame = self.cap.read()
+            if not ok:
+                time.sleep(0.01)
+                continue
+            with self._lock:
+                if self._fresh:
+                    self.dropped += 1
+                self._frame = frame
+                self._fresh = True
+            self.frames += 1
+            self.rate.tick()
+
+    def read(self):
+        """Newest frame not returned before, or None."""
+        with self._lock:
+            if not self._fresh:
+                return None
+            self._fresh = False
+            return self._frame
+
+    def close(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+        self.cap.release()
+
+
+# ─────────────────────────────────────────────────────────────
+#  PREPROCESSING
+# ─────────────────────────────────────────────────────────────
+class Preprocessor:
+    """
+    Mirrors a BGR camera frame and converts it to RGB inside one persistent
+    buffer: the model reads it, the annotations are drawn onto it and the
+    preview shows it, so a frame costs one flip and one in-place colour
+    swap with no allocations.  The buffer is replaced only when the
+    capture size changes.
+    """
+
+    def __init__(self):
+        self.rgb = None
+
+    def __call__(self, bgr):
+        import cv2
+
+        if self.rgb is None or self.rgb.shape != bgr.shape:
+            self.rgb = np.empty_like(bgr)
+        cv2.flip(bgr, 1, self.rgb)
+        cv2.cvtColor(self.rgb, cv2.COLOR_BGR2RGB, self.rgb)
+        return self.rgb
+
+
+# ─────────────────────────────────────────────────────────────
+#  MOTION GATE
+# ─────────────────────────────────────────────────────────────
+class MotionGate:
+    """
+    Lets inference skip camera frames in which nothing moved — a gesture
+    held still, or nobody in front of the camera.
+
+    Each frame is shrunk to a SIZE grayscale thumbnail and compared with the
+    thumbnail of the last frame that was inferred on (not the previous one,
+    so slow drift adds up).  Fewer than CHANGED thumbnail pixels differing
+    by more than PIXEL grey levels is a still frame: the last landmarks and
+    gestures stand.  An inference is forced every REFRESH seconds anyway.
+    """
+    SIZE    = (64, 48)
+    PIXEL   = 12        # grey levels
+    CHANGED = 4         # pixels of the thumbnail
+    REFRESH = 0.5       # s
+    WINDOW  = 90        # frames in the skip-rate window
+
+    def __init__(self):
+        w, h = self.SIZE
+        self.skipped = 0
+        self._small  = np.empty((h, w, 3), np.uint8)
+        self._gray   = np.empty((h, w), np.uint8)
+        self._ref    = np.empty((h, w), np.uint8)
+        self._diff   = np.empty((h, w), np.uint8)
+        self._last   = None       # time of the reference frame
+        self._recent = deque(maxlen=self.WINDOW)    # 1 per skipped frame
+
+    @property
+    def skip_rate(self):
+        return sum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    def moved(self, now, bgr):
+        """True if `bgr` should be inferred on (it becomes the reference)."""
+        import cv2
+
+        cv2.resize(bgr, self.SIZE, self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, self._gray)
+        if self._last is not None and now - self._last < self.REFRESH:
+            cv2.absdiff(self._gray, self._ref, self._diff)
+            cv2.threshold(self._diff, self.PIXEL, 255, cv2.THRESH_BINARY,
+                          self._diff)
+            if cv2.countNonZero(self._diff) < self.CHANGED:
+                self.skipped += 1
+                self._recent.append(1)
+                return False
+        self._gray, self._ref = self._ref, self._gray
+        self._last = now
+        self._recent.append(0)
+        return True
+
+
+# ─────────────────────────────────────────────────────────────
+#  INFERENCE GOVERNOR
+# ─────────────────────────────────────────────────────────────
+class InferenceGovernor:
+    """
+    Decides how much hand tracking the game can afford.  Inference runs on
+    the game thread, so its cost comes straight out of the frame budget.
+
+    TIERS go from best to cheapest (model complexity, capture size).  The
+    governor steps down one tier after inference or the whole frame has been
+    over budget for DOWN_HOLD seconds, and back up after UP_HOLD seconds of
+    headroom.  Separately, once no hand has been seen for IDLE_AFTER seconds
+    it only lets IDLE_HZ inferences a second through; the first hand found
+    restores the full rate.
+    """
+    TIERS = (
+        ("full", 1, (320, 240)),
+        ("lite", 0, (320, 240)),
+        ("low",  0, (256, 192)),
+        ("min",  0, (160, 120)),
+    )
+    INFER_BUDGET = FRAME_BUDGET_MS * 0.5    # ms of a frame inference may use
+    FRAME_SLACK  = 1.15     # frame time tolerated before stepping down
+    HEADROOM     = 0.6      # step up only below this share of INFER_BUDGET
+    DOWN_HOLD    = 1.0      # s
+    UP_HOLD      = 5.0      # s
+    IDLE_AFTER   = 2.0      # s without a hand
+    IDLE_HZ      = 5.0
+    SMOOTH       = 0.1
+
+    def __init__(self, tier=0):
+        self.tier       = tier
+        self.idle       = False
+        self.skipped    = 0           # camera frames not inferred while idle
+        self.infer_ema  = 0.0
+        self.frame_ema  = FRAME_BUDGET_MS
+        self._t_prev    = None
+        self._last_hand = time.perf_counter()
+        self._last_run  = 0.0
+        self._since     = None        # start of the current over/under streak
+
+    @property
+    def complexity(self):
+        return self.TIERS[self.tier][1]
+
+    @property
+    def capture_size(self):
+        return self.TIERS[self.tier][2]
+
+    @property
+    def mode(self):
+        name, _, (_, h) = self.TIERS[self.tier]
+        return f"{name} {h}p" + (" idle" if self.idle else "")
+
+    def tick(self, now):
+        """Call once per game frame (not per poll: frame_ema is the frame
+        time the tier decision budgets against)."""
+        if self._t_prev is not None:
+            dt = min((now - self._t_prev) * 1000.0, 4 * FRAME_BUDGET_MS)
+            self.frame_ema += (dt - self.frame_ema) * self.SMOOTH
+        self._t_prev = now
+
+    def should_infer(self, now):
+        if not self.idle or now - self._last_run >= 1.0 / self.IDLE_HZ:
+            return True
+        self.skipped += 1
+        return False
+
+    def observe(self, now, infer_ms, hand):
+        """Record one inference; True if the tier changed."""
+        self.infer_ema += (infer_ms - self.infer_ema) * self.SMOOTH
+        self._last_run  = now
+        if hand:
+            self._last_hand = now
+        self.idle = now - self._last_hand > self.IDLE_AFTER
+
+        over  = (self.infer_ema > self.INFER_BUDGET or
+                 self.frame_ema > FRAME_BUDGET_MS * self.FRAME_SLACK)
+        under = (self.infer_ema < self.INFER_BUDGET * self.HEADROOM and
+                 self.frame_ema < FRAME_BUDGET_MS * self.FRAME_SLACK)
+        if over and self.tier < len(self.TIERS) - 1:
+            step, hold = 1, self.DOWN_HOLD
+        elif under and self.tier > 0:
+            step, hold = -1, self.UP_HOLD
+        else:
+            self._since = None
+            return False
+
+        if self._since is None or self._since[0] != step:
+            self._since = (step, now)
+            return False
+        if now - self._since[1] < hold:
+            return False
+        self.tier  += step
+        self._since = None
+        return True
+
+
+# ─────────────────────────────────────────────────────────────
+#  SMOOTHING
+# ─────────────────────────────────────────────────────────────
+class GestureSmoother:
+    """
+    Majority vote over the last `window` frames: a gesture is reported once
+    it fills `need` of them, else "none".  window=1 passes frames through.
+    `share` is the winning gesture's share of the window (the confidence
+    reported with gesture events).
+    """
+
+    def __init__(self, window=1, need=1):
+        self.need  = need
+        self.share = 1.0
+        self._hist = deque(maxlen=window)
+
+    def push(self, gesture):
+        self._hist.append(gesture)
+        if self._hist.maxlen == 1:
+            return gesture
+        best, n = Counter(self._hist).most_common(1)[0]
+        self.share = n / len(self._hist)
+        return best if n >= self.need else "none"
+
+
+# ─────────────────────────────────────────────────────────────
+#  GESTURE EVENTS
+# ─────────────────────────────────────────────────────────────
+GESTURES = ("none", "jump", "duck", "run")      # gesture code = index
+GESTURE_NONE, GESTURE_JUMP, GESTURE_DUCK, GESTURE_RUN = range(len(GESTURES))
+GESTURE_CODE = {g: i for i, g in enumerate(GESTURES)}
+
+EV_END, EV_BEGIN = 0, 1
+
+
+class GestureEvents:
+    """
+    Thread-safe FIFO of gesture edges, as (kind, gesture code, player, t,
+    confidence) tuples: kind EV_BEGIN or EV_END, t on the perf_counter
+    clock.  Gesture sources push every change; the game drains the queue
+    once per frame in order, so a gesture that begins and ends between two
+    game frames still arrives as both events.  When nobody drains, events
+    past MAX are dropped and counted.
+    """
+    MAX = 256
 
-class GestureController:
     def __init__(self):
-        self.mp_hands = mp.solutions.hands
-        self.hands    = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.75,
-            min_tracking_confidence=0.6,
-        )
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH,  320)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        self.dropped = 0
+        self._q      = queue.Queue(self.MAX)
+
+    def push(self, kind, code, player, t, confidence):
+        try:
+            self._q.put_nowait((kind, code, player, t, confidence))
+        except queue.Full:
+            self.dropped += 1
 
+    def drain(self):
+        """Every pending event, oldest first."""
+        out = []
+        while True:
+            try:
+                out.append(self._q.get_nowait())
+            except queue.Empty:
+                return out
+
+
+# ─────────────────────────────────────────────────────────────
+#  PLAYERS  (several hands, one inference)
+# ─────────────────────────────────────────────────────────────
+class HandTracker:
+    """
+    Gives each detected hand a stable id across frames and keeps that id
+    bound to one player.
+
+    A detection continues the nearest live track whose wrist is within
+    MAX_STEP (normalized image units), else it starts a new one; a track
+    unseen for MISS_FRAMES inferences is dropped.  A hand that starts a new
+    track goes to a player whose own track is not in view — the model never
+    reports more hands than there are players — preferring the player on
+    that side of the mirrored image (player 1 left) and with the same
+    handedness as before.
+    """
+    MAX_STEP     = 0.2
+    MISS_FRAMES  = 6
+    HAND_PENALTY = 0.25     # side-distance cost of a handedness mismatch
+
+    def __init__(self, players):
+        self.players  = players
+        self.owner    = [None] * players      # track id per player
+        self.hand     = [None] * players      # last handedness per player
+        self.tracks   = {}                    # id -> [wrist x, wrist y, missed]
+        self._ids     = itertools.count()
+
+    def assign(self, hands):
+        """[(lm, handedness)] -> per-player landmark array or None."""
+        ids  = self._match(hands)
+        free = [p for p in range(self.players) if self.owner[p] not in ids]
+        new  = [i for i, tid in enumerate(ids) if tid not in self.owner]
+        if free and new:
+            cost = []
+            for i in new:
+                x, side = hands[i][0][0, 0], hands[i][1]
+                for p in free:
+                    c = abs(x - (p + 0.5) / self.players)
+                    if self.hand[p] and side and side != self.hand[p]:
+                        c += self.HAND_PENALTY
+                    cost.append((c, i, p))
+            for c, i, p in sorted(cost):
+                if p in free and ids[i] not in self.owner:
+                    free.remove(p)
+                    self.owner[p] = ids[i]
+                    self.hand[p]  = hands[i][1] or self.hand[p]
+
+        seen = dict(zip(ids, hands))
+        return [seen[tid][0] if tid in seen else None for tid in self.owner]
+
+    def _match(self, hands):
+        tracks = self.tracks
+        pairs  = sorted(
+            (math.hypot(lm[0, 0] - t[0], lm[0, 1] - t[1]), i, tid)
+            for i, (lm, _) in enumerate(hands) for tid, t in tracks.items())
+        ids  = [None] * len(hands)
+        used = set()
+        for d, i, tid in pairs:
+            if d > self.MAX_STEP:
+                break
+            if ids[i] is None and tid not in used:
+                ids[i] = tid
+                used.add(tid)
+
+        for tid in list(tracks):
+            if tid not in used:
+                tracks[tid][2] += 1
+                if tracks[tid][2] > self.MISS_FRAMES:
+                    del tracks[tid]
+        for i, (lm, _) in enumerate(hands):
+            if ids[i] is None:
+                ids[i] = next(self._ids)
+            tracks[ids[i]] = [float(lm[0, 0]), float(lm[0, 1]), 0]
+        return ids
+
+
+class PlayerInput:
+    """
+    One player's gestures, with the controller's getters.  With a landmark
+    filter the hand is also re-estimated and re-classified on game frames
+    between inferences (follow), so the smoother's window counts game
+    frames rather than camera frames.
+    """
+
+    def __init__(self, smoother, predictor=None, lm_filter=None,
+                 events=None, index=0):
         self.gesture   = "none"   # "jump" | "duck" | "run" | "none"
-        self.frame_rgb = None
-
-    # ── low-level helpers ────────────────────────────────────
-    @staticmethod
-    def _dist(a, b):
-        return np.hypot(a.x - b.x, a.y - b.y)
-
-    @staticmethod
-    def _finger_up(lm, tip, pip):
-        """Finger extended = tip above pip (lower y value)."""
-        return lm[tip].y < lm[pip].y - 0.02
-
-    @staticmethod
-    def _thumb_up(lm):
-        """Thumb extended = tip left of ip (for right hand, mirrored feed)."""
-        return lm[4].x > lm[3].x + 0.02
-
-    # ── gesture logic ────────────────────────────────────────
-    def _classify(self, lm):
-        index  = self._finger_up(lm, 8,  6)
-        middle = self._finger_up(lm, 12, 10)
-        ring   = self._finger_up(lm, 16, 14)
-        pinky  = self._finger_up(lm, 20, 18)
-        thumb  = self._thumb_up(lm)
-        pinch_dist = self._dist(lm[4], lm[8])
-
-        # ── PINCH: thumb tip near index tip ──────────────────
-        if pinch_dist < 0.07:
-            return "run"
-
-        # ── FIST: all 4 fingers curled (thumb position free) ─
-        if not index and not middle and not ring and not pinky:
-            return "duck"
-
-        # ── L-SHAPE: thumb out + index up, rest curled ───────
-        if thumb and index and not middle and not ring and not pinky:
-            return "jump"
-
-        return "none"
+        self.landmarks = None     # latest (N, 3) array; reused buffer
+        self.raw       = None     # latest detected landmarks, unfiltered
+        self.smoother  = smoother
+        self.predictor = predictor
+        self.filter    = lm_filter
+        self.events    = events   # GestureEvents for begin/end, or None
+        self.index     = index
+
+    def report(self, now, gesture):
+        """Set the reported gesture, queueing end / begin events on change."""
+        prev = self.gesture
+        if gesture == prev:
+            return
+        self.gesture = gesture
+        if self.events is None:
+            return
+        conf = self.smoother.share
+        if prev != "none":
+            self.events.push(EV_END, GESTURE_CODE[prev], self.index, now, conf)
+        if gesture != "none":
+            self.events.push(EV_BEGIN, GESTURE_CODE[gesture], self.index, now,
+                             conf)
+
+    def update(self, now, backend, lm):
+        """One inference's landmarks for this player (None: no hand)."""
+        self.raw = lm
+        if lm is None:
+            self.landmarks = None
+            self.report(now, self.smoother.push("none"))
+            if self.predictor:
+                self.predictor.reset()
+            if self.filter:
+                self.filter.reset()
+            return
+        if self.filter:
+            lm = self.filter.correct(now, lm)
+        self._classify(now, backend, lm)
+
+    def follow(self, now, backend, still=False):
+        """A game frame without inference: predict the filtered hand to
+        `now`.  still: the camera saw no motion, so the last detection is
+        measured again."""
+        if self.filter is None or self.raw is None:
+            return
+        if still:
+            self.filter.correct(now, self.raw)
+        self._classify(now, backend, self.filter.predict(now))
+
+    def _classify(self, now, backend, lm):
+        self.landmarks = lm
+        gesture = self.smoother.push(backend.classify(lm))
+        if self.predictor:
+            gesture = self.predictor.update(now, lm, gesture)
+        self.report(now, gesture)
+
+    def is_jump(self):  return self.gesture == "jump"
+    def is_duck(self):  return self.gesture == "duck"
+    def is_run(self):   return self.gesture == "run"
+
+
+# ─────────────────────────────────────────────────────────────
+#  GESTURE CONTROLLER
+# ─────────────────────────────────────────────────────────────
+class GestureController:
+    """
+    One camera and one inference per frame for every player.  The getters
+    (is_jump, …) read player 1; `players[i]` has the same getters for each.
+    `events` gets a begin / end event for every player's gesture change.
+    """
+
+    def __init__(self, backend="hands", predictive=False, players=1,
+                 landmark_filter="none"):
+        self.backend  = BACKENDS[backend](players)
+        self.governor = InferenceGovernor()
+        self.model    = self.backend.load(self.governor.complexity)
+        self.camera   = CameraStream(0, *self.governor.capture_size, 30)
+
+        self.frame_rgb  = None     # annotated preview; the shared buffer
+        self.preview    = True     # False: skip annotation, no frame_rgb
+        self.prep       = Preprocessor()
+        self.gate       = MotionGate()
+        self.infer_rate = RateMeter()
+        self.infer_ms   = 0.0
+        self.hands_seen = 0
+        self.seq        = 0        # inferences run so far
+
+        make_filter  = FILTERS[landmark_filter]
+        self.events  = GestureEvents()
+        self.tracker = HandTracker(players)
+        self.players = [
+            PlayerInput(GestureSmoother(*self.backend.SMOOTHING),
+                        self.backend.make_predictor() if predictive else None,
+                        make_filter() if make_filter else None,
+                        self.events, i)
+            for i in range(players)]
+
+        self._complexity  = self.governor.complexity
+        self._rebuild     = None   # thread loading another model complexity
+        self._next_model  = None
+        self._unavailable = set()  # complexities that failed to load
+
+    # ── governor ─────────────────────────────────────────────
+    def _apply_tier(self):
+        gov = self.governor
+        self.camera.request_size(*gov.capture_size)
+        c   = gov.complexity
+        if (c != self._complexity and c not in self._unavailable
+                and self._rebuild is None):
+            # loading a model takes ~100 ms; keep tracking with the old one
+            self._rebuild = threading.Thread(
+                target=self._load_model, args=(c,), name="model-rebuild",
+                daemon=True)
+            self._rebuild.start()
+
+    def _load_model(self, complexity):
+        try:
+            with TRACER.span("model_load"):
+                model = self.backend.load(complexity)
+        except Exception:       # e.g. pose lite/heavy download failed
+            model = None
+        self._next_model = (complexity, model)
+
+    def _swap_model(self):
+        complexity, model = self._next_model
+        self._next_model  = None
+        self._rebuild     = None
+        if model is None:
+            self._unavailable.add(complexity)
+            return
+        self.model.close()
+        self.model, self._complexity = model, complexity
+        if complexity != self.governor.complexity:
+            self._apply_tier()      # tier moved again while loading
 
     # ── per-frame update ─────────────────────────────────────
-    def update(self):
-        ok, frame = self.cap.read()
-        if not ok:
-            self.frame_rgb = None
+    def update(self, follow=True):
+        """Process the newest camera frame, if any; otherwise keep state.
+        follow: this call is a game frame, so filtered landmarks are
+        predicted to it (callers polling faster than frames pass False
+        between frames; smoothers and predictors count frames)."""
+        now = time.perf_counter()
+        gov = self.governor
+        if follow:
+            gov.tick(now)               # frame clock: game frames only
+        if self._next_model is not None:
+            self._swap_model()
+
+        frame = self.camera.read()
+        if frame is None or not gov.should_infer(now):
+            if follow:
+                self._follow(now)
             return
+        with TRACER.span("motion"):
+            if not self.gate.moved(now, frame):
+                if follow:
+                    self._follow(now, still=True)
+                return      # still: keep the last landmarks and gestures
+
+        t0 = time.perf_counter()
+        with TRACER.span("preprocess"):
+            rgb = self.prep(frame)
+        with TRACER.span("inference"):
+            hands = self.backend.detect(self.model, rgb)
+        self.infer_ms = (time.perf_counter() - t0) * 1000.0
+        self.infer_rate.tick()
+        self.hands_seen = len(hands)
+        self.seq       += 1
+        if gov.observe(now, self.infer_ms, bool(hands)):
+            self._apply_tier()
+
+        multi = len(self.players) > 1
+        for i, (player, lm) in enumerate(zip(self.players,
+                                             self.tracker.assign(hands))):
+            player.update(now, self.backend, lm)
+            if lm is not None and self.preview:
+                self.backend.annotate(rgb, lm, player.gesture,
+                                      i if multi else None)
+
+        self.frame_rgb = rgb if self.preview else None
+
+    def _follow(self, now, still=False):
+        for player in self.players:
+            player.follow(now, self.backend, still)
+
+    # ── public getters (player 1) ────────────────────────────
+    @property
+    def gesture(self):
+        return self.players[0].gesture
+
+    @property
+    def predictor(self):
+        return self.players[0].predictor
 
-        frame = cv2.flip(frame, 1)
-        rgb   = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res   = self.hands.process(rgb)
-
-        self.gesture = "none"
-
-        if res.multi_hand_landmarks:
-            lm = res.multi_hand_landmarks[0].landmark
-            self.gesture = self._classify(lm)
-
-            # ── draw landmarks ──
-            h, w = frame.shape[:2]
-
-            COLOR_MAP = {
-                "jump": (80,  200, 80),
-                "duck": (80,  80,  255),
-                "run":  (255, 180, 0),
-                "none": (180, 180, 180),
-            }
-            col = COLOR_MAP[self.gesture]
-
-            # Draw dots for key landmarks
-            key_pts = [4, 8, 12, 16, 20, 0]
-            for idx in key_pts:
-                px = (int(lm[idx].x * w), int(lm[idx].y * h))
-                cv2.circle(frame, px, 7, col, -1)
-
-            # Thumb–index line
-            t = (int(lm[4].x * w), int(lm[4].y * h))
-            i = (int(lm[8].x * w), int(lm[8].y * h))
-            cv2.line(frame, t, i, col, 2)
-
-            # Label
-            labels = {
-                "jump": "L-SHAPE -> JUMP",
-                "duck": "FIST    -> DUCK",
-                "run":  "PINCH   -> RUN",
-                "none": "...",
-            }
-            cv2.putText(frame, labels[self.gesture],
-                        (6, 22), cv2.FONT_HERSHEY_SIMPLEX,
-                        0.55, col, 2, cv2.LINE_AA)
-
-        self.frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-    # ── public getters ───────────────────────────────────────
     def is_jump(self):  return self.gesture == "jump"
     def is_duck(self):  return self.gesture == "duck"
     def is_run(self):   return self.gesture == "run"
     def get_frame(self): return self.frame_rgb
 
+    @property
+    def has_camera(self):
+        return self.camera.cap.isOpened()
+
+    def stats(self):
+        out = {
+            "camera_fps": self.camera.rate.rate,
+            "infer_fps":  self.infer_rate.rate,
+            "infer_ms":   self.infer_ms,
+            "dropped":    self.camera.dropped,
+            "backend":    self.backend.NAME,
+            "mode":       self.governor.mode,
+            "idle_skip":  self.governor.skipped,
+            "still_skip": self.gate.skip_rate,
+            "hands":      self.hands_seen,
+        }
+        if self.predictor:
+            out.update(self.predictor.stats())
+        return out
+
     def close(self):
-        self.cap.release()
\ No newline at end of file
+        if self._rebuild is not None:
+            self._rebuild.join()
+            if self._next_model and self._next_model[1] is not None:
+                self._next_model[1].close()
+        self.model.close()
+        self.camera.close()
+
+
+# ─────────────────────────────────────────────────────────────
+#  GESTURE LOADER  (background startup)
+# ─────────────────────────────────────────────────────────────
+class GestureLoader:
+    """
+    Builds a GestureController on a background thread — importing mediapipe,
+    loading the model and opening the camera take seconds, and the
+    window should be drawing meanwhile.
+    """
+
+    def __init__(self, factory=GestureController):
+        self.controller = None
+        self.error      = None
+        self._done      = threading.Event()
+        self._factory   = factory
+        self._thread    = threading.Thread(target=self._load,
+                                           name="gesture-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self):
+        try:
+            with TRACER.span("gesture_load"):
+                self.controller = self._factory()
+        except Exception as e:          # no mediapipe, broken camera driver, …
+            self.error = e
+        finally:
+            self._done.set()
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    def close(self, timeout=5.0):
+        """Wait for a pending load and release whatever it opened."""
+        self._done.wait(timeout)
+        if self.controller:
+            self.controller.close()
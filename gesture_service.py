@@ -0,0 +1,511 @@
+"""
+Gesture service — one process owns the camera and MediaPipe and publishes
+gestures to any number of local clients (the game, a recorder, a spectator
+view) over a Unix domain socket or localhost TCP.
+
+    python gesture_service.py serve                  # camera -> clients
+    python gesture_service.py record run.gds         # save the stream
+    python gesture_service.py replay run.gds --loop  # stand-in publisher
+    python main.py --service 127.0.0.1:47800         # game as a client
+
+Addresses are "host:port" or "port" for TCP, anything else is a socket path.
+
+Every message is an 8-byte header — magic "GD", version, type, payload
+length (u32) — followed by the payload, all little-endian:
+
+    SUBSCRIBE  client -> service   u8 topic mask
+    HELLO      service -> client   u8 players, backend name (ascii)
+    FRAME      inference / change  f64 wall time, u32 seq, u8 players, then
+                                   per player u8 gesture, u8 n, n x 3 f32 xyz
+                                   (n = 0 unless TOPIC_LANDMARKS)
+    PREVIEW    TOPIC_PREVIEW       JPEG of the annotated camera image
+    STATS      once a second       JSON of GestureController.stats()
+
+A recording is the byte stream a landmark subscriber receives, saved as is,
+so replay re-sends it on the recorded clock.
+"""
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from config import FPS, GESTURE_SERVICE, LANDMARK_FILTER
+from gesture_controller import (GESTURE_CODE, GESTURES, GestureEvents,
+                                GestureSmoother, PlayerInput)
+
+MAGIC   = b"GD"
+VERSION = 1
+HEADER       = struct.Struct("<2sBBI")
+FRAME_HEAD   = struct.Struct("<dIB")
+PLAYER_HEAD  = struct.Struct("<BB")
+
+MSG_HELLO, MSG_SUBSCRIBE, MSG_FRAME, MSG_PREVIEW, MSG_STATS = range(5)
+
+TOPIC_GESTURES  = 1
+TOPIC_LANDMARKS = 2
+TOPIC_PREVIEW   = 4
+
+
+# ─────────────────────────────────────────────────────────────
+#  Wire format
+# ─────────────────────────────────────────────────────────────
+def parse_address(text):
+    """(family, address) for "host:port", "port" or a socket path."""
+    host, _, port = text.rpartition(":")
+    if port.isdigit():
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, text
+
+
+def pack(msg_type, payload=b""):
+    return HEADER.pack(MAGIC, VERSION, msg_type, len(payload)) + payload
+
+
+def encode_frame(t, seq, players, landmarks=True):
+    """players: [(gesture, (N, 3) array or None)] -> FRAME message."""
+    parts = [FRAME_HEAD.pack(t, seq & 0xFFFFFFFF, len(players))]
+    for gesture, lm in players:
+        if landmarks and lm is not None:
+            parts.append(PLAYER_HEAD.pack(GESTURE_CODE[gesture], len(lm)))
+            parts.append(np.asarray(lm, dtype="<f4").tobytes())
+        else:
+            parts.append(PLAYER_HEAD.pack(GESTURE_CODE[gesture], 0))
+    return pack(MSG_FRAME, b"".join(parts))
+
+
+def decode_frame(payload):
+    """FRAME payload -> (t, seq, [(gesture, array or None)])."""
+    t, seq, n = FRAME_HEAD.unpack_from(payload)
+    off     = FRAME_HEAD.size
+    players = []
+    for _ in range(n):
+        code, k = PLAYER_HEAD.unpack_from(payload, off)
+        off += PLAYER_HEAD.size
+        lm   = None
+        if k:
+            lm   = np.frombuffer(payload, "<f4", k * 3, off).reshape(k, 3)
+            off += k * 12
+        players.append((GESTURES[code], lm))
+    return t, seq, players
+
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+
+def read_message(sock):
+    """(type, payload) from a socket, or None once it closes."""
+    head = _recv_exact(sock, HEADER.size)
+    if head is None:
+        return None
+    magic, version, msg_type, size = HEADER.unpack(head)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a gesture service stream: {head!r}")
+    payload = _recv_exact(sock, size) if size else b""
+    return None if payload is None else (msg_type, payload)
+
+
+def read_messages(f):
+    """Iterate (type, payload, raw bytes) over a recording."""
+    while True:
+        head = f.read(HEADER.size)
+        if len(head) < HEADER.size:
+            return
+        _, _, msg_type, size = HEADER.unpack(head)
+        payload = f.read(size)
+        yield msg_type, payload, head + payload
+
+
+# ─────────────────────────────────────────────────────────────
+#  Service
+# ─────────────────────────────────────────────────────────────
+class _Client:
+    """A subscriber with a bounded outbox drained by its own thread; when
+    it falls behind, the oldest queued message is dropped."""
+    QUEUE = 8
+
+    def __init__(self, sock, topics):
+        self.sock    = sock
+        self.topics  = topics
+        self.alive   = True
+        self.dropped = 0
+        self._out    = deque(maxlen=self.QUEUE)
+        self._cv     = threading.Condition()
+        threading.Thread(target=self._loop, name="gesture-client",
+                         daemon=True).start()
+
+    def send(self, data):
+        with self._cv:
+            if len(self._out) == self.QUEUE:
+                self.dropped += 1
+            self._out.append(data)
+            self._cv.notify()
+
+    def _loop(self):
+        while self.alive:
+            with self._cv:
+                while not self._out and self.alive:
+                    self._cv.wait(0.5)
+                if not self.alive:
+                    break
+                data = self._out.popleft()
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                self.alive = False
+        self.sock.close()
+
+    def close(self):
+        self.alive = False
+        with self._cv:
+            self._cv.notify()
+
+
+class GestureService:
+    PREVIEW_FPS = 15
+
+    def __init__(self, address=GESTURE_SERVICE, players=1, backend="hands"):
+        self.family, self.address = parse_address(address)
+        self.hello   = pack(MSG_HELLO, bytes([players]) + backend.encode())
+        self.clients = []
+        self.running = True
+        self._lock   = threading.Lock()
+
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)         # stale socket from a crash
+        self._server = socket.socket(self.family, socket.SOCK_STREAM)
+        if self.family == socket.AF_INET:
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(self.address)
+        self._server.listen()
+        threading.Thread(target=self._accept, name="gesture-accept",
+                         daemon=True).start()
+
+    def _accept(self):
+        while self.running:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+            if self.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.settimeout(1.0)
+            try:
+                msg = read_message(sock)
+            except (OSError, ValueError):
+                sock.close()
+                continue
+            topics = (msg[1][0] if msg and msg[0] == MSG_SUBSCRIBE
+                      and msg[1] else TOPIC_GESTURES)
+            sock.settimeout(None)
+            client = _Client(sock, topics)
+            client.send(self.hello)
+            with self._lock:
+                self.clients.append(client)
+
+    def _subscribers(self, topic):
+        with self._lock:
+            self.clients = [c for c in self.clients if c.alive]
+            return [c for c in self.clients if c.topics & topic]
+
+    # ── publishing ───────────────────────────────────────────
+    def publish_frame(self, t, seq, players):
+        plain = full = None
+        for c in self._subscribers(TOPIC_GESTURES | TOPIC_LANDMARKS):
+            if c.topics & TOPIC_LANDMARKS:
+                full = full or encode_frame(t, seq, players, True)
+                c.send(full)
+            else:
+                plain = plain or encode_frame(t, seq, players, False)
+                c.send(plain)
+
+    def publish(self, msg_type, payload, topic=TOPIC_GESTURES):
+        data = None
+        for c in self._subscribers(topic):
+            data = data or pack(msg_type, payload)
+            c.send(data)
+
+    def wants(self, topic):
+        return bool(self._subscribers(topic))
+
+    # ── sources ──────────────────────────────────────────────
+    def serve_controller(self, ctrl):
+        """Publish every inference of a GestureController, and every gesture
+        change in between, until stopped.  The camera is polled every 2 ms,
+        but filtered landmarks are only predicted at FPS ticks, the rate the
+        smoothers and predictors are tuned for."""
+        import cv2
+
+        seq, next_preview, next_stats = ctrl.seq, 0.0, 0.0
+        next_follow, sent = 0.0, [p.gesture for p in ctrl.players]
+        while self.running:
+            ctrl.preview = self.wants(TOPIC_PREVIEW)
+            tick   = time.perf_counter()
+            follow = tick >= next_follow
+            if follow:
+                next_follow = max(next_follow + 1.0 / FPS, tick)
+            ctrl.update(follow)
+            ctrl.events.drain()     # subscribers rebuild their own
+            gestures = [p.gesture for p in ctrl.players]
+            if ctrl.seq == seq and gestures == sent:
+                time.sleep(0.002)
+                continue
+            seq, sent = ctrl.seq, gestures
+            now = time.time()
+            self.publish_frame(now, seq, [(p.gesture, p.landmarks)
+                                          for p in ctrl.players])
+
+            if now >= next_preview and ctrl.frame_rgb is not None \
+                    and self.wants(TOPIC_PREVIEW):
+                next_preview = now + 1.0 / self.PREVIEW_FPS
+                bgr = cv2.cvtColor(ctrl.frame_rgb, cv2.COLOR_RGB2BGR)
+                ok, jpg = cv2.imencode(".jpg", bgr,
+                                       (cv2.IMWRITE_JPEG_QUALITY, 70))
+                if ok:
+                    self.publish(MSG_PREVIEW, jpg.tobytes(), TOPIC_PREVIEW)
+            if now >= next_stats:
+                next_stats = now + 1.0
+                self.publish(MSG_STATS, json.dumps(ctrl.stats()).encode())
+
+    def serve_recording(self, path, loop=False):
+        """Re-publish a recording on its original clock (stand-in camera)."""
+        while self.running:
+            with open(path, "rb") as f:
+                t_rec = t_wall = None
+                for msg_type, payload, _ in read_messages(f):
+                    if not self.running:
+                        return
+                    if msg_type != MSG_FRAME:
+                        continue
+                    t, seq, players = decode_frame(payload)
+                    if t_rec is None:
+                        t_rec, t_wall = t, time.time()
+                    delay = (t - t_rec) - (time.time() - t_wall)
+                    if delay > 0:
+                        time.sleep(delay)
+                    self.publish_frame(time.time(), seq, players)
+            if not loop:
+                return
+
+    def close(self):
+        self.running = False
+        self._server.close()
+        for c in self._subscribers(0xFF):
+            c.close()
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+# ─────────────────────────────────────────────────────────────
+#  Subscriber  (drop-in for GestureController)
+# ─────────────────────────────────────────────────────────────
+def connect(address, topics, timeout=2.0):
+    """Open a subscription; returns (socket, players, backend name)."""
+    family, addr = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(addr)
+    if family == socket.AF_INET:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.sendall(pack(MSG_SUBSCRIBE, bytes([topics])))
+    msg = read_message(sock)
+    if not msg or msg[0] != MSG_HELLO:
+        sock.close()
+        raise ConnectionError("gesture service did not say hello")
+    sock.settimeout(None)
+    return sock, msg[1][0], msg[1][1:].decode()
+
+
+class GestureSubscriber:
+    """
+    Reads a gesture service on a background thread and offers the same
+    interface as GestureController (update, is_jump, players, events,
+    get_frame, stats, close), so Game works with either.  Frames queue up
+    until update() applies them in order on the game thread, so every
+    gesture change becomes an event; only the newest preview is kept.
+    """
+    BACKLOG = 64            # frames kept while update() is not called
+
+    def __init__(self, address=GESTURE_SERVICE,
+                 topics=TOPIC_GESTURES | TOPIC_PREVIEW):
+        self.sock, n, self.backend_name = connect(address, topics)
+        self.events     = GestureEvents()
+        self.players    = [PlayerInput(GestureSmoother(), events=self.events,
+                                       index=i) for i in range(n)]
+        self.frame_rgb  = None
+        self.preview    = True        # False: previews are not decoded
+        self.frames     = 0
+        self.missed     = 0           # frames dropped past BACKLOG
+        self.latency_ms = 0.0
+        self._alive     = True
+        self._lock      = threading.Lock()
+        self._frames    = deque(maxlen=self.BACKLOG)
+        self._jpeg      = None
+        self._stats     = {}
+        self._thread    = threading.Thread(target=self._loop,
+                                           name="gesture-subscriber",
+                                           daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        try:
+            while self._alive:
+                msg = read_message(self.sock)
+                if msg is None:
+                    break
+                msg_type, payload = msg
+                with self._lock:
+                    if msg_type == MSG_FRAME:
+                        if len(self._frames) == self.BACKLOG:
+                            self.missed += 1
+                        self._frames.append(payload)
+                    elif msg_type == MSG_PREVIEW:
+                        self._jpeg = payload
+                    elif msg_type == MSG_STATS:
+                        self._stats = json.loads(payload)
+        except (OSError, ValueError):
+            pass
+        self._alive = False
+
+    def update(self):
+        with self._lock:
+            frames = list(self._frames)
+            self._frames.clear()
+            jpeg,  self._jpeg  = self._jpeg,  None
+        now, wall = time.perf_counter(), time.time()
+        for frame in frames:
+            t, _, players = decode_frame(frame)
+            at = now - (wall - t)       # frame time on our perf_counter
+            for player, (gesture, lm) in zip(self.players, players):
+                player.landmarks = lm
+                player.report(at, gesture)
+            self.frames    += 1
+            self.latency_ms = (wall - t) * 1000.0
+        if jpeg is not None and self.preview:
+            import cv2
+
+            bgr = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+            if bgr is not None:
+                self.frame_rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+    # ── GestureController interface ──────────────────────────
+    @property
+    def gesture(self):
+        return self.players[0].gesture
+
+    def is_jump(self):  return self.gesture == "jump"
+    def is_duck(self):  return self.gesture == "duck"
+    def is_run(self):   return self.gesture == "run"
+    def get_frame(self): return self.frame_rgb
+
+    @property
+    def has_camera(self):
+        return self._alive
+
+    def stats(self):
+        return {**self._stats,
+                "net_ms":     self.latency_ms,
+                "net_missed": self.missed}
+
+    def close(self):
+        self._alive = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self._thread.join(timeout=1.0)
+
+
+def record(address, path):
+    """Save a landmark subscription verbatim until interrupted."""
+    sock, players, backend = connect(address, TOPIC_GESTURES | TOPIC_LANDMARKS)
+    n = 0
+    with open(path, "wb") as f:
+        f.write(pack(MSG_HELLO, bytes([players]) + backend.encode()))
+        try:
+            while True:
+                msg = read_message(sock)
+                if msg is None:
+                    break
+                if msg[0] == MSG_FRAME:
+                    f.write(pack(*msg))
+                    n += 1
+        except KeyboardInterrupt:
+            pass
+    sock.close()
+    return n
+
+
+def recording_info(path):
+    """(players, backend) from a recording's HELLO."""
+    with open(path, "rb") as f:
+        for msg_type, payload, _ in read_messages(f):
+            if msg_type == MSG_HELLO:
+                return payload[0], payload[1:].decode()
+    return 1, "hands"
+
+
+# ─────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+
+    from landmark_filter import FILTERS
+
+    ap  = argparse.ArgumentParser(description="Gesture Dino gesture service")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("serve", help="publish the camera's gestures")
+    s.add_argument("--backend", default="hands")
+    s.add_argument("--players", type=int, default=1)
+    s.add_argument("--predict", action="store_true")
+    s.add_argument("--filter", default=LANDMARK_FILTER,
+                   choices=sorted(FILTERS))
+    r = sub.add_parser("record", help="save a service's stream to a file")
+    r.add_argument("path")
+    p = sub.add_parser("replay", help="publish a recording instead of a camera")
+    p.add_argument("path")
+    p.add_argument("--loop", action="store_true")
+    for q in (s, r, p):
+        q.add_argument("--address", default=GESTURE_SERVICE,
+                       help="host:port, port, or a Unix socket path")
+    args = ap.parse_args()
+
+    if args.cmd == "record":
+        print(f"recorded {record(args.address, args.path)} frames")
+        raise SystemExit
+
+    if args.cmd == "serve":
+        from gesture_controller import GestureController
+
+        ctrl = GestureController(args.backend, predictive=args.predict,
+                                 players=args.players,
+                                 landmark_filter=args.filter)
+        if not ctrl.has_camera:
+            ctrl.close()
+            raise SystemExit("no camera")
+        svc = GestureService(args.address, args.players, args.backend)
+        run = lambda: svc.serve_controller(ctrl)
+    else:
+        svc = GestureService(args.address, *recording_info(args.path))
+        run = lambda: svc.serve_recording(args.path, args.loop)
+
+    print("gesture service on", args.address)
+    try:
+        run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        svc.close()
+        if args.cmd == "serve":
+            ctrl.close()
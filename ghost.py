@@ -0,0 +1,134 @@
+"""
+Ghost runs — race a translucent replay of your best run on the same course.
+
+    python main.py --ghost
+
+With a ghost loaded every run uses the ghost's obstacle seed, so both dinos
+see the same obstacles on the same frames.  A new best replaces the ghost.
+
+File layout (little-endian): a fixed header, then one 2-byte record per
+frame — the change in feet y since the previous frame (i8) and a pose code
+(u8).  Jump deltas never exceed ~22 px, so a 10 minute run is ~70 KB.  The
+records are memory-mapped only while loading: y is rebuilt with one cumsum
+and the pose codes are copied out, so nothing keeps the file open and a new
+best can replace it (Windows refuses to replace a mapped file).
+"""
+import os
+import struct
+from array import array
+
+import numpy as np
+
+from config import GHOST_FILE
+from dino import Dino
+from palette import PALETTE
+
+MAGIC   = b"DGST"
+VERSION = 3             # 3: course from ObstacleSchedule, old seeds differ
+HEADER  = struct.Struct("<4sHQIdh")     # magic, version, seed, frames, score, y0
+RECORD  = np.dtype([("dy", "i1"), ("pose", "u1")])
+
+POSE_RUN_A, POSE_RUN_B, POSE_JUMP, POSE_DUCK_A, POSE_DUCK_B = range(5)
+
+
+def pose_of(dino):
+    phase = (dino._step // 7) % 2
+    if dino.ducking:
+        return POSE_DUCK_A + phase
+    if dino.jumping:
+        return POSE_JUMP
+    return POSE_RUN_A + phase
+
+
+# ─────────────────────────────────────────────────────────────
+#  Recording
+# ─────────────────────────────────────────────────────────────
+class GhostRecorder:
+    """Collects one (y, pose) sample per played frame of the current run."""
+
+    def __init__(self):
+        self.seed  = 0
+        self._y    = array("h")
+        self._pose = array("B")
+
+    def reset(self, seed):
+        self.seed = seed
+        del self._y[:], self._pose[:]
+
+    def push(self, dino):
+        self._y.append(round(dino.y))
+        self._pose.append(pose_of(dino))
+
+    def save(self, path, score):
+        y = np.frombuffer(self._y, np.int16)
+        if not len(y):
+            return
+        rec = np.empty(len(y), RECORD)
+        dy  = np.diff(y, prepend=y[:1])
+        if np.abs(dy).max() > 127:
+            raise ValueError("ghost step does not fit in i1")
+        rec["dy"]   = dy
+        rec["pose"] = np.frombuffer(self._pose, np.uint8)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(y), score,
+                                int(y[0])))
+            rec.tofile(f)
+        os.replace(tmp, path)
+
+
+# ─────────────────────────────────────────────────────────────
+#  Playback
+# ─────────────────────────────────────────────────────────────
+class GhostRun:
+    ALPHA = 90
+
+    def __init__(self, seed, score, y, pose):
+        self.seed     = seed
+        self.score    = score
+        self.y        = y               # (frames,) feet y
+        self.pose     = pose            # (frames,) pose codes
+        self._sprites = None            # palette sprite per pose code
+
+    @classmethod
+    def load(cls, path=GHOST_FILE):
+        """The saved ghost, or None if there is none (or it is unreadable)."""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(HEADER.size)
+            magic, version, seed, frames, score, y0 = HEADER.unpack(head)
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC or version != VERSION or not frames:
+            return None
+        rec  = np.memmap(path, RECORD, "r", HEADER.size, (frames,))
+        y    = np.cumsum(rec["dy"], dtype=np.int32) + y0
+        pose = np.array(rec["pose"])
+        del rec                         # unmap
+        return cls(seed, score, y, pose)
+
+    def __len__(self):
+        return len(self.y)
+
+    def _build_sprites(self):
+        # own copies of the dino poses, so the alpha stays off the player's;
+        # colours follow the theme through the shared palette
+        sprites = []
+        for pose in range(POSE_DUCK_B + 1):
+            phase = (Dino.PHASE_JUMP if pose == POSE_JUMP else
+                     int(pose in (POSE_RUN_B, POSE_DUCK_B)))
+            s = Dino.bake(pose >= POSE_DUCK_A, phase)
+            s.set_alpha(self.ALPHA)
+            sprites.append(s)
+        return sprites
+
+    def draw(self, screen, frame, x, k=1):
+        """Blit the ghost as it was after `frame` updates (one blit);
+        k is the render scale of `screen`."""
+        if not 0 <= frame < len(self.y):
+            return
+        if self._sprites is None:
+            self._sprites = self._build_sprites()
+        screen.blit(PALETTE.scaled(self._sprites[self.pose[frame]], k),
+                    (int((x - Dino.PAD_X) * k),
+                     int((int(self.y[frame]) - Dino.PAD_Y) * k)))
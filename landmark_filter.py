@@ -0,0 +1,129 @@
+"""
+Landmark filters — smooth the (N, 3) landmark array of each inference and
+predict it to any later time, so a 60 FPS game gets a fresh estimate every
+frame from a 30 FPS camera.
+
+    python main.py --filter one_euro    # default (config.LANDMARK_FILTER)
+    python main.py --filter kalman
+    python main.py --filter none        # raw landmarks, classified per frame
+
+Both filters treat every coordinate of every landmark independently and
+update the whole array with a handful of numpy ops:
+
+    f = FILTERS["kalman"]()
+    f.correct(t, lm)            # one inference at time t
+    f.predict(t + 1 / 60)       # estimate for a game frame in between
+"""
+import math
+
+import numpy as np
+
+
+class LandmarkFilter:
+    """Filtered landmarks and velocity at the last measurement time."""
+    MAX_LEAD  = 0.05    # s past the last measurement predictions may reach
+    RESET_GAP = 0.5     # s without a measurement restarts the filter
+
+    def __init__(self):
+        self.t   = None         # time of the last measurement
+        self.x   = None         # filtered landmarks at self.t
+        self.v   = None         # their velocity, units per second
+        self.out = None         # predict()'s buffer
+
+    def reset(self):
+        self.t = None
+
+    def correct(self, t, lm):
+        """Fold in landmarks measured at time t; returns the estimate."""
+        if self.t is None or self.x.shape != lm.shape \
+                or t - self.t > self.RESET_GAP:
+            self.x   = np.array(lm, float)
+            self.v   = np.zeros_like(self.x)
+            self.out = np.empty_like(self.x)
+            self._start()
+        elif t > self.t:
+            self._correct(t - self.t, lm)
+        self.t = t
+        return self.x
+
+    def predict(self, t):
+        """Estimate at time t (extrapolated at most MAX_LEAD)."""
+        dt = min(max(t - self.t, 0.0), self.MAX_LEAD)
+        np.multiply(self.v, dt, out=self.out)
+        self.out += self.x
+        return self.out
+
+    def _start(self):
+        pass
+
+    def _correct(self, dt, lm):
+        raise NotImplementedError
+
+
+# ─────────────────────────────────────────────────────────────
+#  ONE-EURO  (Casiez et al., CHI 2012)
+# ─────────────────────────────────────────────────────────────
+class OneEuroFilter(LandmarkFilter):
+    """
+    A low-pass filter whose cutoff rises with speed: MIN_CUTOFF Hz when the
+    hand is still (no jitter), plus BETA Hz per unit/s of filtered speed
+    (little lag while it moves).  Velocity is itself low-passed at D_CUTOFF.
+    """
+    MIN_CUTOFF = 1.0    # Hz
+    BETA       = 60.0   # Hz per (normalized unit / s)
+    D_CUTOFF   = 4.0    # Hz
+
+    @staticmethod
+    def _alpha(dt, cutoff):
+        return dt / (dt + 1.0 / (2.0 * math.pi * cutoff))
+
+    def _correct(self, dt, lm):
+        raw = (lm - self.x) / dt
+        self.v += self._alpha(dt, self.D_CUTOFF) * (raw - self.v)
+        cutoff  = self.MIN_CUTOFF + self.BETA * np.abs(self.v)
+        self.x += self._alpha(dt, cutoff) * (lm - self.x)
+
+
+# ─────────────────────────────────────────────────────────────
+#  KALMAN  (constant velocity)
+# ─────────────────────────────────────────────────────────────
+class KalmanFilter(LandmarkFilter):
+    """
+    State (position, velocity) per coordinate, white-noise acceleration of
+    spectral density ACCEL, measurement noise NOISE (std, normalized units).
+    Every coordinate sees the same time steps and noise, so all of them
+    share one 2x2 covariance: the gain is computed once per measurement as
+    scalars and applied to the whole array.
+    """
+    ACCEL = 1.0         # units^2 / s^3
+    NOISE = 0.004       # units
+    V0    = 1.0         # initial velocity std, units / s
+
+    def _start(self):
+        self.p00, self.p01, self.p11 = self.NOISE ** 2, 0.0, self.V0 ** 2
+
+    def _correct(self, dt, lm):
+        # predict the covariance dt ahead
+        q = self.ACCEL
+        p11 = self.p11 + q * dt
+        p01 = self.p01 + dt * self.p11 + q * dt * dt / 2
+        p00 = (self.p00 + dt * (2 * self.p01 + dt * self.p11)
+               + q * dt ** 3 / 3)
+        # update with one measurement of the position
+        s      = p00 + self.NOISE ** 2
+        k0, k1 = p00 / s, p01 / s
+        self.p11 = p11 - k1 * p01
+        self.p01 = p01 * (1 - k0)
+        self.p00 = p00 * (1 - k0)
+
+        self.x += self.v * dt
+        y       = lm - self.x
+        self.x += k0 * y
+        self.v += k1 * y
+
+
+FILTERS = {
+    "none":     None,
+    "one_euro": OneEuroFilter,
+    "kalman":   KalmanFilter,
+}
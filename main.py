@@ -2,12 +2,23 @@ import pygame
 import numpy as np
 import random
 import math
-import cv2
+import time
+from functools import partial
 
 from config  import *
 from dino    import Dino
-from obstacles import ObstacleManager
-from gesture_controller import GestureController
+from obstacles import ObstacleManager, KIND_BIRD
+from gesture_controller import (GestureController, GestureLoader,
+                                EV_BEGIN, GESTURE_DUCK, GESTURE_JUMP)
+from gesture_service import GestureSubscriber
+from broadcast import Broadcaster
+from ghost import GhostRecorder, GhostRun
+from autopilot import Autopilot
+from perf import Perf, FRAME_BUDGET_MS
+from quality import QualityGovernor, FEATURES, TIERS
+from palette import PALETTE, INDEX, THEME_BLEND
+from tracing import TRACER
+from stats_store import StatsStore
 
 
 # ─────────────────────────────────────────────────────────────
@@ -88,60 +99,101 @@ class Stars:
             for _ in range(n)
         ]
 
-    def draw(self, screen, alpha):
+    def draw(self, screen, alpha, k=1):
         if alpha < 0.05:
             return
         for sx, sy, size in self.stars:
-            r = max(1, int(size))
+            r = max(1, int(size * k))
             a = int(alpha * 255)
             s = pygame.Surface((r*2+2, r*2+2), pygame.SRCALPHA)
             pygame.draw.circle(s, (220, 220, 255, a), (r+1, r+1), r)
-            screen.blit(s, (sx - r, sy - r))
+            screen.blit(s, (int(sx * k) - r, int(sy * k) - r))
 
 
 # ─────────────────────────────────────────────────────────────
 #  GROUND  (animated dashes)
 # ─────────────────────────────────────────────────────────────
 class Ground:
+    STRIP_W   = WIDTH + 120     # two dash periods of slack
+    PEBBLE_P  = WIDTH + 20      # pebble wrap period
+    PEBBLE_Y  = GROUND_Y + 6    # top of the pebble strip
+
     def __init__(self):
         self.offset   = 0.0
+        self.layers   = True        # False: line and dots only (low tiers)
+        self.show_pebbles = True
         self.pebbles  = [(random.randint(0, WIDTH),
                           random.randint(GROUND_Y + 12, GROUND_Y + 34),
                           random.randint(2, 5))
                          for _ in range(40)]
+        # palette sprites: layers + line + dashes, and the pebbles twice
+        # over so a wrapped pebble is one blit away
+        gy = GROUND_Y
+        self._strip   = PALETTE.bake(
+            lambda s: self._render(s, INDEX, self.STRIP_W),
+            (0, gy, self.STRIP_W, HEIGHT - gy))
+        self._strip.set_colorkey(None)
+        self._pebbles = PALETTE.bake(
+            self._render_pebbles,
+            (0, self.PEBBLE_Y, 2 * self.PEBBLE_P, 36))
 
     def update(self, speed):
         self.offset = (self.offset + speed) % 60
 
-    def draw(self, screen, t):
+    def draw(self, screen, t, k=1):
+        if not self.layers:
+            self._draw_flat(screen, t, k)
+            return
+        # a dash at i*60 - offset lands on i*60 - ceil(offset) once truncated
+        screen.blit(PALETTE.scaled(self._strip, k),
+                    (int((-60 - math.ceil(self.offset)) * k), int(GROUND_Y * k)))
+        # Pebbles (shift with speed)
+        if self.show_pebbles:
+            screen.blit(PALETTE.scaled(self._pebbles, k),
+                        (int((-(int(self.offset) // 2) - 10) * k),
+                         int(self.PEBBLE_Y * k)))
+
+    @staticmethod
+    def _render(screen, t, w):
+        """Layered ground over [0, w) px, dashes every 60 px from x=0."""
         gy = GROUND_Y
 
         # ── layered ground ──────────────────────────────
         # Grass strip
         pygame.draw.rect(screen, t["ground_top"],
-                         (0, gy, WIDTH, 10))
+                         (0, gy, w, 10))
         # Dirt
         pygame.draw.rect(screen, t["ground_mid"],
-                         (0, gy + 10, WIDTH, 20))
+                         (0, gy + 10, w, 20))
         # Sub-soil
         pygame.draw.rect(screen, t["ground_bot"],
-                         (0, gy + 30, WIDTH, HEIGHT - gy - 30))
+                         (0, gy + 30, w, HEIGHT - gy - 30))
 
         # Ground line
         pygame.draw.line(screen, t["ground_top"],
-                         (0, gy), (WIDTH, gy), 2)
+                         (0, gy), (w, gy), 2)
 
-        # Animated dashes on grass
+        # Dashes on grass
         dc = t["dash"]
-        for i in range(-1, WIDTH // 60 + 2):
-            dx = int(i * 60 - self.offset)
+        for dx in range(0, w, 60):
             pygame.draw.line(screen, dc,
                              (dx, gy + 3), (dx + 28, gy + 3), 2)
 
-        # Pebbles (shift with speed)
-        for idx, (px, py, pr) in enumerate(self.pebbles):
-            nx = (px - int(self.offset) // 2) % (WIDTH + 20) - 10
-            pygame.draw.circle(screen, t["ground_mid"], (nx, py), pr)
+    def _render_pebbles(self, screen):
+        for px, py, pr in self.pebbles:
+            for nx in (px, px + self.PEBBLE_P):
+                pygame.draw.circle(screen, INDEX["ground_mid"], (nx, py), pr)
+
+    def _draw_flat(self, screen, t, k=1):
+        gy = GROUND_Y * k
+        c  = t["ground_top"]
+        pygame.draw.line(screen, c, (0, gy), (WIDTH * k, gy), max(1, round(2 * k)))
+        for i in range(-1, WIDTH // 60 + 2):
+            dx = int(i * 60 - self.offset) * k
+            pygame.draw.line(screen, c, (dx, gy + 6 * k), (dx + 22 * k, gy + 6 * k), 1)
+        for i in range(-1, WIDTH // 40 + 2):
+            dx = (int(i * 40 - self.offset * 0.5) % (WIDTH + 40) - 20) * k
+            pygame.draw.circle(screen, c, (dx, gy + 12 * k), 1)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -157,6 +209,18 @@ class Clouds:
              "spd": random.uniform(0.4, 1.0)}
             for _ in range(7)
         ]
+        for cl in self.clouds:
+            self._bake(cl)
+
+    @staticmethod
+    def _bake(cl):
+        # one palette sprite per live cloud, rebuilt when it respawns
+        w, h = cl["w"], cl["h"]
+        pad  = h // 2 + 4                       # puffs rise h/4 above y
+        cl["pad"]    = pad
+        cl["sprite"] = PALETTE.bake(
+            lambda s: Clouds._render(s, INDEX, pad, pad, w, h),
+            (0, 0, w + 2 * pad, h + 2 * pad))
 
     def update(self, speed):
         for cl in self.clouds:
@@ -166,24 +230,31 @@ class Clouds:
                 cl["y"]   = random.randint(55, 180)
                 cl["w"]   = random.randint(70, 130)
                 cl["spd"] = random.uniform(0.4, 1.0)
+                self._bake(cl)
 
-    def draw(self, screen, t):
+    def draw(self, screen, t, k=1):
+        for cl in self.clouds:
+            pad = cl["pad"]
+            screen.blit(PALETTE.scaled(cl["sprite"], k),
+                        (int((int(cl["x"]) - pad) * k),
+                         int((int(cl["y"]) - pad) * k)))
+
+    @staticmethod
+    def _render(screen, t, x, y, w, h):
         c  = t["cloud"]
         cs = t["cloud_shadow"]
-        for cl in self.clouds:
-            x, y, w, h = int(cl["x"]), int(cl["y"]), cl["w"], cl["h"]
-            # shadow
-            pygame.draw.ellipse(screen, cs,
-                                (x + 4, y + 6, w, h // 2 + 4))
-            # main puffs
-            pygame.draw.ellipse(screen, c,
-                                (x, y + h // 3, w, h * 2 // 3))
-            pygame.draw.circle(screen, c,
-                               (x + w // 3, y + h // 2), h // 2)
-            pygame.draw.circle(screen, c,
-                               (x + w * 2 // 3, y + h // 2), h // 2 - 2)
-            pygame.draw.circle(screen, c,
-                               (x + w // 2, y + h // 4 + 2), h // 2 + 2)
+        # shadow
+        pygame.draw.ellipse(screen, cs,
+                            (x + 4, y + 6, w, h // 2 + 4))
+        # main puffs
+        pygame.draw.ellipse(screen, c,
+                            (x, y + h // 3, w, h * 2 // 3))
+        pygame.draw.circle(screen, c,
+                           (x + w // 3, y + h // 2), h // 2)
+        pygame.draw.circle(screen, c,
+                           (x + w * 2 // 3, y + h // 2), h // 2 - 2)
+        pygame.draw.circle(screen, c,
+                           (x + w // 2, y + h // 4 + 2), h // 2 + 2)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -203,7 +274,7 @@ class Mountains:
     def update(self, speed):
         self.offset += speed * 0.12
 
-    def draw(self, screen, t):
+    def draw(self, screen, t, k=1):
         c1 = t["mountain1"]
         c2 = t["mountain2"]
         gy = GROUND_Y
@@ -213,11 +284,11 @@ class Mountains:
             pts = []
             for px, py in peaks:
                 x = (px - off) % (WIDTH + 360) - 180
-                pts.append((x, py))
+                pts.append((x * k, py * k))
 
             # Sort by x, add ground corners
             pts.sort(key=lambda p: p[0])
-            poly = [(0, gy)] + pts + [(WIDTH, gy)]
+            poly = [(0, gy * k)] + pts + [(WIDTH * k, gy * k)]
             if len(poly) >= 3:
                 pygame.draw.polygon(screen, c, poly)
 
@@ -226,15 +297,23 @@ class Mountains:
 #  SCORE HUD
 # ─────────────────────────────────────────────────────────────
 class ScoreHUD:
+    NOTICE_T = 180          # frames a notice stays under the score
+
     def __init__(self):
         self.font_score = pygame.font.SysFont("couriernew", 22, bold=True)
         self.font_hi    = pygame.font.SysFont("couriernew", 14, bold=True)
         self._flash_t   = 0
         self._prev_100  = 0
+        self._notice    = None
+        self._notice_t  = 0
 
     def notify_milestone(self):
         self._flash_t = 40
 
+    def notice(self, text):
+        """Show a line of text (saved file paths) under the score."""
+        self._notice, self._notice_t = text, self.NOTICE_T
+
     def update(self, score):
         m = int(score) // 100
         if m > self._prev_100:
@@ -259,6 +338,94 @@ class ScoreHUD:
         screen.blit(hi_surf, (rx - hi_surf.get_width() - 14, 18))
         screen.blit(sc_surf, (rx - sc_surf.get_width() - 14, 36))
 
+        # counts down while drawn, so it also shows on the title / game over
+        if self._notice_t > 0:
+            self._notice_t -= 1
+            n_surf = self.font_hi.render(self._notice, True, hc)
+            screen.blit(n_surf, (rx - n_surf.get_width() - 14, 64))
+
+
+# ─────────────────────────────────────────────────────────────
+#  PERF HUD  (toggle with F3, sits left of the score)
+# ─────────────────────────────────────────────────────────────
+class PerfHUD:
+    W      = 236
+    X      = CAM_X - 20 - 120 - W
+    Y      = 14
+    ROW_H  = 14
+    GRAPH_H = 40
+    GAUGES = [
+        ("backend",     "backend",     "{}"),
+        ("camera_fps",  "cam fps",     "{:.1f}"),
+        ("infer_fps",   "infer fps",   "{:.1f}"),
+        ("infer_ms",    "infer ms",    "{:.1f}"),
+        ("dropped",     "dropped",     "{:d}"),
+        ("idle_skip",   "idle skip",   "{:d}"),
+        ("still_skip",  "still skip",  "{:.0%}"),
+        ("mode",        "mode",        "{}"),
+        ("pred_fired",  "predicted",   "{:d}"),
+        ("pred_hit",    "confirmed",   "{:d}"),
+        ("pred_rollbk", "rolled back", "{:d}"),
+        ("pred_lead",   "lead ms",     "{:.0f}"),
+        ("rec_fps",     "rec fps",     "{:.1f}"),
+        ("rec_ms",      "encode ms",   "{:.1f}"),
+        ("rec_dropped", "rec dropped", "{:d}"),
+        ("quality",     "quality",     "{}"),
+    ]
+
+    def __init__(self):
+        self.font = pygame.font.SysFont("couriernew", 12, bold=True)
+
+    def draw(self, screen, t, perf, fps):
+        rows = len(perf.times) + sum(1 for k, *_ in self.GAUGES
+                                     if k in perf.gauges)
+        h    = 22 + self.GRAPH_H + 8 + rows * self.ROW_H + 8
+        x, y = self.X, self.Y
+        screen.blit(surf_rounded(self.W, h, 10, t["panel_bg"], 210), (x, y))
+        tc, hc = t["score_text"], t["hi_text"]
+
+        frames = perf.frame_ms
+        last   = frames[-1] if frames else 0.0
+        head   = self.font.render(f"FPS {fps:5.1f}   frame {last:5.1f} ms",
+                                  True, tc)
+        screen.blit(head, (x + 8, y + 6))
+
+        # frame-time graph, budget line at 16.6 ms, full height = 2x budget
+        gx, gy = x + 8, y + 22
+        gw, gh = self.W - 16, self.GRAPH_H
+        pygame.draw.rect(screen, t["go_sub"], (gx, gy, gw, gh), 1)
+        scale = gh / (FRAME_BUDGET_MS * 2)
+        by    = gy + gh - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(screen, hc, (gx, by), (gx + gw - 1, by), 1)
+        n = min(len(frames), gw - 2)
+        for i in range(n):
+            ms  = frames[len(frames) - n + i]
+            bar = min(gh - 2, int(ms * scale))
+            col = hc if ms > FRAME_BUDGET_MS else tc
+            px  = gx + 1 + i
+            pygame.draw.line(screen, col, (px, gy + gh - 1), (px, gy + gh - 1 - bar))
+
+        # per-section times with a bar against the frame budget
+        ry = gy + gh + 8
+        for name, ms in perf.times.items():
+            col = hc if ms > FRAME_BUDGET_MS * 0.25 else tc
+            self._row(screen, ry, name, f"{ms:.2f}", col)
+            bw = min(80, int(80 * ms / FRAME_BUDGET_MS))
+            if bw > 0:
+                pygame.draw.rect(screen, col, (x + self.W - 88, ry + 4, bw, 6))
+            ry += self.ROW_H
+
+        for key, label, fmt in self.GAUGES:
+            if key in perf.gauges:
+                self._row(screen, ry, label, fmt.format(perf.gauges[key]), tc)
+                ry += self.ROW_H
+
+    def _row(self, screen, y, label, value, col):
+        lbl = self.font.render(label, True, col)
+        val = self.font.render(value, True, col)
+        screen.blit(lbl, (self.X + 8, y))
+        screen.blit(val, (self.X + 130 - val.get_width(), y))
+
 
 # ─────────────────────────────────────────────────────────────
 #  GESTURE HUD  (bottom left pill)
@@ -297,6 +464,43 @@ class GestureHUD:
             screen.blit(s, (x, ry))
 
 
+# ─────────────────────────────────────────────────────────────
+#  CAMERA VIEW  (picture-in-picture)
+# ─────────────────────────────────────────────────────────────
+class CameraView:
+    """
+    The gesture preview, resized into one persistent RGB buffer that the
+    surface views directly (no make_surface, no transpose).  It is resized
+    only when the controller has a new frame; other game frames blit it
+    as it is.
+    """
+
+    def __init__(self, w=CAM_W, h=CAM_H):
+        self.size   = (w, h)
+        self.buf    = np.zeros((h, w, 3), np.uint8)
+        self.surf   = pygame.image.frombuffer(self.buf, self.size, "RGB")
+        self._frame = None
+        self._seq   = None
+
+    def draw(self, screen, ctrl, pos, border):
+        """Blit ctrl's preview at pos (top left); False if it has none."""
+        frame = ctrl.get_frame()
+        if frame is None:
+            return False
+        seq = getattr(ctrl, "seq", None)    # the controller reuses its buffer
+        if frame is not self._frame or seq != self._seq:
+            import cv2      # already loaded by the gesture engine
+
+            cv2.resize(frame, self.size, self.buf)
+            self._frame, self._seq = frame, seq
+        x, y = pos
+        w, h = self.size
+        pygame.draw.rect(screen, border, (x - 3, y - 3, w + 6, h + 6),
+                         border_radius=10)
+        screen.blit(self.surf, pos)
+        return True
+
+
 # ─────────────────────────────────────────────────────────────
 #  PARTICLE SYSTEM  (dust on jump/land, death flash)
 # ─────────────────────────────────────────────────────────────
@@ -316,11 +520,43 @@ class Particle:
         self.vy  += 0.25
         self.life -= 1
 
-    def draw(self, screen):
+    def draw(self, screen, k=1):
         a = max(0, int(255 * self.life / 32))
-        s = pygame.Surface((self.r*2, self.r*2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, a), (self.r, self.r), self.r)
-        screen.blit(s, (int(self.x) - self.r, int(self.y) - self.r))
+        r = max(1, int(self.r * k))
+        s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
+        pygame.draw.circle(s, (*self.color, a), (r, r), r)
+        screen.blit(s, (int(self.x * k) - r, int(self.y * k) - r))
+
+
+# ─────────────────────────────────────────────────────────────
+#  TITLE SCREEN  (shown while the gesture engine loads)
+# ─────────────────────────────────────────────────────────────
+class TitleScreen:
+    def __init__(self):
+        self.font_big = pygame.font.SysFont("couriernew", 36, bold=True)
+        self.font_sm  = pygame.font.SysFont("couriernew", 14)
+        self._tick    = 0
+
+    def draw(self, screen, t, status, loading):
+        self._tick += 1
+        pw, ph = 440, 190
+        px = WIDTH // 2 - pw // 2
+        py = GROUND_Y // 2 - ph // 2 - 20
+        screen.blit(surf_rounded(pw, ph, 20, t["panel_bg"], 220), (px, py))
+
+        tc, sc = t["go_title"], t["go_sub"]
+        g1 = self.font_big.render("GESTURE  DINO", True, tc)
+        screen.blit(g1, (WIDTH//2 - g1.get_width()//2, py + 22))
+        pygame.draw.line(screen, sc,
+                         (px + 30, py + 78), (px + pw - 30, py + 78), 1)
+
+        hint = self.font_sm.render("SPACE  or  👆 L-shape  to start", True, tc)
+        screen.blit(hint, (WIDTH//2 - hint.get_width()//2, py + 98))
+
+        if loading:
+            status += "." * (self._tick // 20 % 4)
+        st = self.font_sm.render(status, True, sc)
+        screen.blit(st, (WIDTH//2 - st.get_width()//2, py + ph - 44))
 
 
 # ─────────────────────────────────────────────────────────────
@@ -336,12 +572,12 @@ class GameOverScreen:
     def reset(self):
         self._anim_t = 0
 
-    def draw(self, screen, t, score, hi_score):
+    def draw(self, screen, t, score, hi_score, summary=None):
         self._anim_t = min(self._anim_t + 1, 30)
         alpha        = int(220 * self._anim_t / 30)
 
-        # Panel
-        pw, ph = 440, 210
+        # Panel (taller when there is saved history to show)
+        pw, ph = 440, 210 if summary is None else 262
         px = WIDTH // 2 - pw // 2
         py = GROUND_Y // 2 - ph // 2 - 20
 
@@ -375,6 +611,18 @@ class GameOverScreen:
         screen.blit(hi_lbl, (WIDTH//2 + 20, py + 92))
         screen.blit(hi_val, (WIDTH//2 + 20, py + 110))
 
+        # Saved history: today's runs and the all-time top three
+        if summary is not None:
+            runs, best, _ = summary["today"]
+            today = self.font_sm.render(
+                f"TODAY  {runs} runs  best {int(best or 0):05d}", True, sc)
+            screen.blit(today, (WIDTH//2 - today.get_width()//2, py + 150))
+            top = "   ".join(f"{i + 1}. {int(row[0]):05d}"
+                             for i, row in enumerate(summary["top"][:3]))
+            if top:
+                top = self.font_sm.render(top, True, hc)
+                screen.blit(top, (WIDTH//2 - top.get_width()//2, py + 172))
+
         # Restart hint
         hint = self.font_sm.render(
             "👆 L-shape  or  SPACE  to restart", True, sc)
@@ -385,117 +633,253 @@ class GameOverScreen:
 #  MAIN GAME
 # ─────────────────────────────────────────────────────────────
 class Game:
-    def __init__(self):
+    AUTO_RESTART = 90       # frames on the game-over screen before the bot restarts
+
+    def __init__(self, autopilot=False, latency=0, camera=True, perf=False,
+                 trace=False, stats=True, predict=False,
+                 backend=GESTURE_BACKEND, service=None, record=False,
+                 ghost=False, quality=QUALITY, day_night=DAY_NIGHT,
+                 render_scale=RENDER_SCALE, show_camera=SHOW_CAMERA,
+                 landmark_filter=LANDMARK_FILTER):
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Gesture Dino  🦕")
         self.clock  = pygame.time.Clock()
-
-        # subsystems
-        self.gesture   = GestureController()
+        TRACER.enabled = trace      # before any thread that records spans
+
+        # subsystems (camera=False: keyboard only, no webcam / MediaPipe).
+        # The gesture engine loads in the background; keyboard works at once.
+        # service: subscribe to a running gesture_service.py instead.
+        self.gesture   = None
+        factory        = (partial(GestureSubscriber, service) if service else
+                          partial(GestureController, backend,
+                                  predictive=predict,
+                                  landmark_filter=landmark_filter))
+        self._loader   = GestureLoader(factory) if camera else None
+        self.gesture_status = ("loading gesture engine" if camera
+                               else "keyboard only")
         self.dino      = Dino()
-        self.obstacles = ObstacleManager()
+        self.ghost     = GhostRun.load() if ghost else None
+        self.ghost_rec = GhostRecorder() if ghost else None
+        self.obstacles = ObstacleManager(background=True,
+                                         seed=self._course_seed())
         self.ground    = Ground()
         self.clouds    = Clouds()
         self.mountains = Mountains()
         self.stars     = Stars()
         self.score_hud = ScoreHUD()
+        self.perf      = Perf(enabled=perf, tracer=TRACER)
+        self.perf_hud  = PerfHUD()
         self.gesture_hud = GestureHUD()
         self.go_screen = GameOverScreen()
+        self.title     = TitleScreen()
         self.toggle    = ThemeToggle()
+        self.cam_view  = CameraView()
+        self.show_camera = show_camera
+        self.font_cam  = pygame.font.SysFont("couriernew", 12)
+        self.autopilot = Autopilot(latency) if autopilot else None
+        self._latency  = latency
+        self.stats     = StatsStore() if stats else None
+        self.broadcast = None       # spectator recorder, created on first use
+        self.quality   = QualityGovernor(quality)
+        self.render_scale = 1.0
+        self.scene     = self.screen    # scene stages' target, see set_render_scale
 
         # game state
         self.theme_name   = "light"
-        self.theme        = THEMES["light"]
+        self.theme        = THEME_BLEND[0]
         self._dark_alpha  = 0.0     # 0=light, 1=dark (smooth blend)
+        self.day_night    = day_night   # s per day/night cycle, 0: manual
+        self._sky_t       = 0       # frames into the cycle
+        PALETTE.set_step(0)
         self.score        = 0.0
         self.hi_score     = 0.0
         self.speed        = SPEED_START
         self.game_over    = False
+        self.started      = autopilot
         self.running      = True
         self._particles   : list[Particle] = []
-        self._prev_jump   = False
-        self._prev_duck   = False
+        self._gesture_duck = False  # between duck begin / end events
         self._on_ground_last = True
+        self._over_frames = 0
+        self._frames      = 0       # frames played this run
+        self._counts      = dict.fromkeys(
+            ("gesture_jumps", "gesture_ducks", "key_jumps"), 0)
+        self._apply_quality()
+        self.set_render_scale(render_scale)
+        if self.ghost_rec:
+            self.ghost_rec.reset(self.obstacles.seed)
+        if record:
+            self._toggle_recording()
 
     # ── theme ─────────────────────────────────────────────────
     def _toggle_theme(self):
+        if self.day_night:
+            # skip to the other half of the cycle
+            self._sky_t += int(self.day_night * FPS / 2)
+            return
         if self.theme_name == "light":
             self.theme_name = "dark"
         else:
             self.theme_name = "light"
-        self.theme = THEMES[self.theme_name]
         self.toggle.set_theme(self.theme_name == "dark")
 
+    def _update_sky(self):
+        # the dark share eases toward the theme, or follows the cycle;
+        # sprites (palettes) and primitives (theme dict) show the same step
+        if self.day_night:
+            self._sky_t += 1
+            phase = self._sky_t / (self.day_night * FPS)
+            self._dark_alpha = 0.5 - 0.5 * math.cos(2 * math.pi * phase)
+            dark = self._dark_alpha > 0.5
+            if dark != (self.theme_name == "dark"):
+                self.theme_name = "dark" if dark else "light"
+                self.toggle.set_theme(dark)
+        else:
+            target_dark = 1.0 if self.theme_name == "dark" else 0.0
+            self._dark_alpha += (target_dark - self._dark_alpha) * 0.06
+        step = PALETTE.step_of(self._dark_alpha)
+        PALETTE.set_step(step)
+        self.theme = THEME_BLEND[step]
+
+    def _toggle_autopilot(self):
+        if self.autopilot:
+            self.autopilot = None
+        else:
+            self.autopilot = Autopilot(self._latency)
+
     # ── gradient sky ──────────────────────────────────────────
     def _draw_sky(self):
         t   = self.theme
         top = t["sky_top"]
         bot = t["sky_bottom"]
-        for y in range(GROUND_Y):
-            frac = y / GROUND_Y
+        if not self.quality.has("sky_gradient"):
+            self.scene.fill(lerp_color(top, bot, 0.5))
+            return
+        gy, w = int(GROUND_Y * self.render_scale), self.scene.get_width()
+        for y in range(gy):
+            frac = y / gy
             col  = lerp_color(top, bot, frac)
-            pygame.draw.line(self.screen, col, (0, y), (WIDTH, y))
+            pygame.draw.line(self.scene, col, (0, y), (w, y))
 
     # ── sun / moon ────────────────────────────────────────────
     def _draw_sun(self):
         t = self.theme
-        sx, sy = 90, 70
+        k = self.render_scale
+        sx, sy = int(90 * k), int(70 * k)
+        r = int(40 * k)
         # glow
-        glow = surf_rounded(80, 80, 40, t["sun_glow"], 80)
-        self.screen.blit(glow, (sx - 40, sy - 40))
+        glow = surf_rounded(2 * r, 2 * r, r, t["sun_glow"], 80)
+        self.scene.blit(glow, (sx - r, sy - r))
         # body
-        pygame.draw.circle(self.screen, t["sun"], (sx, sy), 26)
+        pygame.draw.circle(self.scene, t["sun"], (sx, sy), int(26 * k))
+
+    # ── render scale ──────────────────────────────────────────
+    def set_render_scale(self, k):
+        """Draw the scene at k x the window resolution (0.25..1) and scale it
+        up in one pass; the HUD, camera and overlays stay at full size."""
+        k = min(1.0, max(0.25, float(k)))
+        self.render_scale = k
+        if k == 1.0:
+            self.scene = self.screen
+        else:
+            size = (round(WIDTH * k), round(HEIGHT * k))
+            self.scene = pygame.Surface(size, 0, self.screen)
+        self.draw_stages = self._build_draw_stages()
+
+    def _draw_upscale(self):
+        pygame.transform.scale(self.scene, self.screen.get_size(), self.screen)
 
     # ── camera PiP ────────────────────────────────────────────
     def _draw_camera(self):
-        frame = self.gesture.get_frame()
-        if frame is None:
+        if self.gesture is None:
             return
-        try:
-            small = cv2.resize(frame, (CAM_W, CAM_H))
-            surf  = pygame.surfarray.make_surface(
-                        np.transpose(small, (1, 0, 2)))
-
-            border = self.theme["ground_top"]
-            # outer border / rounded effect
-            pygame.draw.rect(self.screen, border,
-                             (CAM_X - 3, CAM_Y - 3,
-                              CAM_W + 6, CAM_H + 6),
-                             border_radius=10)
-            self.screen.blit(surf, (CAM_X, CAM_Y))
-
-            # label
-            font = pygame.font.SysFont("couriernew", 12)
-            lbl  = font.render("GESTURE CAM", True, self.theme["hint_text"])
+        if self.cam_view.draw(self.screen, self.gesture, (CAM_X, CAM_Y),
+                              self.theme["ground_top"]):
+            lbl = self.font_cam.render("GESTURE CAM", True,
+                                       self.theme["hint_text"])
             self.screen.blit(lbl, (CAM_X, CAM_Y + CAM_H + 3))
-        except Exception:
-            pass
+
+    def _toggle_camera(self):
+        # hidden: the controller skips annotating, the stage is left out
+        self.show_camera = not self.show_camera
+        if self.gesture:
+            self.gesture.preview = self.show_camera
+        self.draw_stages = self._build_draw_stages()
 
     # ── input ─────────────────────────────────────────────────
-    def _handle_input(self):
-        self.gesture.update()
+    def _adopt_gesture(self):
+        loader, self._loader = self._loader, None
+        ctrl = loader.controller
+        if loader.error is not None:
+            self.gesture_status = "gestures unavailable — keyboard only"
+        elif not ctrl.has_camera:
+            ctrl.close()
+            self.gesture_status = "no camera — keyboard only"
+        else:
+            self.gesture        = ctrl
+            self.gesture.preview = self.show_camera
+            self.gesture_status = "gestures ready"
+
+    def _press_jump(self, counter=None):
+        if not self.started:
+            self.started = True
+        elif self.game_over:
+            self._restart()
+        else:
+            self.dino.jump()
+            if counter:
+                self._counts[counter] += 1
+
+    def _gesture_events(self):
+        # player 1's begin / end events in order; True to duck this frame
+        # (also for a fist that began and ended since the last frame)
+        began = False
+        for kind, code, player, _, _ in self.gesture.events.drain():
+            if player:
+                continue
+            if code == GESTURE_JUMP and kind == EV_BEGIN:
+                self._press_jump("gesture_jumps")
+            elif code == GESTURE_DUCK:
+                self._gesture_duck = kind == EV_BEGIN
+                began |= self._gesture_duck
+                if self._gesture_duck and self.started and not self.game_over:
+                    self._counts["gesture_ducks"] += 1
+        return began or self._gesture_duck
 
-        jump_now = self.gesture.is_jump()
-        duck_now = self.gesture.is_duck()
+    def _handle_input(self):
+        if self._loader and self._loader.ready:
+            self._adopt_gesture()
+        if self.stats and self.stats.summary:
+            self.hi_score = max(self.hi_score, self.stats.summary["hi"])
 
-        # Rising edge for jump
-        if jump_now and not self._prev_jump:
-            if self.game_over:
-                self._restart()
-            else:
-                self.dino.jump()
+        duck_now = False
+        if self.gesture:
+            with self.perf.section("gesture"):
+                self.gesture.update()
+            duck_now = self._gesture_events()
 
         # Duck continuously while fist
-        if not self.game_over:
+        if self.started and not self.game_over:
             self.dino.set_duck(duck_now)
 
-        self._prev_jump = jump_now
-        self._prev_duck = duck_now
+        # Autopilot overrides the gesture ducking and restarts by itself
+        if self.autopilot:
+            self.started = True
+            if self.game_over:
+                self._over_frames += 1
+                if self._over_frames > self.AUTO_RESTART:
+                    self._restart()
+            else:
+                jump, duck = self.autopilot.act(self.dino, self.obstacles,
+                                                self.speed)
+                if jump:
+                    self.dino.jump()
+                self.dino.set_duck(duck)
 
         # Keyboard
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_DOWN] and not self.game_over:
+        if keys[pygame.K_DOWN] and self.started and not self.game_over:
             self.dino.set_duck(True)
 
         for event in pygame.event.get():
@@ -506,10 +890,21 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 if event.key in (pygame.K_SPACE, pygame.K_UP):
-                    if self.game_over:
-                        self._restart()
-                    else:
-                        self.dino.jump()
+                    self._press_jump("key_jumps")
+
+                if event.key == pygame.K_a:
+                    self._toggle_autopilot()
+                if event.key == pygame.K_c:
+                    self._toggle_camera()
+                if event.key == pygame.K_F3:
+                    self.perf.toggle()
+                if event.key == pygame.K_F4:
+                    self.quality.cycle()
+                    self._apply_quality()
+                if event.key == pygame.K_F9:
+                    self._dump_trace()
+                if event.key == pygame.K_F10:
+                    self._toggle_recording()
 
             # Click toggle button
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -518,18 +913,19 @@ class Game:
 
     # ── update ────────────────────────────────────────────────
     def _update(self):
-        # Smooth dark alpha
-        target_dark = 1.0 if self.theme_name == "dark" else 0.0
-        self._dark_alpha += (target_dark - self._dark_alpha) * 0.06
+        self._update_sky()
 
-        if self.game_over:
+        if self.game_over or not self.started:
             return
 
         self.dino.update()
-        self.obstacles.update(self.speed, self.score)
+        if self.ghost_rec:
+            self.ghost_rec.push(self.dino)
+        self.obstacles.update(self.speed, self.dino.x)
         self.ground.update(self.speed)
         self.clouds.update(self.speed)
         self.mountains.update(self.speed)
+        self._frames += 1
 
         # Particles: dust on landing
         on_ground = not self.dino.jumping
@@ -546,11 +942,15 @@ class Game:
         self._particles = [p for p in self._particles if p.life > 0]
 
         # Collision
-        if self.obstacles.check_collision(self.dino.get_rect()):
+        hit = self.obstacles.check_collision(self.dino.get_rect())
+        if hit:
             self.dino.kill()
             self.game_over = True
-            self.hi_score  = max(self.hi_score, self.score)
+            if self.autopilot is None:      # bot runs never set the HI
+                self.hi_score = max(self.hi_score, self.score)
             self.go_screen.reset()
+            self._record_run(hit)
+            self._save_ghost()
             # Death particles
             for _ in range(20):
                 self._particles.append(
@@ -559,28 +959,40 @@ class Game:
             return
 
         # Score & speed
-        self.score += 0.14
+        self.score += SCORE_INC
         self.speed  = min(SPEED_MAX,
                           SPEED_START + self.score * SPEED_INC)
         self.score_hud.update(self.score)
 
     # ── draw ──────────────────────────────────────────────────
-    def _draw(self):
-        t = self.theme
+    # scene stages draw into self.scene at self.render_scale
+    def _draw_stars(self):
+        self.stars.draw(self.scene, self._dark_alpha, self.render_scale)
+
+    def _draw_mountains(self):
+        self.mountains.draw(self.scene, self.theme, self.render_scale)
+
+    def _draw_clouds(self):
+        self.clouds.draw(self.scene, self.theme, self.render_scale)
 
-        self._draw_sky()
-        self.stars.draw(self.screen, self._dark_alpha)
-        self._draw_sun()
-        self.mountains.draw(self.screen, t)
-        self.clouds.draw(self.screen, t)
-        self.ground.draw(self.screen, t)
+    def _draw_ground(self):
+        self.ground.draw(self.scene, self.theme, self.render_scale)
 
-        self.obstacles.draw(self.screen, t)
-        self.dino.draw(self.screen, t)
+    def _draw_obstacles(self):
+        self.obstacles.draw(self.scene, self.theme, self.render_scale)
 
-        # Particles
+    def _draw_dino(self):
+        k = self.render_scale
+        if self.ghost and self.started:
+            self.ghost.draw(self.scene, self._frames - 1, self.dino.x, k)
+        self.dino.draw(self.scene, self.theme, k)
+
+    def _draw_particles(self):
         for p in self._particles:
-            p.draw(self.screen)
+            p.draw(self.scene, self.render_scale)
+
+    def _draw_hud(self):
+        t = self.theme
 
         # Bird warning
         if self.obstacles.has_incoming_bird(self.dino.x):
@@ -589,10 +1001,8 @@ class Game:
             self.screen.blit(warn,
                              (self.dino.x + 55, self.dino.y - 80))
 
-        # HUD elements
         self.score_hud.draw(self.screen, t, self.score, self.hi_score)
         # self.gesture_hud.draw(self.screen, t, self.gesture.gesture)
-        self._draw_camera()
         self.toggle.draw(self.screen, t)
 
         # Speed bar (tiny strip above ground)
@@ -603,35 +1013,238 @@ class Game:
             bar_surf.fill((*t["ground_top"], 160))
             self.screen.blit(bar_surf, (0, GROUND_Y - 5))
 
-        if self.game_over:
-            self.go_screen.draw(self.screen, t, self.score, self.hi_score)
+        if not self.started:
+            self.title.draw(self.screen, t, self.gesture_status,
+                            self._loader is not None)
+        elif self.game_over:
+            self.go_screen.draw(self.screen, t, self.score, self.hi_score,
+                                self.stats.summary if self.stats else None)
+
+    def _build_draw_stages(self):
+        # back-to-front; names are used by the benchmark harness.  Stages
+        # named after a quality feature are left out on tiers without it.
+        stages = [
+            ("sky",       self._draw_sky),
+            ("stars",     self._draw_stars),
+            ("sun",       self._draw_sun),
+            ("mountains", self._draw_mountains),
+            ("clouds",    self._draw_clouds),
+            ("ground",    self._draw_ground),
+            ("obstacles", self._draw_obstacles),
+            ("dino",      self._draw_dino),
+            ("particles", self._draw_particles),
+            ("upscale",   self._draw_upscale),
+            ("camera",    self._draw_camera),
+            ("hud",       self._draw_hud),
+        ]
+        return [(name, stage) for name, stage in stages
+                if (name not in FEATURES or self.quality.has(name)) and
+                (name != "upscale" or self.scene is not self.screen) and
+                (name != "camera" or self.show_camera)]
+
+    def _apply_quality(self):
+        q = self.quality
+        self.ground.layers       = q.has("ground_layers")
+        self.ground.show_pebbles = q.has("pebbles")
+        self.draw_stages         = self._build_draw_stages()
 
-        pygame.display.flip()
+    def _draw(self):
+        """Draw and present a frame; returns the ms spent in the draw stages
+        (what the quality governor steers)."""
+        perf = self.perf
+        if not perf.active:
+            t0 = time.perf_counter()
+            for _, stage in self.draw_stages:
+                stage()
+            render = time.perf_counter() - t0
+            pygame.display.flip()
+            if self.broadcast:
+                self.broadcast.capture(self.screen)
+            return render * 1000.0
+
+        t0 = time.perf_counter()
+        for name, stage in self.draw_stages:
+            with perf.section(name):
+                stage()
+        render = time.perf_counter() - t0
+        if perf.enabled:
+            if self.gesture:
+                for key, value in self.gesture.stats().items():
+                    perf.gauge(key, value)
+            if self.broadcast:
+                for key, value in self.broadcast.stats().items():
+                    perf.gauge(key, value)
+            perf.gauge("quality", self.quality.mode)
+            self.perf_hud.draw(self.screen, self.theme, perf,
+                               self.clock.get_fps())
+        with perf.section("flip"):
+            pygame.display.flip()
+        if self.broadcast:
+            with perf.section("broadcast"):
+                self.broadcast.capture(self.screen)
+        return render * 1000.0
+
+    def _toggle_recording(self):
+        """Start / stop a clip; returns the saved path on stop."""
+        if self.broadcast is None:
+            self.broadcast = Broadcaster(self.screen)
+        self.broadcast.toggle()
+        if self.broadcast.recording:
+            return None
+        path = self.broadcast.last_path
+        self.score_hud.notice(f"clip saved: {path}")
+        return path
+
+    def _dump_trace(self):
+        """Write the trace buffer; returns its path (None if off)."""
+        if not TRACER.enabled:
+            return None
+        path = TRACER.dump()
+        self.score_hud.notice(f"trace: {path}")
+        return path
+
+    # ── stats ─────────────────────────────────────────────────
+    def _record_run(self, hit):
+        if not self.stats:
+            return
+        self.stats.record_run(
+            score         = self.score,
+            frames        = self._frames,
+            speed         = self.speed,
+            death_kind    = "bird" if hit.KIND == KIND_BIRD else "cactus",
+            death_variant = hit.variant,
+            autopilot     = int(self.autopilot is not None),
+            **self._counts)
+
+    # ── ghost ─────────────────────────────────────────────────
+    def _course_seed(self):
+        """Ghost mode replays the ghost's course; otherwise any seed."""
+        return self.ghost.seed if self.ghost else random.getrandbits(63)
+
+    def _seed_run(self):
+        self.obstacles.reset(self._course_seed())
+        if self.ghost_rec:
+            self.ghost_rec.reset(self.obstacles.seed)
+
+    def _save_ghost(self):
+        # only the player's own runs become the ghost, as in _record_run
+        if not self.ghost_rec or self.autopilot is not None:
+            return
+        if self.ghost and self.score <= self.ghost.score:
+            return
+        self.ghost_rec.save(GHOST_FILE, self.score)
+        self.ghost = GhostRun.load()
 
     # ── restart ───────────────────────────────────────────────
     def _restart(self):
         self.dino      = Dino()
-        self.obstacles.reset()
+        self._seed_run()
         self.score     = 0.0
         self.speed     = SPEED_START
         self.game_over = False
         self._particles.clear()
-        self._prev_jump   = False
         self._on_ground_last = True
+        self._over_frames = 0
+        self._frames      = 0
+        self._counts      = dict.fromkeys(self._counts, 0)
+        if self.autopilot:
+            self.autopilot.reset()
 
     # ── run ───────────────────────────────────────────────────
     def run(self):
+        perf   = self.perf
+        t_prev = time.perf_counter()
         while self.running:
-            self._handle_input()
-            self._update()
-            self._draw()
-            self.clock.tick(FPS)
-
-        self.gesture.close()
+            with perf.section("input"):       # includes "gesture"
+                self._handle_input()
+            with perf.section("update"):
+                self._update()
+            render_ms = self._draw()
+            if self.quality.observe(t_prev, render_ms):
+                self._apply_quality()
+            with perf.section("tick"):
+                self.clock.tick(FPS)
+
+            now = time.perf_counter()
+            if perf.enabled:
+                perf.frame(now - t_prev)
+            if TRACER.enabled:
+                TRACER.record("frame", int(t_prev * 1e9), int(now * 1e9))
+            t_prev = now
+
+        if self._loader:
+            self._loader.close()
+        if self.gesture:
+            self.gesture.close()
+        if self.stats:
+            self.stats.close()
+        if self.broadcast:
+            self.broadcast.close()
+        self.obstacles.close()
+        self._dump_trace()
         pygame.quit()
 
 
 # ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    g = Game()
+    import argparse
+
+    from gesture_backends import BACKENDS
+    from landmark_filter import FILTERS
+
+    ap = argparse.ArgumentParser(description="Gesture Dino")
+    ap.add_argument("--autopilot", action="store_true",
+                    help="let the built-in bot play (toggle in-game with A)")
+    ap.add_argument("--latency", type=int, default=0,
+                    help="autopilot reaction delay in frames")
+    ap.add_argument("--no-camera", action="store_true",
+                    help="keyboard only; skip the webcam and MediaPipe")
+    ap.add_argument("--perf", action="store_true",
+                    help="start with the perf overlay on (toggle with F3)")
+    ap.add_argument("--trace", action="store_true",
+                    help="record a Chrome trace; dumped on exit or with F9")
+    ap.add_argument("--no-stats", action="store_true",
+                    help="don't save runs to the stats database")
+    ap.add_argument("--predict", action="store_true",
+                    help="fire jumps early from finger motion (hands backend)")
+    ap.add_argument("--filter", choices=sorted(FILTERS),
+                    default=LANDMARK_FILTER,
+                    help="landmark smoothing, predicted to every game frame")
+    ap.add_argument("--backend", choices=sorted(BACKENDS),
+                    default=GESTURE_BACKEND,
+                    help="hands: finger gestures; pose: whole-body, lighter")
+    ap.add_argument("--players", type=int, choices=(1, 2), default=1,
+                    help="2: split screen, one hand each (hands backend)")
+    ap.add_argument("--service", nargs="?", const=GESTURE_SERVICE,
+                    metavar="ADDR",
+                    help="take gestures from a running gesture_service.py")
+    ap.add_argument("--ghost", action="store_true",
+                    help="race a replay of your best run on the same course")
+    ap.add_argument("--record", action="store_true",
+                    help="record MJPEG clips to clips/ (toggle with F10)")
+    ap.add_argument("--quality", choices=("auto",) + TIERS, default=QUALITY,
+                    help="scenery detail; auto follows frame time (F4 cycles)")
+    ap.add_argument("--render-scale", type=float, default=RENDER_SCALE,
+                    metavar="K",
+                    help="draw the scene at K x resolution, e.g. 0.5 (HUD stays sharp)")
+    ap.add_argument("--day-night", type=float, default=DAY_NIGHT,
+                    metavar="SECS",
+                    help="blend between light and dark every SECS seconds")
+    args = ap.parse_args()
+
+    if args.players == 2:
+        from versus import VersusGame
+
+        VersusGame(autopilot=args.autopilot, camera=not args.no_camera,
+                   predict=args.predict, service=args.service,
+                   landmark_filter=args.filter).run()
+        raise SystemExit
+
+    g = Game(autopilot=args.autopilot, latency=args.latency,
+             camera=not args.no_camera, perf=args.perf, trace=args.trace,
+             stats=not args.no_stats, predict=args.predict,
+             backend=args.backend, service=args.service,
+             record=args.record, ghost=args.ghost, quality=args.quality,
+             day_night=args.day_night, render_scale=args.render_scale,
+             landmark_filter=args.filter)
     g.run()
\ No newline at end of file
@@ -2,16 +2,32 @@
 Obstacles:
   Cactus  – 6 variants (small/tall × 1/2/3 stems)
   Pterodactyl – flies at 2 heights, must duck
+
+Shapes are drawn with primitives once, into palette sprites, and blitted.
 """
+import math
 import pygame
+import queue
 import random
-from config import GROUND_Y, WIDTH
+import threading
+import numpy as np
+from config import (GROUND_Y, WIDTH, SCORE_INC, SPEED_INC, SPEED_MAX,
+                    SPEED_START)
+from palette import PALETTE, INDEX
+from reachability import ReachTable
+from tracing import TRACER
+
+KIND_CACTUS    = 0
+KIND_BIRD      = 1
+BIRD_WARN_DIST = 420      # px ahead of the dino that triggers "DUCK!"
 
 
 # ═══════════════════════════════════════════════════════════════
 #  CACTUS
 # ═══════════════════════════════════════════════════════════════
 class Cactus:
+    KIND = KIND_CACTUS
+
     # (stem_count, stem_h, has_arms)
     VARIANTS = [
         (1, 50, True),
@@ -23,50 +39,61 @@ class Cactus:
     ]
 
     STEM_W = 20
+    PAD    = 20                 # arms reach 18 px left of the first stem
 
-    def __init__(self, x):
-        stems, sh, arms = random.choice(self.VARIANTS)
-        self.x         = x
-        self.stems     = stems
-        self.stem_h    = sh
-        self.has_arms  = arms
-        self.w         = stems * (self.STEM_W + 6) - 6
-        self.h         = sh
-
-    # ── per-frame ─────────────────────────────────────────
-    def update(self, speed):
-        self.x -= speed
+    _sprites = {}
 
-    def off_screen(self):
-        return self.x < -(self.w + 30)
+    @classmethod
+    def name(cls, variant):
+        stems, sh, _ = cls.VARIANTS[variant]
+        return f"{stems}x{sh}"
 
-    def get_rect(self):
+    @classmethod
+    def geometry(cls, variant):
+        """(y, w, h, collision box) for a variant; the box is
+        (dx, y, w, h) with dx relative to the obstacle's x."""
+        stems, sh, _ = cls.VARIANTS[variant]
+        w = stems * (cls.STEM_W + 6) - 6
         # tight collision box
-        return pygame.Rect(self.x + 2, GROUND_Y - self.h + 2,
-                           self.w - 4, self.h - 4)
+        return GROUND_Y - sh, w, sh, (2, GROUND_Y - sh + 2, w - 4, sh - 4)
 
     # ── draw ──────────────────────────────────────────────
-    def draw(self, screen, t):
+    @classmethod
+    def blit(cls, screen, x, variant, k=1):
+        sprite = cls._sprites.get(variant)
+        if sprite is None:
+            _, w, h, _ = cls.geometry(variant)
+            top    = GROUND_Y - h - 6           # rounded top and arm tips
+            sprite = cls._sprites[variant] = PALETTE.bake(
+                lambda s: cls.draw(s, INDEX, cls.PAD, variant),
+                (0, top, w + 2 * cls.PAD, h + 6))
+        screen.blit(PALETTE.scaled(sprite, k),
+                    (int((int(x) - cls.PAD) * k),
+                     int((GROUND_Y - sprite.get_height()) * k)))
+
+    @classmethod
+    def draw(cls, screen, t, x, variant):
+        stems, stem_h, has_arms = cls.VARIANTS[variant]
         c  = t["cactus"]
         cd = t["cactus_dark"]
-        sw = self.STEM_W
+        sw = cls.STEM_W
 
-        for i in range(self.stems):
-            sx = self.x + i * (sw + 6)
-            sy = GROUND_Y - self.stem_h
+        for i in range(stems):
+            sx = x + i * (sw + 6)
+            sy = GROUND_Y - stem_h
 
             # Main stem
             pygame.draw.rect(screen, c,
-                             (sx, sy, sw, self.stem_h), border_radius=4)
+                             (sx, sy, sw, stem_h), border_radius=4)
             # Shade strip
             pygame.draw.rect(screen, cd,
-                             (sx + sw - 6, sy, 6, self.stem_h), border_radius=2)
+                             (sx + sw - 6, sy, 6, stem_h), border_radius=2)
 
             # Rounded top
             pygame.draw.ellipse(screen, c,
                                 (sx - 1, sy - 4, sw + 2, 12))
 
-            if self.has_arms and self.stem_h >= 50:
+            if has_arms and stem_h >= 50:
                 arm_y   = sy + 14
                 arm_h   = 12
                 arm_len = 18
@@ -99,57 +126,73 @@ class Cactus:
 #  PTERODACTYL  (bird)
 # ═══════════════════════════════════════════════════════════════
 class Pterodactyl:
+    KIND = KIND_BIRD
+
     # fly heights: low (head-level), mid (jump-zone)
     FLY_HEIGHTS = [GROUND_Y - 78, GROUND_Y - 130]
-
-    def __init__(self, x):
-        self.x     = x
-        self.y     = random.choice(self.FLY_HEIGHTS)  # top of bird
-        self.w     = 48
-        self.h     = 34
-        self._flap = 0
-
-    def update(self, speed):
-        self.x    -= speed
-        self._flap = (self._flap + 1) % 16
-
-    def off_screen(self):
-        return self.x < -(self.w + 30)
-
-    def get_rect(self):
-        return pygame.Rect(self.x + 6, self.y + 4,
-                           self.w - 10, self.h - 8)
-
-    def draw(self, screen, t):
+    VARIANTS    = FLY_HEIGHTS
+    NAMES       = ("low", "high")
+    W, H        = 48, 34
+    FLAP        = 16                # frames per wing cycle
+    PAD_X, PAD_Y = 2, 12            # sprite origin to the bird's (x, y)
+
+    _sprites = {}                   # wings up? -> surface
+
+    @classmethod
+    def name(cls, variant):
+        return cls.NAMES[variant]
+
+    @classmethod
+    def geometry(cls, variant):
+        y = cls.FLY_HEIGHTS[variant]                 # top of bird
+        return y, cls.W, cls.H, (6, y + 4, cls.W - 10, cls.H - 8)
+
+    @classmethod
+    def blit(cls, screen, x, variant, flap, k=1):
+        up     = flap < cls.FLAP // 2
+        sprite = cls._sprites.get(up)
+        if sprite is None:
+            y      = cls.FLY_HEIGHTS[0]
+            flap   = 0 if up else cls.FLAP - 1
+            sprite = cls._sprites[up] = PALETTE.bake(
+                lambda s: cls.draw(s, INDEX, cls.PAD_X, 0, flap),
+                (0, y - cls.PAD_Y, cls.W + 28, cls.H + 2 * cls.PAD_Y))
+        screen.blit(PALETTE.scaled(sprite, k),
+                    (int((int(x) - cls.PAD_X) * k),
+                     int((cls.FLY_HEIGHTS[variant] - cls.PAD_Y) * k)))
+
+    @classmethod
+    def draw(cls, screen, t, x, variant, flap):
         c  = t["bird"]
         cw = t["bird_wing"]
-        x, y = self.x, self.y
-        cx = x + self.w // 2
-        cy = y + self.h // 2
+        y  = cls.FLY_HEIGHTS[variant]
+        w  = cls.W
+        cx = x + w // 2
+        cy = y + cls.H // 2
 
         # ── body ──────────────────────────────────────
         pygame.draw.ellipse(screen, c,
                             (x + 12, cy - 8, 26, 16))
 
         # ── head ──────────────────────────────────────
-        pygame.draw.circle(screen, c, (x + self.w - 2, cy - 6), 9)
+        pygame.draw.circle(screen, c, (x + w - 2, cy - 6), 9)
 
         # ── beak ──────────────────────────────────────
         beak = [
-            (x + self.w + 7,  cy - 7),
-            (x + self.w + 20, cy - 4),
-            (x + self.w + 7,  cy - 1),
+            (x + w + 7,  cy - 7),
+            (x + w + 20, cy - 4),
+            (x + w + 7,  cy - 1),
         ]
         pygame.draw.polygon(screen, c, beak)
 
         # ── eye ───────────────────────────────────────
-        pygame.draw.circle(screen, (255,255,255),
-                           (x + self.w - 1, cy - 8), 4)
+        pygame.draw.circle(screen, t["bird_eye"],
+                           (x + w - 1, cy - 8), 4)
         pygame.draw.circle(screen, c,
-                           (x + self.w,    cy - 8), 2)
+                           (x + w,    cy - 8), 2)
 
         # ── wings (flapping) ──────────────────────────
-        wing_phase = self._flap < 8       # up or down
+        wing_phase = flap < cls.FLAP // 2       # up or down
 
         if wing_phase:
             # wings up
@@ -189,56 +232,389 @@ class Pterodactyl:
 
 
 # ═══════════════════════════════════════════════════════════════
-#  OBSTACLE MANAGER
+#  OBSTACLE  (snapshot of one slot)
 # ═══════════════════════════════════════════════════════════════
-class ObstacleManager:
-    MIN_GAP = 280
-    MAX_GAP = 520
+SHAPES = {KIND_CACTUS: Cactus, KIND_BIRD: Pterodactyl}
+
+# every (kind, variant) as one shape id: cacti first, then birds
+SHAPE_BASE  = {KIND_CACTUS: 0, KIND_BIRD: len(Cactus.VARIANTS)}
+SHAPE_NAMES = ([Cactus.name(v) for v in range(len(Cactus.VARIANTS))] +
+               [Pterodactyl.name(v) for v in range(len(Pterodactyl.VARIANTS))])
+REACH = ReachTable([SHAPES[kind].geometry(v)[3]
+                    for kind in (KIND_CACTUS, KIND_BIRD)
+                    for v in range(len(SHAPES[kind].VARIANTS))])
+
+
+class Obstacle:
+    """Read-only copy of one manager slot, for callers that want an object
+    (the collision result, autopilot debugging).  Built on request only."""
+    __slots__ = ("KIND", "x", "y", "w", "h", "_variant", "_box")
 
-    def __init__(self):
-        self.reset()
+    def __init__(self, kind, x, variant):
+        self.KIND     = kind
+        self.x        = x
+        self._variant = variant
+        self.y, self.w, self.h, self._box = SHAPES[kind].geometry(variant)
 
-    def reset(self):
-        self.obstacles  = []
-        self._next_x    = WIDTH + 180
-        self._score_ref = 0.0      # used to gate pterodactyl appearance
+    @property
+    def variant(self):
+        return SHAPES[self.KIND].name(self._variant)
 
-    def update(self, speed, score):
-        self._score_ref = score
+    def get_rect(self):
+        dx, y, w, h = self._box
+        return pygame.Rect(self.x + dx, y, w, h)
 
-        for o in self.obstacles:
-            o.update(speed)
 
-        self.obstacles = [o for o in self.obstacles if not o.off_screen()]
+# ═══════════════════════════════════════════════════════════════
+#  OBSTACLE SCHEDULE  (the seeded course, generated ahead of play)
+# ═══════════════════════════════════════════════════════════════
+RECORD = np.dtype([("x", "f8"), ("kind", "i1"), ("variant", "i1"),
+                   ("y", "f8")])
+
+# speed and score are a function of distance alone (they grow per frame
+# whatever the player does), so the course can be laid out in advance
+_ACCEL    = SCORE_INC * SPEED_INC                    # speed gained per frame
+_SAT      = (SPEED_MAX - SPEED_START) / _ACCEL       # frame speed tops out
+_SAT_DIST = _SAT * SPEED_START + _ACCEL * _SAT * (_SAT - 1) / 2
+
+
+def frame_at(dist):
+    """Frame on which the world has scrolled `dist` px."""
+    if dist >= _SAT_DIST:
+        return _SAT + (dist - _SAT_DIST) / SPEED_MAX
+    b = SPEED_START - _ACCEL / 2
+    return (math.sqrt(b * b + 2 * _ACCEL * max(dist, 0.0)) - b) / _ACCEL
+
+
+class ObstacleSchedule:
+    """
+    Infinite seeded stream of obstacle records (world x, kind, variant, y),
+    produced CHUNK at a time.  With background=True a thread keeps AHEAD
+    chunks buffered, so no generation (or random call) runs on a frame.
+
+    Placement keeps the course solvable.  The generator tracks, in world
+    px, the earliest plan for everything placed so far: the start window of
+    the jump in progress (cacti close enough share it) and when the dino is
+    next free to jump / on the ground.  A new obstacle is pushed back just
+    far enough that its REACH window at that distance's speed still fits.
+    """
+    CHUNK       = 16          # ~6000 px of course
+    AHEAD       = 4
+    MIN_GAP     = 280
+    MAX_GAP     = 520
+    BIRD_SCORE  = 300           # no pterodactyls before this score
+    BIRD_CHANCE = 0.28
+
+    def __init__(self, seed, start, background=False):
+        self.seed  = seed
+        self._gen  = self._generate(random.Random(seed), start)
+        self._q    = None
+        # the first chunk is made here, so starting a course never waits
+        # on the thread (one chunk is about a millisecond, once per run)
+        self._first = next(self._gen) if background else None
+        if background:
+            self._q    = queue.Queue(self.AHEAD)
+            self._stop = threading.Event()
+            threading.Thread(target=self._produce, name="obstacle-schedule",
+                             daemon=True).start()
+
+    def next_chunk(self):
+        if self._first is not None:
+            chunk, self._first = self._first, None
+            return chunk
+        return self._q.get() if self._q else next(self._gen)
+
+    def close(self):
+        if self._q:
+            self._stop.set()
+
+    def _produce(self):
+        while True:
+            with TRACER.span("schedule"):
+                chunk = next(self._gen)
+            while not self._stop.is_set():
+                try:
+                    self._q.put(chunk, timeout=0.5)
+                    break
+                except queue.Full:
+                    pass
+            if self._stop.is_set():
+                return
+
+    # ── generation ───────────────────────────────────────
+    def _generate(self, rng, start):
+        x        = start            # candidate x of the next obstacle
+        jump     = None             # (lo, hi) start window of the open jump
+        free_air = -math.inf        # earliest next jump start
+        free_gnd = -math.inf        # dino back on the ground
+        while True:
+            chunk = np.empty(self.CHUNK, RECORD)
+            for i in range(self.CHUNK):
+                # birds gate on the score when the obstacle comes on screen;
+                # placement uses the speed then, as the live spawner did
+                frame = frame_at(x - start)
+                kind  = (KIND_BIRD if frame * SCORE_INC > self.BIRD_SCORE and
+                         rng.random() < self.BIRD_CHANCE else KIND_CACTUS)
+                shape   = SHAPES[kind]
+                variant = rng.randrange(len(shape.VARIANTS))
+                y, _, _, box = shape.geometry(variant)
+                c   = x + box[0]                 # contact point
+                b   = REACH.bucket(min(SPEED_MAX, SPEED_START + _ACCEL * frame))
+                sid = SHAPE_BASE[kind] + variant
+
+                if REACH.clear[sid] is None:                 # run under / duck
+                    c = max(c, free_gnd - REACH.ground_from[b, sid])
+                    free_air = max(free_air, c + REACH.ground_end[b, sid])
+                    jump     = None
+                else:
+                    lo, hi = REACH.jump_lo[b, sid], REACH.jump_hi[b, sid]
+                    if jump and jump[0] - hi <= c <= jump[1] - lo:
+                        # the same jump clears it
+                        take_off = max(jump[0], c + lo)
+                        jump     = (take_off, min(jump[1], c + hi))
+                    else:
+                        c        = max(c, free_air - hi)
+                        take_off = max(c + lo, free_air)
+                        jump     = (take_off, c + hi)
+                    free_air = free_gnd = take_off + REACH.land[b]
+
+                x = c - box[0]
+                chunk[i] = (x, kind, variant, y)
+                x += rng.randint(self.MIN_GAP, self.MAX_GAP)
+            yield chunk
 
-        # spawn
-        spawn_due = (not self.obstacles or
-                     self.obstacles[-1].x < self._next_x - 60)
-        if spawn_due:
-            # only spawn pterodactyl after score 300
-            use_bird = (score > 300 and random.random() < 0.28)
-            cls      = Pterodactyl if use_bird else Cactus
-            self.obstacles.append(cls(self._next_x))
-            gap = random.randint(self.MIN_GAP, self.MAX_GAP)
-            self._next_x = self._next_x + gap
 
-        # seed very first obstacle
-        if not self.obstacles:
-            self.obstacles.append(Cactus(WIDTH + 120))
-            self._next_x = WIDTH + 120 + random.randint(self.MIN_GAP, self.MAX_GAP)
+# ═══════════════════════════════════════════════════════════════
+#  OBSTACLE MANAGER
+# ═══════════════════════════════════════════════════════════════
+class ObstacleManager:
+    """
+    Obstacle state lives in fixed-capacity parallel numpy arrays, one slot
+    per obstacle: x, kind, variant, y, w, h, flap and the collision box
+    (dx, top, w, h), which is fixed per variant and filled in at spawn.
+    A frame moves every obstacle with one in-place subtraction and creates
+    no objects; flap holds the frame a bird spawned on, so wing phase needs
+    no per-frame update either.
+
+    Slots are kept sorted by x (obstacles spawn left-to-right and all
+    scroll at the same speed), so the off-screen ones are always a prefix;
+    it is removed by sliding the live slots down.  Two cursors track the
+    first obstacle / first bird the dino has not yet passed; they only
+    ever move forward, so lookahead queries are O(1).
+
+    The course itself comes from an ObstacleSchedule; a frame only copies
+    the next record into a slot once it scrolls within SPAWN_MARGIN of the
+    right edge.
+    """
+    SPAWN_MARGIN = 180
+    CAPACITY     = 16     # spawn point to exit is ~1500 px, > MIN_GAP apart
+
+    def __init__(self, rng=None, background=False, seed=None):
+        # reset() without a seed draws one from rng; pass a random.Random
+        # for a reproducible sequence of courses.  seed: the first course
+        self.rng        = rng if rng is not None else random
+        self.background = background        # generate the course on a thread
+        self.schedule   = None
+        cap          = self.CAPACITY
+        self.x       = np.zeros(cap)              # left edge, screen space
+        self.y       = np.zeros(cap)              # top
+        self.w       = np.zeros(cap)
+        self.h       = np.zeros(cap)
+        self.kind    = np.zeros(cap, np.int8)     # KIND_*
+        self.variant = np.zeros(cap, np.int8)     # index into the shape table
+        self.flap    = np.zeros(cap, np.int64)    # frame spawned (wing phase)
+        self.box     = np.zeros((cap, 4))         # dx, top, w, h
+        self._slots  = (self.x, self.y, self.w, self.h, self.kind,
+                        self.variant, self.flap, self.box)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new course; the same seed gives the same obstacles."""
+        if seed is None:
+            seed = self.rng.getrandbits(63)
+        if self.schedule:
+            self.schedule.close()
+        self.schedule   = ObstacleSchedule(seed, WIDTH + self.SPAWN_MARGIN,
+                                           self.background)
+        self._take_chunk()
+        self.n          = 0            # live slots [0, n)
+        self.frame      = 0
+        self._dino_x    = 85
+        self._ahead     = 0            # first obstacle not cleared by dino
+        self._bird      = 0            # first bird still ahead of dino
+        self._scroll    = 0.0      # world distance scrolled so far
+
+    def _take_chunk(self):
+        self._pending   = self.schedule.next_chunk()
+        self._pending_x = self._pending["x"]
+        self._next      = 0            # next record of _pending to spawn
+
+    @property
+    def seed(self):
+        return self.schedule.seed
+
+    def close(self):
+        self.schedule.close()
+
+    def __len__(self):
+        return self.n
+
+    # ── slot maintenance ──────────────────────────────────
+    def _spawn(self, rec):
+        kind, variant = int(rec["kind"]), int(rec["variant"])
+        _, w, h, box = SHAPES[kind].geometry(variant)
+        i = self.n
+        self.x[i], self.y[i], self.w[i], self.h[i] = (rec["x"] - self._scroll,
+                                                      rec["y"], w, h)
+        self.kind[i], self.variant[i], self.flap[i] = kind, variant, self.frame
+        self.box[i] = box
+        self.n = i + 1
+
+    def _drop_front(self, k):
+        n = self.n
+        for a in self._slots:
+            a[:n - k] = a[k:n]
+        self.n      = n - k
+        self._ahead = max(0, self._ahead - k)
+        self._bird  = max(0, self._bird - k)
+
+    def _seek(self):
+        n    = self.n
+        edge = self._dino_x
+        x, w, kind = self.x, self.w, self.kind
+        a = self._ahead
+        while a < n and x.item(a) + w.item(a) <= edge:
+            a += 1
+        b = self._bird
+        while b < n and (kind.item(b) != KIND_BIRD or x.item(b) <= edge):
+            b += 1
+        self._ahead, self._bird = a, b
+
+    # ── per-frame ─────────────────────────────────────────
+    def update(self, speed, dino_x=85):
+        self._dino_x    = dino_x
+        self._scroll   += speed
+        self.frame     += 1
+
+        # free slots move too; they are never read
+        self.x -= speed
 
-    def draw(self, screen, t):
-        for o in self.obstacles:
-            o.draw(screen, t)
+        # off-screen obstacles always form a prefix of the sorted slots
+        x, w = self.x, self.w
+        if self.n and x.item(0) < -(w.item(0) + 30):
+            k = 1
+            while k < self.n and x.item(k) < -(w.item(k) + 30):
+                k += 1
+            self._drop_front(k)
+
+        # spawn once the next record has scrolled up to the right edge
+        edge = self._scroll + WIDTH + self.SPAWN_MARGIN
+        while self._pending_x.item(self._next) <= edge:
+            self._spawn(self._pending[self._next])
+            self._next += 1
+            if self._next == len(self._pending):
+                self._take_chunk()
+
+        self._seek()
+
+    def draw(self, screen, t, k=1):
+        """k: render scale of `screen` relative to the window."""
+        n = self.n
+        for kind, x, variant, born in zip(self.kind[:n].tolist(),
+                                          self.x[:n].tolist(),
+                                          self.variant[:n].tolist(),
+                                          self.flap[:n].tolist()):
+            if kind == KIND_BIRD:
+                Pterodactyl.blit(screen, x, variant,
+                                 (self.frame - born) % Pterodactyl.FLAP, k)
+            else:
+                Cactus.blit(screen, x, variant, k)
 
     def check_collision(self, dino_rect):
-        for o in self.obstacles:
-            if dino_rect.colliderect(o.get_rect()):
-                return True
-        return False
-
-    def has_incoming_bird(self, dino_x=85):
-        for o in self.obstacles:
-            if isinstance(o, Pterodactyl) and dino_x < o.x < dino_x + 420:
-                return True
-        return False
\ No newline at end of file
+        """The obstacle the dino hit, or None."""
+        # everything before the cursor is already behind the dino;
+        # same integer test as Rect.colliderect on the precomputed box
+        left, right = dino_rect.left, dino_rect.right
+        top,  bottom = dino_rect.top, dino_rect.bottom
+        x, box = self.x, self.box
+        for i in range(self._ahead, self.n):
+            xi = x.item(i)
+            if xi > right:
+                break
+            dx, by, bw, bh = box[i].tolist()
+            bx = int(xi + dx)
+            if bx < right and bx + bw > left and by < bottom and by + bh > top:
+                return self.obstacle(i)
+        return None
+
+    # ── lookahead queries (O(1)) ──────────────────────────
+    def obstacle(self, i):
+        return Obstacle(self.kind.item(i), self.x.item(i),
+                        self.variant.item(i))
+
+    def window(self, n):
+        """Slot range (start, stop) of the next `n` uncleared obstacles."""
+        return self._ahead, min(self._ahead + n, self.n)
+
+    def boxes(self, n):
+        """Collision boxes (left, right, top, bottom) of the next `n`
+        uncleared obstacles, nearest first."""
+        a, b = self.window(n)
+        out  = []
+        for xi, (dx, by, bw, bh) in zip(self.x[a:b].tolist(),
+                                        self.box[a:b].tolist()):
+            bx = int(xi + dx)
+            out.append((bx, bx + bw, by, by + bh))
+        return out
+
+    def layout(self, n):
+        """(contact x, REACH shape id, speed) of the next `n` uncleared
+        obstacles, nearest first: what ObstacleSchedule placed each one
+        with, the speed being the one on the frame it spawned."""
+        a, b  = self.window(n)
+        start = WIDTH + self.SPAWN_MARGIN - self._scroll
+        return [(x + dx, SHAPE_BASE[k] + v,
+                 min(SPEED_MAX, SPEED_START + _ACCEL * frame_at(x - start)))
+                for x, dx, k, v in zip(self.x[a:b].tolist(),
+                                       self.box[a:b, 0].tolist(),
+                                       self.kind[a:b].tolist(),
+                                       self.variant[a:b].tolist())]
+
+    def nearest(self):
+        """First obstacle the dino has not yet cleared, or None."""
+        if self._ahead < self.n:
+            return self.obstacle(self._ahead)
+        return None
+
+    def upcoming(self, n=3):
+        """The next `n` obstacles the dino has not yet cleared, nearest first."""
+        return [self.obstacle(i) for i in range(*self.window(n))]
+
+    def nearest_kind(self):
+        if self._ahead < self.n:
+            return self.kind.item(self._ahead)
+        return None
+
+    def distance_ahead(self, dino_w=0):
+        """Pixels between the dino's front edge and the nearest obstacle."""
+        if self._ahead >= self.n:
+            return float("inf")
+        return max(0.0, self.x.item(self._ahead) - (self._dino_x + dino_w))
+
+    def time_to_impact(self, speed, dino_w=0):
+        """Frames until the nearest obstacle reaches the dino at `speed`."""
+        if speed <= 0:
+            return float("inf")
+        return self.distance_ahead(dino_w) / speed
+
+    def next_bird(self):
+        if self._bird < self.n:
+            return self.obstacle(self._bird)
+        return None
+
+    def has_incoming_bird(self, dino_x=None, window=BIRD_WARN_DIST):
+        if dino_x is None:
+            dino_x = self._dino_x
+        if self._bird >= self.n:
+            return False
+        return dino_x < self.x.item(self._bird) < dino_x + window
@@ -0,0 +1,96 @@
+"""
+Palette-indexed sprites — the dino, cacti, birds, clouds and ground are
+rendered once into 8-bit surfaces whose pixels are palette indices, one per
+theme colour.  Changing theme, or any point of the day/night blend, only
+rewrites the palettes; nothing is redrawn.
+
+    from palette import PALETTE, INDEX
+    sprite = PALETTE.bake(lambda s: Cactus.draw(s, INDEX, 20, 0), rect)
+    PALETTE.set_step(PALETTE.step_of(dark_alpha))
+
+THEME_BLEND[step] is the matching theme dict for everything still drawn
+with primitives (sky, HUD), so both stay in step.
+"""
+import weakref
+
+import pygame
+
+from config import THEMES
+
+# theme keys sprites are drawn with; palette index 0 is transparent
+ROLES = ("dino", "dino_eye", "dino_pupil", "cactus", "cactus_dark", "bird",
+         "bird_wing", "bird_eye", "cloud", "cloud_shadow", "ground_top",
+         "ground_mid", "ground_bot", "dash")
+
+# a theme whose colours are (i, i, i): drawing with it writes index i
+INDEX         = {role: (i, i, i) for i, role in enumerate(ROLES, 1)}
+INDEX_PALETTE = [(i, i, i) for i in range(256)]
+
+BLEND_STEPS = 32        # light (0) .. dark (BLEND_STEPS)
+
+
+def _blend(t):
+    light, dark = THEMES["light"], THEMES["dark"]
+    return {k: tuple(round(a + (b - a) * t) for a, b in zip(light[k], dark[k]))
+            for k in light}
+
+
+THEME_BLEND = [_blend(s / BLEND_STEPS) for s in range(BLEND_STEPS + 1)]
+PALETTES    = [[(0, 0, 0)] + [t[role] for role in ROLES] +
+               [(0, 0, 0)] * (255 - len(ROLES))
+               for t in THEME_BLEND]
+
+
+class Palette:
+    """Owns every baked sprite and the blend step their palettes show."""
+
+    def __init__(self):
+        self.step     = 0
+        self._sprites = weakref.WeakSet()
+        self._scaled  = weakref.WeakKeyDictionary()   # sprite -> {k: copy}
+
+    @staticmethod
+    def step_of(dark_alpha):
+        return min(BLEND_STEPS, max(0, round(dark_alpha * BLEND_STEPS)))
+
+    def bake(self, draw, rect):
+        """Call draw(surface) with INDEX colours on a blank 8-bit surface and
+        keep `rect` of it as a sprite (index 0 is the colour key)."""
+        x, y, w, h = rect
+        scratch = pygame.Surface((x + w, y + h), 0, 8)
+        scratch.set_palette(INDEX_PALETTE)
+        scratch.fill(INDEX_PALETTE[0])
+        draw(scratch)
+        sprite = scratch.subsurface(rect).copy()
+        sprite.set_palette(PALETTES[self.step])
+        sprite.set_colorkey(0)
+        self._sprites.add(sprite)
+        return sprite
+
+    def scaled(self, sprite, k):
+        """`sprite` resized by k (nearest neighbour), cached and registered."""
+        if k == 1:
+            return sprite
+        copies = self._scaled.setdefault(sprite, {})
+        copy   = copies.get(k)
+        if copy is None:
+            w, h = sprite.get_size()
+            copy = copies[k] = pygame.transform.scale(
+                sprite, (max(1, round(w * k)), max(1, round(h * k))))
+            copy.set_palette(PALETTES[self.step])
+            if sprite.get_colorkey() is not None:
+                copy.set_colorkey(0)
+            self._sprites.add(copy)
+        return copy
+
+    def set_step(self, step):
+        """Show blend step `step` on every sprite: O(palette) per sprite."""
+        if step == self.step:
+            return
+        self.step = step
+        colors    = PALETTES[step]
+        for sprite in self._sprites:
+            sprite.set_palette(colors)
+
+
+PALETTE = Palette()
@@ -0,0 +1,117 @@
+"""
+Frame instrumentation — named section timers, frame-time history, gauges
+and rate meters for the perf overlay.
+
+    with perf.section("update"):
+        ...
+
+Sections also become trace spans when an enabled tracing.Tracer is
+attached.  With both off, section() returns one shared no-op context, so an
+instrumented call site costs a method call and nothing else.
+"""
+import time
+from collections import deque
+
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class _Section:
+    __slots__ = ("perf", "name", "t0")
+
+    def __init__(self, perf, name):
+        self.perf = perf
+        self.name = name
+        self.t0   = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        t1   = time.perf_counter_ns()
+        perf = self.perf
+        if perf.enabled:
+            perf.add(self.name, (t1 - self.t0) / 1e9)
+        if perf.tracer is not None and perf.tracer.enabled:
+            perf.tracer.record(self.name, self.t0, t1)
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+# ─────────────────────────────────────────────────────────────
+class Perf:
+    SMOOTH = 0.1        # EMA factor for section times
+
+    def __init__(self, enabled=False, history=240, tracer=None):
+        self.enabled   = enabled
+        self.tracer    = tracer
+        self.times     = {}                     # name -> smoothed ms
+        self.frame_ms  = deque(maxlen=history)  # whole-frame wall time
+        self.gauges    = {}                     # name -> latest value
+        self._sections = {}
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.times.clear()
+            self.frame_ms.clear()
+
+    @property
+    def active(self):
+        """True if sections are being timed or traced."""
+        return self.enabled or (self.tracer is not None and self.tracer.enabled)
+
+    def section(self, name):
+        if not self.active:
+            return NULL_SECTION
+        s = self._sections.get(name)
+        if s is None:
+            s = self._sections[name] = _Section(self, name)
+        return s
+
+    def add(self, name, seconds):
+        ms   = seconds * 1000.0
+        prev = self.times.get(name)
+        self.times[name] = ms if prev is None else prev + (ms - prev) * self.SMOOTH
+
+    def frame(self, seconds):
+        self.frame_ms.append(seconds * 1000.0)
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+
+# ─────────────────────────────────────────────────────────────
+class RateMeter:
+    """Events per second over a sliding window; tick() from one thread only."""
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self._t     = deque()
+
+    def tick(self, now=None):
+        now = time.perf_counter() if now is None else now
+        self._t.append(now)
+        while self._t and now - self._t[0] > self.window:
+            self._t.popleft()
+
+    @property
+    def rate(self):
+        t = tuple(self._t)
+        if len(t) < 2:
+            return 0.0
+        if time.perf_counter() - t[-1] > self.window:
+            return 0.0
+        return (len(t) - 1) / max(t[-1] - t[0], 1e-6)
@@ -0,0 +1,100 @@
+"""
+Render quality tiers — which scenery features the game draws, chosen from
+measured frame time so slow machines keep their frame rate.
+
+    python main.py --quality auto      # default (config.QUALITY)
+    python main.py --quality low       # fixed tier
+    F4 in game                         # cycle tiers, turns auto off
+"""
+from collections import deque
+
+from perf import FRAME_BUDGET_MS
+
+TIERS = ("full", "medium", "low", "minimal")
+
+# feature -> cheapest tier that still draws it
+FEATURES = {
+    "stars":         0,
+    "pebbles":       0,
+    "sun":           1,
+    "mountains":     1,
+    "particles":     1,
+    "sky_gradient":  2,
+    "ground_layers": 2,
+    "clouds":        2,
+}
+
+
+class QualityGovernor:
+    """
+    Tiers go from full to minimal.  The game reports each frame's render
+    time — the draw stages only, which is all a tier changes; gesture
+    inference, the motion gate and the clock.tick sleep are left out.  Over
+    a rolling WINDOW of frames the governor steps one tier down when the
+    mean uses more than OVER of the frame budget, and one tier up after
+    UP_HOLD seconds below HEADROOM.  The window restarts after a change, so
+    each decision is made on frames of the current tier only.
+
+    A tier that overran is remembered: the hold before climbing back into
+    it grows BACKOFF times with each overrun (up to MAX_HOLD), so a machine
+    on the edge of a tier settles below it instead of flickering.
+    """
+    WINDOW   = 60       # frames
+    OVER     = 0.9      # share of FRAME_BUDGET_MS
+    HEADROOM = 0.5
+    UP_HOLD  = 5.0      # s
+    BACKOFF  = 2.0
+    MAX_HOLD = 600.0    # s
+
+    def __init__(self, quality="auto"):
+        self.auto   = quality == "auto"
+        self.tier   = 0 if self.auto else TIERS.index(quality)
+        self.render = deque(maxlen=self.WINDOW)   # ms per frame
+        self._since = None          # start of the current headroom streak
+        self._hold  = {}            # tier -> s of headroom before retrying it
+
+    @property
+    def name(self):
+        return TIERS[self.tier]
+
+    @property
+    def mode(self):
+        return self.name + (" auto" if self.auto else "")
+
+    def has(self, feature):
+        return self.tier <= FEATURES[feature]
+
+    def cycle(self):
+        """Next tier by hand; auto scaling stays off until restarted."""
+        self.auto = False
+        self.tier = (self.tier + 1) % len(TIERS)
+        self.render.clear()
+
+    def observe(self, now, render_ms):
+        """Record one frame; True if the tier changed."""
+        if not self.auto:
+            return False
+        self.render.append(render_ms)
+        if len(self.render) < self.WINDOW:
+            return False
+        mean = sum(self.render) / self.WINDOW
+
+        if mean > FRAME_BUDGET_MS * self.OVER and self.tier < len(TIERS) - 1:
+            step = 1
+            self._hold[self.tier] = min(
+                self._hold.get(self.tier, self.UP_HOLD) * self.BACKOFF,
+                self.MAX_HOLD)
+        elif mean < FRAME_BUDGET_MS * self.HEADROOM and self.tier > 0:
+            if self._since is None:
+                self._since = now
+            if now - self._since < self._hold.get(self.tier - 1, self.UP_HOLD):
+                return False
+            step = -1
+        else:
+            self._since = None
+            return False
+
+        self.tier  += step
+        self._since = None
+        self.render.clear()
+        return True
@@ -0,0 +1,123 @@
+"""
+Reachability tables — what the dino can get past at each speed, derived
+from GRAVITY, JUMP_VEL and the hitboxes of the dino and every obstacle shape.
+
+Everything is measured along the track in px, relative to an obstacle's
+contact point: the world x at which its collision box first reaches the
+standing dino's box.  For each speed bucket and shape the table holds either
+
+    jump window   [jump_lo, jump_hi]  where a jump must start to clear it
+    ground window [ground_from, ground_end]  where the dino must be on the
+                  ground (running under it, or ducking)
+
+plus `land`, the track distance from a jump's start to when the dino can
+jump again.  ObstacleSchedule uses these to place only solvable obstacles;
+lookahead and AI code can read them too:
+
+    from obstacles import REACH
+    b = REACH.bucket(speed)
+    REACH.jump_lo[b, shape], REACH.land[b]
+"""
+import math
+
+import numpy as np
+
+from config import GRAVITY, GROUND_Y, JUMP_VEL, SPEED_MAX, SPEED_START
+from dino import Dino
+
+SPEED_STEP = 0.25       # bucket width
+SAFETY     = 1          # frames of slack on each window edge
+MARGIN     = 6          # Dino.get_rect() inset
+
+
+def jump_arc():
+    """Height above ground after each frame of a jump, until landing."""
+    arc, y, vel = [], 0.0, float(JUMP_VEL)
+    while True:
+        vel += GRAVITY
+        y   += vel
+        if y >= 0:
+            return arc
+        arc.append(-y)
+
+
+ARC = jump_arc()
+
+
+def clear_frames(need):
+    """(first, last) jump frame at which the dino is at least `need` px up."""
+    frames = [j for j, h in enumerate(ARC) if h >= need]
+    return (frames[0], frames[-1]) if frames else None
+
+
+class ReachTable:
+    """
+    shapes: [(dx, top, w, h)] collision boxes, indexed by shape id.
+    Tables are (buckets, shapes) arrays; NaN where a maneuver doesn't apply.
+    """
+
+    def __init__(self, shapes):
+        n_b = int(math.ceil((SPEED_MAX - SPEED_START) / SPEED_STEP)) + 1
+        # each bucket is evaluated at its fastest speed
+        self.speeds = np.minimum(SPEED_START + SPEED_STEP * np.arange(1, n_b + 1),
+                                 SPEED_MAX)
+        self.air_frames = len(ARC) + 1          # jump() to next jump()
+        stand_w   = Dino.STAND_W - 2 * MARGIN
+        duck_w    = Dino.DUCK_W  - 2 * MARGIN
+        stand_top = GROUND_Y - Dino.STAND_H + MARGIN
+        duck_top  = GROUND_Y - Dino.DUCK_H  + MARGIN
+        feet      = GROUND_Y - MARGIN           # box bottom at zero lift
+
+        v     = self.speeds[:, None]
+        shape = (n_b, len(shapes))
+        self.jump_lo     = np.full(shape, np.nan)
+        self.jump_hi     = np.full(shape, np.nan)
+        self.ground_from = np.full(shape, np.nan)
+        self.ground_end  = np.full(shape, np.nan)
+        self.clear = []                         # per shape: (first, last) or None
+        for k, (_, top, w, h) in enumerate(shapes):
+            bottom = top + h
+            if bottom <= duck_top:
+                # under it standing, or ducking (wider box: contact comes earlier)
+                early = 0 if bottom <= stand_top else duck_w - stand_w
+                width = stand_w if bottom <= stand_top else duck_w
+                self.ground_from[:, k] = (-early - v * SAFETY)[:, 0]
+                self.ground_end[:, k]  = (width + w - early + v * SAFETY)[:, 0]
+                self.clear.append(None)
+                continue
+            # jump: clear from contact until the box is past the dino
+            j1, j2 = clear_frames(feet - top + 1)
+            self.clear.append((j1, j2))
+            self.jump_lo[:, k] = (stand_w + w - v * (j2 - SAFETY))[:, 0]
+            self.jump_hi[:, k] = (-v * (j1 + SAFETY))[:, 0]
+        self.land     = self.speeds * (self.air_frames + SAFETY)
+        self.jumpable = self.jump_lo <= self.jump_hi   # False for ground shapes
+
+    def bucket(self, speed):
+        b = int((speed - SPEED_START) / SPEED_STEP)
+        return min(max(b, 0), len(self.speeds) - 1)
+
+    def clear_px(self, speed, shape):
+        """Widest combined box (dino + obstacles) one jump clears at `speed`."""
+        c = self.clear[shape]
+        return 0.0 if c is None else speed * (c[1] - c[0] - 2 * SAFETY)
+
+
+# ─────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    from obstacles import REACH, SHAPE_NAMES
+
+    print(f"air time {REACH.air_frames} frames, peak {max(ARC):.0f} px")
+    for k, name in enumerate(SHAPE_NAMES):
+        c = REACH.clear[k]
+        print(f"  {name:10s}", f"clear frames {c[0]:2d}-{c[1]:2d}" if c
+              else "ground")
+    print("speed  land   " + " ".join(f"{n:>10s}" for n in SHAPE_NAMES))
+    for b, v in enumerate(REACH.speeds):
+        cells = []
+        for k in range(len(SHAPE_NAMES)):
+            if REACH.clear[k]:
+                cells.append(f"{REACH.jump_lo[b, k]:5.0f}..{REACH.jump_hi[b, k]:<4.0f}")
+            else:
+                cells.append(f"{REACH.ground_from[b, k]:4.0f}..{REACH.ground_end[b, k]:<4.0f}")
+        print(f"{v:5.2f} {REACH.land[b]:5.0f}   " + " ".join(f"{c:>10s}" for c in cells))
@@ -0,0 +1,52 @@
+"""
+Headless simulation — the rules of main.Game (physics, spawning, collision,
+score and speed) without a window, camera or particles.
+Used by the autopilot, soak tests and training environments.
+"""
+import random
+
+from config import SPEED_START, SPEED_MAX, SPEED_INC, SCORE_INC
+from dino import Dino
+from obstacles import ObstacleManager
+
+
+class Simulation:
+    def __init__(self, seed=None):
+        self.rng       = random.Random(seed)
+        self.obstacles = ObstacleManager(self.rng)     # starts a course
+        self._start()
+
+    def reset(self, seed=None):
+        """Start a new run; the same seed gives the same obstacle sequence."""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.obstacles.reset()
+        self._start()
+
+    def _start(self):
+        self.dino      = Dino()
+        self.score     = 0.0
+        self.speed     = SPEED_START
+        self.frame     = 0
+        self.game_over = False
+
+    def step(self, jump=False, duck=False):
+        """Advance one frame with the given inputs (same order as Game.run)."""
+        if self.game_over:
+            return
+
+        if jump:
+            self.dino.jump()
+        self.dino.set_duck(duck)
+
+        self.dino.update()
+        self.obstacles.update(self.speed, self.dino.x)
+        self.frame += 1
+
+        if self.obstacles.check_collision(self.dino.get_rect()):
+            self.dino.kill()
+            self.game_over = True
+            return
+
+        self.score += SCORE_INC
+        self.speed  = min(SPEED_MAX, SPEED_START + self.score * SPEED_INC)
@@ -0,0 +1,177 @@
+"""
+Persistent high scores and run statistics (SQLite).
+
+All database work happens on one writer thread: the game only queues finished
+runs (a non-blocking put) and reads the `summary` dict the thread republishes
+after every batch, so saving never stalls a frame.
+
+    python stats_store.py              # print top runs and per-day stats
+    python stats_store.py --autopilot  # the same for autopilot runs
+"""
+import queue
+import sqlite3
+import threading
+import time
+
+from config import STATS_DB
+from tracing import TRACER
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY,
+    ts            REAL    NOT NULL,          -- unix time at death
+    day           TEXT    NOT NULL,          -- local YYYY-MM-DD
+    score         REAL    NOT NULL,
+    frames        INTEGER NOT NULL,
+    speed         REAL    NOT NULL,          -- speed reached
+    death_kind    TEXT,                      -- "cactus" | "bird"
+    death_variant TEXT,                      -- e.g. "2x60", "low"
+    gesture_jumps INTEGER NOT NULL DEFAULT 0,
+    gesture_ducks INTEGER NOT NULL DEFAULT 0,
+    key_jumps     INTEGER NOT NULL DEFAULT 0,
+    autopilot     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_day   ON runs (day, score);
+"""
+
+COLUMNS = ("ts", "day", "score", "frames", "speed", "death_kind",
+           "death_variant", "gesture_jumps", "gesture_ducks", "key_jumps",
+           "autopilot")
+
+RUN_DEFAULTS = {"death_kind": None, "death_variant": None, "gesture_jumps": 0,
+                "gesture_ducks": 0, "key_jumps": 0, "autopilot": 0}
+
+_STOP = object()
+
+
+# ─────────────────────────────────────────────────────────────
+#  Queries  (take an open connection)
+# ─────────────────────────────────────────────────────────────
+# autopilot=0 keeps the bot's runs (soak tests) out of the player's records;
+# pass 1 to list the bot's instead
+def top_runs(db, n=5, autopilot=0):
+    return db.execute(
+        "SELECT score, day, death_kind, death_variant FROM runs "
+        "WHERE autopilot = ? ORDER BY score DESC LIMIT ?",
+        (autopilot, n)).fetchall()
+
+
+def day_stats(db, days=7, autopilot=0):
+    """(day, runs, best, avg score, total frames), newest day first."""
+    return db.execute(
+        "SELECT day, COUNT(*), MAX(score), AVG(score), SUM(frames) FROM runs "
+        "WHERE autopilot = ? GROUP BY day ORDER BY day DESC LIMIT ?",
+        (autopilot, days)).fetchall()
+
+
+def today_stats(db, autopilot=0):
+    row = db.execute(
+        "SELECT COUNT(*), MAX(score), AVG(score) FROM runs "
+        "WHERE day = ? AND autopilot = ?",
+        (time.strftime("%Y-%m-%d"), autopilot)).fetchone()
+    return row if row[0] else (0, 0.0, 0.0)
+
+
+def connect(path):
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+# ─────────────────────────────────────────────────────────────
+#  Store
+# ─────────────────────────────────────────────────────────────
+class StatsStore:
+    LINGER = 0.25       # s to wait for more runs before committing a batch
+
+    def __init__(self, path=STATS_DB):
+        self.path    = path
+        self.summary = None           # replaced wholesale by the writer thread
+        self.error   = None
+        self._q      = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="stats-writer",
+                                        daemon=True)
+        self._thread.start()
+
+    def record_run(self, **run):
+        """Queue a finished run (keys from COLUMNS; ts/day default to now)."""
+        run = {**RUN_DEFAULTS, **run}
+        run.setdefault("ts",  time.time())
+        run.setdefault("day", time.strftime("%Y-%m-%d",
+                                            time.localtime(run["ts"])))
+        self._q.put(run)
+
+    def close(self, timeout=2.0):
+        self._q.put(_STOP)
+        self._thread.join(timeout)
+
+    # ── writer thread ────────────────────────────────────────
+    def _loop(self):
+        try:
+            db = connect(self.path)
+        except sqlite3.Error as e:
+            self.error = e
+            return
+        self._publish(db)
+
+        stop = False
+        while not stop:
+            batch = [self._q.get()]
+            deadline = time.monotonic() + self.LINGER
+            while True:
+                try:
+                    batch.append(self._q.get(
+                        timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                stop  = True
+                batch = [r for r in batch if r is not _STOP]
+            if not batch:
+                continue
+            rows = [tuple(r[c] for c in COLUMNS) for r in batch]
+            try:
+                with TRACER.span("stats_write"):
+                    with db:
+                        db.executemany(
+                            f"INSERT INTO runs ({', '.join(COLUMNS)}) "
+                            f"VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+                    self._publish(db)
+            except sqlite3.Error as e:
+                self.error = e
+        db.close()
+
+    def _publish(self, db):
+        top = top_runs(db, 5)
+        self.summary = {
+            "hi":    top[0][0] if top else 0.0,
+            "top":   top,
+            "today": today_stats(db),
+            "days":  day_stats(db, 7),
+        }
+
+
+# ─────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Gesture Dino run statistics")
+    ap.add_argument("--db",   default=STATS_DB)
+    ap.add_argument("--top",  type=int, default=10)
+    ap.add_argument("--days", type=int, default=7)
+    ap.add_argument("--autopilot", action="store_true",
+                    help="list the autopilot's runs instead of the player's")
+    args = ap.parse_args()
+    bot = int(args.autopilot)
+
+    db = connect(args.db)
+    print("TOP RUNS")
+    for score, day, kind, variant in top_runs(db, args.top, bot):
+        print(f"  {int(score):05d}  {day}  {kind or '-'} {variant or ''}")
+    print("PER DAY")
+    for day, runs, best, avg, frames in day_stats(db, args.days, bot):
+        print(f"  {day}  runs {runs:4d}  best {int(best):05d}  "
+              f"avg {avg:7.1f}  play {frames / 60 / 60:6.1f} min")
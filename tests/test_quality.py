@@ -0,0 +1,37 @@
+from perf import FRAME_BUDGET_MS
+from quality import QualityGovernor, TIERS
+
+FPS = 60
+
+
+def run(gov, cost, seconds):
+    """Feed `seconds` of frames whose draw time depends on the tier;
+    returns (time, tier) of every change."""
+    changes = []
+    for frame in range(int(seconds * FPS)):
+        now = frame / FPS
+        if gov.observe(now, cost[gov.tier]):
+            changes.append((now, gov.tier))
+    return changes
+
+
+def test_borderline_tier_does_not_ping_pong():
+    # "full" overruns, "medium" has headroom: the load alternates with
+    # every tier change
+    over  = FRAME_BUDGET_MS * (QualityGovernor.OVER + 0.05)
+    under = FRAME_BUDGET_MS * (QualityGovernor.HEADROOM - 0.05)
+    gov   = QualityGovernor("auto")
+    changes = run(gov, [over] + [under] * (len(TIERS) - 1), 30 * 60)
+
+    assert changes[0][1] == 1                       # dropped once overloaded
+    retries = [t for t, tier in changes if tier == 0]
+    gaps    = [b - a for a, b in zip(retries, retries[1:])]
+    assert all(b >= 1.5 * a for a, b in zip(gaps, gaps[1:]))  # backing off
+    # without backoff it would retry every UP_HOLD + 1 s (~300 changes)
+    assert len(retries) <= 8
+
+def test_headroom_still_climbs_back():
+    gov = QualityGovernor("low")
+    gov.auto = True
+    changes = run(gov, [1.0] * len(TIERS), 3 * QualityGovernor.UP_HOLD)
+    assert [tier for _, tier in changes] == [1, 0]
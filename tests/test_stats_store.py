@@ -0,0 +1,29 @@
+from stats_store import StatsStore, connect, day_stats, top_runs
+
+
+def run_store(path, *runs):
+    """Save `runs` through a StatsStore; returns its final summary."""
+    store = StatsStore(path)
+    for run in runs:
+        store.record_run(**run)
+    store.close()                       # flushes the batch, then publishes
+    assert store.error is None
+    return store.summary
+
+
+def test_autopilot_run_does_not_change_player_records(tmp_path):
+    path   = str(tmp_path / "stats.sqlite3")
+    player = dict(score=420.0, frames=3000, speed=9.7)
+    before = run_store(path, player)
+    after  = run_store(path, dict(score=2800.0, frames=20000, speed=19.2,
+                                  autopilot=1))
+
+    assert before["hi"] == 420.0
+    assert after["hi"] == before["hi"]
+    assert after["top"] == before["top"]
+    assert after["today"] == before["today"]
+
+    db = connect(path)
+    assert [r[0] for r in top_runs(db, autopilot=1)] == [2800.0]
+    assert day_stats(db, autopilot=1)[0][1] == 1
+    db.close()
@@ -0,0 +1,106 @@
+"""
+Span tracing into a preallocated ring buffer, exported as Chrome trace JSON
+(open in chrome://tracing or ui.perfetto.dev).
+
+    from tracing import TRACER
+    with TRACER.span("inference"):
+        ...
+
+Recording is lock-free: each span claims a slot from an atomic counter and
+writes name / start / duration / thread into fixed arrays, overwriting the
+oldest spans once the buffer wraps.  The claimed index goes in last, so
+export orders slots by it and never needs a shared high-water mark.
+Disabled spans cost one call.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from array import array
+
+from perf import NULL_SECTION
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "t0")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name   = name
+        self.t0     = 0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.t0, time.perf_counter_ns())
+        return False
+
+
+class Tracer:
+    def __init__(self, capacity=1 << 16, enabled=False):
+        self.enabled   = enabled
+        self.capacity  = capacity
+        self._name     = [None] * capacity
+        self._ts       = array("q", bytes(8 * capacity))
+        self._dur      = array("q", bytes(8 * capacity))
+        self._tid      = array("q", bytes(8 * capacity))
+        self._seq      = array("q", [-1]) * capacity  # claimed index per slot
+        self._counter  = itertools.count()
+        self._threads  = {}           # ident -> thread name
+        self._epoch    = time.perf_counter_ns()
+
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return _Span(self, name)
+
+    def record(self, name, t0_ns, t1_ns):
+        i   = next(self._counter)
+        j   = i % self.capacity
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        self._name[j] = name
+        self._ts[j]   = t0_ns
+        self._dur[j]  = t1_ns - t0_ns
+        self._tid[j]  = tid
+        self._seq[j]  = i
+
+    def clear(self):
+        self._counter = itertools.count()
+        self._seq     = array("q", [-1]) * self.capacity
+
+    # ── export ───────────────────────────────────────────────
+    def events(self):
+        seq   = self._seq.tolist()
+        tids  = {}
+        out   = []
+        for _, j in sorted((i, j) for j, i in enumerate(seq) if i >= 0):
+            tid = tids.setdefault(self._tid[j], len(tids) + 1)
+            out.append({
+                "name": self._name[j], "ph": "X", "pid": 1, "tid": tid,
+                "ts":   (self._ts[j] - self._epoch) / 1e3,
+                "dur":  self._dur[j] / 1e3,
+            })
+        for ident, tid in tids.items():
+            out.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                        "args": {"name": self._threads.get(ident, str(ident))}})
+        return out
+
+    def dump(self, path=None):
+        """Write the buffer as Chrome trace JSON; returns the path."""
+        if path is None:
+            os.makedirs("traces", exist_ok=True)
+            path = os.path.join("traces",
+                                time.strftime("dino-%Y%m%d-%H%M%S.json"))
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events(),
+                       "displayTimeUnit": "ms"}, f)
+        return path
+
+
+# process-wide tracer, shared by the game loop and background threads
+TRACER = Tracer()
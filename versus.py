@@ -0,0 +1,278 @@
+"""
+Two-player split screen — one camera, one Hands inference per frame
+(max_num_hands=2), two independent runs side by side.
+
+    python main.py --players 2
+
+Player 1 is the hand on the left of the (mirrored) camera image, player 2
+the one on the right; gesture_controller.HandTracker keeps each hand with
+its player when they move or cross.  Each lane is a full-size game drawn
+offscreen and scaled into half the window, so every drawing class from
+main.py is reused unchanged.
+"""
+import random
+from functools import partial
+
+import pygame
+
+from config import *
+from autopilot import Autopilot
+from gesture_controller import (EV_BEGIN, GESTURE_DUCK, GESTURE_JUMP,
+                                GestureController, GestureLoader)
+from gesture_service import GestureSubscriber
+from main import (CameraView, Clouds, GameOverScreen, Ground, Mountains,
+                  Particle, ScoreHUD, lerp_color, surf_rounded)
+from simulation import Simulation
+
+LANE_W, LANE_H = WIDTH // 2, HEIGHT // 2
+STRIP_Y        = LANE_H            # camera + player panels below the lanes
+
+
+# ─────────────────────────────────────────────────────────────
+#  LANE  (one player's game)
+# ─────────────────────────────────────────────────────────────
+class Lane:
+    AUTO_RESTART = 90
+
+    def __init__(self, index, keys, autopilot=False):
+        self.index     = index
+        self.name      = f"P{index + 1}"
+        self.keys      = keys                   # (jump key, duck key)
+        self.sim       = Simulation(random.randrange(1 << 30))
+        self.ground    = Ground()
+        self.clouds    = Clouds()
+        self.mountains = Mountains()
+        self.score_hud = ScoreHUD()
+        self.go_screen = GameOverScreen()
+        self.autopilot = Autopilot() if autopilot else None
+        self.surface   = pygame.Surface((WIDTH, HEIGHT))
+        self.font      = pygame.font.SysFont("couriernew", 28, bold=True)
+        self.hi_score  = 0.0
+        self.started   = autopilot
+        self._particles      = []
+        self._on_ground_last = True
+        self._over_frames    = 0
+
+    def press_jump(self):
+        if not self.started:
+            self.started = True
+        elif self.sim.game_over:
+            self.restart()
+        else:
+            self.sim.dino.jump()
+
+    def restart(self):
+        self.sim.reset(random.randrange(1 << 30))
+        self.go_screen.reset()
+        self._particles.clear()
+        self._on_ground_last = True
+        self._over_frames    = 0
+        if self.autopilot:
+            self.autopilot.reset()
+
+    def update(self, duck_now):
+        sim = self.sim
+        if self.autopilot:
+            if sim.game_over:
+                self._over_frames += 1
+                if self._over_frames > self.AUTO_RESTART:
+                    self.restart()
+            else:
+                jump, duck = self.autopilot.act(sim.dino, sim.obstacles,
+                                                sim.speed)
+                if jump:
+                    sim.dino.jump()
+                duck_now = duck
+
+        for p in self._particles:
+            p.update()
+        self._particles = [p for p in self._particles if p.life > 0]
+
+        if not self.started or sim.game_over:
+            return
+        sim.step(duck=duck_now)
+        self.ground.update(sim.speed)
+        self.clouds.update(sim.speed)
+        self.mountains.update(sim.speed)
+        self.score_hud.update(sim.score)
+
+        on_ground = not sim.dino.jumping
+        if on_ground and not self._on_ground_last:
+            for _ in range(10):
+                self._particles.append(
+                    Particle(sim.dino.x + 22, GROUND_Y, (92, 184, 92)))
+        self._on_ground_last = on_ground
+
+        if sim.game_over:
+            self.hi_score = max(self.hi_score, sim.score)
+            for _ in range(20):
+                self._particles.append(
+                    Particle(sim.dino.x + 22, sim.dino.y - 30, (220, 80, 80)))
+
+    def draw(self, t, sky):
+        s   = self.surface
+        sim = self.sim
+        s.blit(sky, (0, 0))
+        pygame.draw.circle(s, t["sun"], (90, 70), 26)
+        self.mountains.draw(s, t)
+        self.clouds.draw(s, t)
+        self.ground.draw(s, t)
+        sim.obstacles.draw(s, t)
+        sim.dino.draw(s, t)
+        for p in self._particles:
+            p.draw(s)
+        self.score_hud.draw(s, t, sim.score, self.hi_score)
+
+        tag = self.font.render(self.name, True, t["score_text"])
+        s.blit(tag, (24, 18))
+        if sim.game_over:
+            self.go_screen.draw(s, t, sim.score, self.hi_score)
+        elif not self.started:
+            msg = self.font.render("JUMP TO START", True, t["go_title"])
+            s.blit(msg, (WIDTH // 2 - msg.get_width() // 2, GROUND_Y // 2))
+        return s
+
+
+# ─────────────────────────────────────────────────────────────
+#  VERSUS GAME
+# ─────────────────────────────────────────────────────────────
+class VersusGame:
+    def __init__(self, autopilot=False, camera=True, predict=False,
+                 service=None, landmark_filter=LANDMARK_FILTER):
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Gesture Dino  🦕🦕")
+        self.clock  = pygame.time.Clock()
+
+        self.gesture = None
+        factory      = (partial(GestureSubscriber, service) if service else
+                        partial(GestureController, "hands",
+                                predictive=predict, players=2,
+                                landmark_filter=landmark_filter))
+        self._loader = GestureLoader(factory) if camera else None
+        self.gesture_status = ("loading gesture engine" if camera
+                               else "keyboard only")
+
+        self.lanes = [Lane(0, (pygame.K_w,  pygame.K_s),    autopilot),
+                      Lane(1, (pygame.K_UP, pygame.K_DOWN), autopilot)]
+        self.theme   = THEMES["light"]
+        self.sky     = self._build_sky(self.theme)
+        self.font    = pygame.font.SysFont("couriernew", 14, bold=True)
+        self.cam_view = CameraView()
+        self.running = True
+        self._ducking = [False] * len(self.lanes)  # per lane, from events
+
+    @staticmethod
+    def _build_sky(t):
+        sky = pygame.Surface((WIDTH, HEIGHT))
+        sky.fill(t["ground_mid"])
+        for y in range(GROUND_Y):
+            pygame.draw.line(sky, lerp_color(t["sky_top"], t["sky_bottom"],
+                                             y / GROUND_Y), (0, y), (WIDTH, y))
+        return sky
+
+    def _adopt_gesture(self):
+        loader, self._loader = self._loader, None
+        ctrl = loader.controller
+        if loader.error is not None:
+            self.gesture_status = "gestures unavailable — keyboard only"
+        elif not ctrl.has_camera:
+            ctrl.close()
+            self.gesture_status = "no camera — keyboard only"
+        elif len(ctrl.players) < 2:
+            ctrl.close()
+            self.gesture_status = "service has one player — keyboard only"
+        else:
+            self.gesture        = ctrl
+            self.gesture_status = "show one hand each"
+
+    # ── input / update ────────────────────────────────────────
+    def _handle_input(self):
+        if self._loader and self._loader.ready:
+            self._adopt_gesture()
+        ducking = [False] * len(self.lanes)
+        if self.gesture:
+            self.gesture.update()
+            ducking = self._gesture_events()
+
+        pressed = set()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.running = False
+                pressed.add(event.key)
+        keys = pygame.key.get_pressed()
+
+        for lane, duck in zip(self.lanes, ducking):
+            jump_key, duck_key = lane.keys
+            if jump_key in pressed or pygame.K_SPACE in pressed:
+                lane.press_jump()
+            lane.update(duck or keys[duck_key])
+
+    def _gesture_events(self):
+        # begin / end events in order, routed to each player's lane; a duck
+        # that began since the last frame ducks for at least this one
+        began = [False] * len(self.lanes)
+        for kind, code, player, _, _ in self.gesture.events.drain():
+            if player >= len(self.lanes):
+                continue
+            if code == GESTURE_JUMP and kind == EV_BEGIN:
+                self.lanes[player].press_jump()
+            elif code == GESTURE_DUCK:
+                self._ducking[player] = kind == EV_BEGIN
+                began[player]        |= self._ducking[player]
+        return [b or d for b, d in zip(began, self._ducking)]
+
+    # ── draw ──────────────────────────────────────────────────
+    def _draw(self):
+        t = self.theme
+        self.screen.fill(t["panel_bg"])
+        for i, lane in enumerate(self.lanes):
+            dest = self.screen.subsurface((i * LANE_W, 0, LANE_W, LANE_H))
+            pygame.transform.smoothscale(lane.draw(t, self.sky),
+                                         (LANE_W, LANE_H), dest)
+        pygame.draw.line(self.screen, t["go_sub"],
+                         (LANE_W, 0), (LANE_W, LANE_H), 2)
+        self._draw_strip(t)
+        pygame.display.flip()
+
+    def _draw_strip(self, t):
+        cx = WIDTH // 2
+        cy = STRIP_Y + (HEIGHT - STRIP_Y) // 2
+        if not (self.gesture and self.cam_view.draw(
+                self.screen, self.gesture,
+                (cx - CAM_W // 2, cy - CAM_H // 2), t["ground_top"])):
+            st = self.font.render(self.gesture_status, True, t["go_sub"])
+            self.screen.blit(st, (cx - st.get_width() // 2, cy))
+
+        hints = ("W jump  S duck", "UP jump  DOWN duck")
+        for i, lane in enumerate(self.lanes):
+            x   = i * LANE_W + LANE_W // 2 + (-1 if i == 0 else 1) * 190
+            sim = lane.sim
+            player = self.gesture.players[i] if self.gesture else None
+            rows = [
+                (lane.name, t["go_title"]),
+                (f"{int(sim.score):05d}", t["score_text"]),
+                (f"HI {int(lane.hi_score):05d}", t["hi_text"]),
+                (player.gesture.upper() if player else hints[i], t["go_sub"]),
+            ]
+            y = cy - 44
+            for text, col in rows:
+                surf = self.font.render(text, True, col)
+                self.screen.blit(surf, (x - surf.get_width() // 2, y))
+                y += 22
+
+    # ── run ───────────────────────────────────────────────────
+    def run(self):
+        while self.running:
+            self._handle_input()
+            self._draw()
+            self.clock.tick(FPS)
+
+        if self._loader:
+            self._loader.close()
+        if self.gesture:
+            self.gesture.close()
+        pygame.quit()